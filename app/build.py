@@ -1,27 +1,39 @@
+import argparse
 import os
 import platform
 import subprocess
 import sys
 
-def build_executable():
+# Módulos que o modo interativo nunca importa: fora do build de quiosque o pacote fica
+# menor, e o --onefile tem menos para extrair a cada inicialização. Sem Pillow o
+# subcomando "render" avisa que não está disponível e cenas com obstáculos de máscara
+# (imagens) não carregam; sem pkg_resources o pygame usa o fallback dele para achar
+# os próprios arquivos.
+KIOSK_EXCLUDES = ["PIL", "pkg_resources", "watchdog", "tkinter"]
+
+def build_executable(onedir: bool = False, kiosk: bool = False):
     # Get the current platform
     current_platform = platform.system().lower()
     
-    # Define the entry point
-    entry_point = "src/pygame/main.py"
+    # Define the entry point (CLI com os subcomandos interactive/headless/benchmark/render)
+    entry_point = "run.py"
     
     # Common PyInstaller options
     common_options = [
         "--name=particle_simulation",
-        "--onefile",  # Create a single executable
+        # --onedir evita extrair o pacote inteiro para um diretório temporário a cada execução
+        "--onedir" if onedir else "--onefile",
         "--noconsole",  # Don't show console window
         "--clean",  # Clean PyInstaller cache
         f"--add-data=src:src",  # Include source files
         "--hidden-import=pydantic",  # Explicitly include pydantic
         "--hidden-import=pygame",  # Explicitly include pygame
         "--hidden-import=numpy",  # Explicitly include numpy
-        "--hidden-import=PIL",  # Explicitly include Pillow
     ]
+    if kiosk:
+        common_options += [f"--exclude-module={module}" for module in KIOSK_EXCLUDES]
+    else:
+        common_options.append("--hidden-import=PIL")  # Explicitly include Pillow (render offline)
     
     # Platform specific options
     if current_platform == "windows":
@@ -45,4 +57,12 @@ def build_executable():
     print(f"Executable can be found in the 'dist' directory")
 
 if __name__ == "__main__":
-    build_executable() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Gera o executável com PyInstaller")
+    parser.add_argument("--onedir", action="store_true", help="pasta em vez de arquivo único (inicia mais rápido)")
+    parser.add_argument(
+        "--kiosk",
+        action="store_true",
+        help="só o modo interativo, sem Pillow: sem o subcomando render e sem cenas com obstáculos de máscara (kind \"mask\")",
+    )
+    args = parser.parse_args()
+    build_executable(onedir=args.onedir, kiosk=args.kiosk)
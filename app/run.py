@@ -1,8 +1,15 @@
-from src.pygame.main import main
+import sys
+
+from src.startup import StartupTimer
+
+# Marca o início o quanto antes: o relatório de inicialização conta a partir daqui
+startup = StartupTimer()
+
+from src.cli import main
 
 
 def run():
-    main()
+    sys.exit(main(startup=startup))
 
 
 if __name__ == "__main__":
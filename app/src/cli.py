@@ -0,0 +1,123 @@
+import argparse
+import os
+import sys
+from typing import Optional
+
+from src.startup import StartupTimer
+
+# A mensagem de boas-vindas do pygame iria para o stdout junto com o JSON do modo headless
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Cada modo importa os próprios módulos só quando é escolhido: o modo interativo não
+# carrega Pillow, e nada além de argparse é importado antes de saber o que rodar
+COMMANDS = ("interactive", "headless", "benchmark", "render", "parity", "nbody")
+DEFAULT_HEADLESS_FRAMES = 600
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="particle_simulation", description="Simulador de partículas")
+    commands = parser.add_subparsers(dest="command", metavar="{" + ",".join(COMMANDS) + "}")
+
+    interactive = commands.add_parser("interactive", help="abre a janela da simulação (padrão)")
+    headless = commands.add_parser("headless", help="roda a simulação sem janela e imprime as medições em JSON")
+    for subparser in (interactive, headless):
+        subparser.add_argument("--scene", default=None, help="cena em JSON com vários emissores")
+        subparser.add_argument("--workers", type=int, default=None, help="threads da simulação")
+        subparser.add_argument("--backend", default=None, help='backend da física ("vectorized" ou "reference")')
+        subparser.add_argument("--integrator", default=None, help='integrador ("euler", "verlet" ou "rk4")')
+        subparser.add_argument("--integrator-substeps", type=int, default=None, help="máximo de subpassos adaptativos (1 desliga)")
+        subparser.add_argument("--record", default=None, help="grava o estado de cada frame neste arquivo")
+        subparser.add_argument("--replay", default=None, help="reproduz uma gravação")
+        subparser.add_argument("--trace", default=None, help="exporta o trace de desempenho (.json ou .csv)")
+        subparser.add_argument("--pipelined", action="store_true", help="simula o próximo frame enquanto renderiza o atual")
+        subparser.add_argument("--no-governor", action="store_true", help="desliga o governador de qualidade")
+        subparser.add_argument("--pin", default=None, help='ajustes de qualidade fixados, ex.: "bloom=0,trails=2"')
+        subparser.add_argument("--startup-report", action="store_true", help="mostra o tempo até o primeiro frame")
+    headless.add_argument("--frames", type=int, default=DEFAULT_HEADLESS_FRAMES)
+    headless.add_argument("--seed", type=int, default=0, help="semente dos emissores (a mesma semente repete a execução)")
+
+    # Os argumentos desses modos são repassados para o próprio parser de cada um
+    commands.add_parser("benchmark", add_help=False, help="benchmark headless (ver src/pygame/benchmark.py)")
+    commands.add_parser("render", add_help=False, help="renderização offline em PNGs (ver src/pygame/offline.py)")
+    commands.add_parser("parity", add_help=False, help="compara dois backends da física (ver src/particle_system/parity.py)")
+    commands.add_parser(
+        "nbody",
+        add_help=False,
+        help="Barnes–Hut contra soma direta (ver src/particle_system/nbody_benchmark.py); a gravidade mútua é só para uso "
+             "offline: rode a cena com headless --record e veja com --replay",
+    )
+    return parser
+
+
+def run_simulation(args: argparse.Namespace, startup: StartupTimer, headless: bool):
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    from src.pygame import main as simulation
+
+    options = {
+        "scene_file": args.scene,
+        "workers": args.workers,
+        "backend": args.backend,
+        "integrator": args.integrator,
+        "integrator_substeps": args.integrator_substeps,
+        "record_file": args.record,
+        "replay_file": args.replay,
+        "profile_trace_file": args.trace,
+        "quality_pins": args.pin,
+    }
+    # Só sobrepõe as variáveis de ambiente com o que veio na linha de comando
+    options = {name: value for name, value in options.items() if value is not None}
+    if args.pipelined:
+        options["pipelined"] = True
+    if args.no_governor:
+        options["quality_governor"] = False
+    if headless:
+        options.update(max_frames=args.frames, frame_rate=0, headless=True, seed=args.seed)
+    return simulation.main(startup=startup, **options)
+
+
+def main(argv: Optional[list[str]] = None, startup: Optional[StartupTimer] = None) -> int:
+    startup = startup or StartupTimer()
+    parser = build_parser()
+    args, extra = parser.parse_known_args(sys.argv[1:] if argv is None else argv)
+    command = args.command or "interactive"
+
+    if command == "benchmark":
+        from src.pygame.benchmark import main as benchmark
+
+        benchmark(extra)
+        return 0
+    if command == "render":
+        try:
+            from src.pygame.offline import main as render
+        except ImportError as error:
+            parser.error(f"renderização offline indisponível neste build ({error.name} não foi incluído)")
+        render(extra)
+        return 0
+    if command == "parity":
+        from src.particle_system.parity import main as parity
+
+        return parity(extra)
+    if command == "nbody":
+        from src.particle_system.nbody_benchmark import main as nbody_benchmark
+
+        return nbody_benchmark(extra)
+
+    if extra:
+        parser.error(f"argumentos não reconhecidos: {' '.join(extra)}")
+    if command == "interactive" and args.command is None:
+        # Sem subcomando (ex.: duplo clique no executável): opções padrão do modo interativo
+        args = parser.parse_args(["interactive"])
+
+    profiler = run_simulation(args, startup, headless=command == "headless")
+    if args.startup_report:
+        print(startup.format(), file=sys.stderr)
+    if command == "headless":
+        import json
+
+        print(json.dumps({"startup": startup.report(), **profiler.summary()}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
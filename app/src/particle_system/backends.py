@@ -0,0 +1,278 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.integrators import Integrator, SemiImplicitEuler, substep_level
+from src.particle_system.nbody import direct_accelerations
+from src.particle_system.parallel import MIN_SHARD_SIZE, ShardedStepper
+from src.particle_system.store import ParticleStore
+
+
+DEFAULT_BACKEND = "vectorized"
+
+
+def reference_acceleration(
+    x: float,
+    y: float,
+    vx: float,
+    vy: float,
+    attractors: Iterable[Attractor] = (),
+    wind: tuple[float, float] = (0.0, 0.0),
+    drag: float = 0.0,
+) -> tuple[float, float]:
+    # Mesma conta de ForceEngine.accelerations para uma partícula, em Python puro
+    ax = wind[0] - vx * drag
+    ay = wind[1] - vy * drag
+    for attractor in attractors:
+        dx = attractor.position[0] - x
+        dy = attractor.position[1] - y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance == 0 or (attractor.radius is not None and distance > attractor.radius):  # Evitar divisão por zero
+            continue
+        magnitude = attractor.strength
+        if attractor.falloff:
+            magnitude *= (attractor.softening / max(distance, attractor.softening)) ** attractor.falloff
+        ax += magnitude * dx / distance
+        ay += magnitude * dy / distance
+    return ax, ay
+
+
+def reference_step(method: str, x, y, vx, vy, acceleration, h, accelerations):
+    # Um subpasso de Integrator.step para uma partícula, em Python puro; `accelerations(x, y, vx, vy)`
+    # dá a aceleração total. Retorna (x, y, vx, vy, aceleração no fim ou None)
+    ax, ay = acceleration
+    if method == "euler":
+        vx, vy = vx + ax * h, vy + ay * h
+        return x + vx * h, y + vy * h, vx, vy, None
+    if method == "verlet":
+        vx, vy = vx + ax * h / 2, vy + ay * h / 2
+        x, y = x + vx * h, y + vy * h
+        ax, ay = accelerations(x, y, vx, vy)
+        return x, y, vx + ax * h / 2, vy + ay * h / 2, (ax, ay)
+    if method == "rk4":
+        vx2, vy2 = vx + ax * h / 2, vy + ay * h / 2
+        ax2, ay2 = accelerations(x + vx * h / 2, y + vy * h / 2, vx2, vy2)
+        vx3, vy3 = vx + ax2 * h / 2, vy + ay2 * h / 2
+        ax3, ay3 = accelerations(x + vx2 * h / 2, y + vy2 * h / 2, vx3, vy3)
+        vx4, vy4 = vx + ax3 * h, vy + ay3 * h
+        ax4, ay4 = accelerations(x + vx3 * h, y + vy3 * h, vx4, vy4)
+        return (
+            x + (vx + 2 * vx2 + 2 * vx3 + vx4) * h / 6,
+            y + (vy + 2 * vy2 + 2 * vy3 + vy4) * h / 6,
+            vx + (ax + 2 * ax2 + 2 * ax3 + ax4) * h / 6,
+            vy + (ay + 2 * ay2 + 2 * ay3 + ay4) * h / 6,
+            None,
+        )
+    raise ValueError(f"integrador desconhecido: {method!r}")
+
+
+def reference_integrate(x, y, vx, vy, dt, accelerations, integrator: Optional[Integrator] = None):
+    # Passo completo de uma partícula com os subpassos escolhidos como em Integrator.integrate
+    integrator = integrator or SemiImplicitEuler(max_substeps=1)
+    acceleration = accelerations(x, y, vx, vy)
+    substeps = 1 << substep_level(*acceleration, dt, integrator.max_substeps, integrator.tolerance)
+    h = dt / substeps
+    for _ in range(substeps):
+        if acceleration is None:
+            acceleration = accelerations(x, y, vx, vy)
+        x, y, vx, vy, acceleration = reference_step(integrator.name, x, y, vx, vy, acceleration, h, accelerations)
+    return x, y, vx, vy
+
+
+class SimulationBackend(ABC):
+    """Interface do passo de simulação sobre um ParticleStore.
+
+    ``spawn`` escreve uma rajada de um BurstEmitter, ``cull`` envelhece e remove as
+    partículas expiradas ou fora do raio, ``forces`` calcula a aceleração externa e
+    ``step`` junta cull, forças e integração. Backends diferentes devem produzir o
+    mesmo estado (ver ``src.particle_system.parity``).
+    """
+
+    name = ""
+
+    @abstractmethod
+    def spawn(
+        self,
+        store: ParticleStore,
+        emitter,
+        count: int,
+        position: tuple[float, float],
+        speed: float,
+        palette: Sequence[tuple[int, int, int]],
+        index: int = 0,
+    ) -> slice:
+        ...
+
+    @abstractmethod
+    def cull(
+        self,
+        store: ParticleStore,
+        dt: float,
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+    ) -> int:
+        ...
+
+    @abstractmethod
+    def forces(
+        self,
+        store: ParticleStore,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+    ) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def step(
+        self,
+        store: ParticleStore,
+        dt: float,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+        integrator: Optional[Integrator] = None,
+    ) -> int:
+        ...
+
+    def close(self):
+        pass
+
+
+class ReferenceBackend(SimulationBackend):
+    """Backend de referência: uma partícula por vez, em Python puro.
+
+    É lento de propósito; serve para conferir backends otimizados e como
+    documentação executável da física (a mesma de ``Particle.update``).
+    """
+
+    name = "reference"
+
+    def spawn(self, store, emitter, count, position, speed, palette, index=0) -> slice:
+        start = store.count
+        if count <= 0:
+            return slice(start, start)
+        # Mesmos sorteios, na mesma ordem, que BurstEmitter.emit
+        draws = emitter.rng.random((5, count), dtype=np.float32).tolist()
+        low_size, high_size = emitter.size_range
+        low_life, high_life = emitter.lifespan_range
+        for angle_t, speed_t, size_t, lifespan_t, color_t in zip(*draws):
+            angle = angle_t * 2 * math.pi
+            magnitude = speed * (0.5 + 0.5 * speed_t)
+            i = store.append(
+                position=position,
+                velocity=(math.cos(angle) * magnitude, math.sin(angle) * magnitude),
+                acceleration=emitter.acceleration,
+                rotation=0.0,
+                size=low_size + (high_size - low_size) * size_t,
+                color=palette[min(int(color_t * len(palette)), len(palette) - 1)],
+                lifespan=low_life + (high_life - low_life) * lifespan_t,
+            )
+            store.emitter[i] = index
+        return slice(start, store.count)
+
+    def cull(self, store, dt, center=None, radius=None) -> int:
+        # `center`/`radius` também podem ter um valor por emissor, como em ParticleStore.expire
+        per_emitter = radius is not None and np.ndim(radius) > 0
+        keep = np.ones(store.count, dtype=bool)
+        for i in range(store.count):
+            if center is not None and radius is not None:
+                cx, cy = center[store.emitter[i]] if per_emitter else center
+                limit = float(radius[store.emitter[i]] if per_emitter else radius)
+                x, y = store.position[i].tolist()
+                if (x - cx) ** 2 + (y - cy) ** 2 > limit * limit:
+                    keep[i] = False
+            store.age[i] += dt
+            if store.age[i] >= store.lifespan[i]:
+                keep[i] = False
+        return store.compact(keep)
+
+    def forces(self, store, forces=None, attractors=()) -> np.ndarray:
+        attractors = list(forces.attractors if forces is not None else []) + list(attractors)
+        wind = forces.wind if forces is not None else (0.0, 0.0)
+        drag = forces.drag if forces is not None else 0.0
+        acceleration = np.zeros((store.count, 2), dtype=np.float32)
+        for i in range(store.count):
+            x, y = store.position[i].tolist()
+            vx, vy = store.velocity[i].tolist()
+            acceleration[i] = reference_acceleration(x, y, vx, vy, attractors, wind, drag)
+        if forces is not None and forces.nbody is not None:
+            # Gravidade mútua exata (soma direta), a referência da aproximação de Barnes–Hut
+            nbody = forces.nbody
+            acceleration += direct_accelerations(store.position[:store.count], None, nbody.strength, nbody.softening)
+        return acceleration
+
+    def step(self, store, dt, forces=None, attractors=(), center=None, radius=None, integrator=None) -> int:
+        removed = self.cull(store, dt, center, radius)
+        attractors = list(forces.attractors if forces is not None else []) + list(attractors)
+        wind = forces.wind if forces is not None else (0.0, 0.0)
+        drag = forces.drag if forces is not None else 0.0
+        # A gravidade mútua fica fixa durante o passo, como no backend vetorizado
+        mutual = None
+        if forces is not None and forces.nbody is not None:
+            nbody = forces.nbody
+            mutual = direct_accelerations(store.position[:store.count], None, nbody.strength, nbody.softening).tolist()
+        store.append_trail()
+        store.previous_position[:store.count] = store.position[:store.count]
+        for i in range(store.count):
+            x, y = store.position[i].tolist()
+            vx, vy = store.velocity[i].tolist()
+            gx, gy = store.acceleration[i].tolist()
+            if mutual is not None:
+                gx, gy = gx + mutual[i][0], gy + mutual[i][1]
+
+            def accelerations(x, y, vx, vy, gx=gx, gy=gy):
+                fx, fy = reference_acceleration(x, y, vx, vy, attractors, wind, drag)
+                return gx + fx, gy + fy
+
+            x, y, vx, vy = reference_integrate(x, y, vx, vy, dt, accelerations, integrator)
+            store.velocity[i] = (vx, vy)
+            store.position[i] = (x, y)
+        return removed
+
+
+class VectorizedBackend(SimulationBackend):
+    """Backend padrão: operações de array sobre as colunas do ParticleStore.
+
+    Com ``workers`` > 1 o passo é dividido entre threads (ver ShardedStepper).
+    """
+
+    name = "vectorized"
+
+    def __init__(self, workers: int = 1, min_shard_size: int = MIN_SHARD_SIZE):
+        self.stepper = ShardedStepper(workers, min_shard_size) if workers > 1 else None
+
+    def spawn(self, store, emitter, count, position, speed, palette, index=0) -> slice:
+        return emitter.emit(store, count, position, speed, palette, index)
+
+    def cull(self, store, dt, center=None, radius=None) -> int:
+        return store.compact(store.expire(dt, center, radius))
+
+    def forces(self, store, forces=None, attractors=()) -> np.ndarray:
+        n = store.count
+        forces = forces or ForceEngine()
+        return forces.accelerations(store.position[:n], store.velocity[:n], attractors)
+
+    def step(self, store, dt, forces=None, attractors=(), center=None, radius=None, integrator=None) -> int:
+        if self.stepper is not None:
+            return self.stepper.step(store, dt, forces, attractors, center, radius, integrator)
+        return store.step(dt, forces, attractors, center, radius, integrator)
+
+    def close(self):
+        if self.stepper is not None:
+            self.stepper.close()
+
+
+BACKENDS = {backend.name: backend for backend in (ReferenceBackend, VectorizedBackend)}
+
+
+def create_backend(name: str = DEFAULT_BACKEND, workers: int = 1, min_shard_size: int = MIN_SHARD_SIZE) -> SimulationBackend:
+    # Backend escolhido pelo nome (ex.: variável de ambiente PARTICLE_BACKEND)
+    if name not in BACKENDS:
+        raise ValueError(f"backend desconhecido: {name!r} (opções: {', '.join(BACKENDS)})")
+    if name == VectorizedBackend.name:
+        return VectorizedBackend(workers, min_shard_size)
+    return BACKENDS[name]()
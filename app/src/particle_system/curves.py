@@ -0,0 +1,81 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.particle_system.scene import LifetimeCurves
+from src.particle_system.store import ParticleStore
+
+
+DEFAULT_RESOLUTION = 64  # Amostras por curva (a idade é arredondada para a amostra mais próxima)
+
+
+def bake_curve(points: Optional[Sequence[tuple]], resolution: int, default) -> np.ndarray:
+    # Amostra a curva em `resolution` idades igualmente espaçadas: (resolution, canais)
+    default = np.atleast_1d(np.asarray(default, dtype=np.float32))
+    if not points:
+        return np.repeat(default[None, :], resolution, axis=0)
+    points = sorted(points, key=lambda point: point[0])
+    ages = np.array([age for age, _ in points], dtype=np.float32)
+    values = np.array([np.atleast_1d(value) for _, value in points], dtype=np.float32)
+    samples = np.linspace(0, 1, resolution, dtype=np.float32)
+    return np.stack([np.interp(samples, ages, values[:, c]) for c in range(values.shape[1])], axis=1).astype(np.float32)
+
+
+class LifetimeTables:
+    """Curvas de vida de todos os emissores assadas em tabelas (emissor x idade).
+
+    ``update`` só refaz as tabelas quando as curvas mudam. ``sample`` calcula um
+    índice por partícula (emissor e idade normalizada) e lê as três tabelas com
+    ele, sem nenhum laço em Python.
+    """
+
+    def __init__(self, resolution: int = DEFAULT_RESOLUTION):
+        self.resolution = max(int(resolution), 2)
+        self.curves: list[Optional[LifetimeCurves]] = []
+        self.color = self.alpha = self.size = None  # (emissores * resolução, canais) ou None sem a curva
+
+    @property
+    def active(self) -> bool:
+        return any(table is not None for table in (self.color, self.alpha, self.size))
+
+    def update(self, curves: Sequence[Optional[LifetimeCurves]]) -> bool:
+        # `curves[i]` são as curvas do emissor de índice i; retorna True quando as tabelas mudaram
+        curves = list(curves)
+        if curves == self.curves:
+            return False
+        self.curves = curves
+        self.color = self._bake(curves, "color", (255, 255, 255), 1 / 255)
+        self.alpha = self._bake(curves, "alpha", 1.0)
+        self.size = self._bake(curves, "size", 1.0)
+        return True
+
+    def _bake(self, curves, name: str, default, scale: float = 1.0) -> Optional[np.ndarray]:
+        points = [getattr(curve, name) if curve is not None else None for curve in curves]
+        if not any(points):
+            return None
+        tables = [bake_curve(curve_points, self.resolution, default) * np.float32(scale) for curve_points in points]
+        return np.concatenate(tables)
+
+    def indices(self, store: ParticleStore) -> np.ndarray:
+        # Linha de cada partícula nas tabelas: emissor * resolução + idade normalizada
+        n = store.count
+        last = self.resolution - 1
+        age = store.age[:n] / np.maximum(store.lifespan[:n], np.float32(1e-6))
+        index = (np.clip(age, 0, 1) * np.float32(last) + np.float32(0.5)).astype(np.intp)
+        emitter = np.minimum(store.emitter[:n], len(self.curves) - 1)
+        return emitter * self.resolution + index
+
+    def sample(self, store: ParticleStore) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Cor (uint8), alpha e tamanho de cada partícula na idade atual
+        n = store.count
+        colors, alphas, sizes = store.color[:n], store.alpha[:n], store.size[:n]
+        if not self.active or n == 0:
+            return colors, alphas, sizes
+        index = self.indices(store)
+        if self.color is not None:
+            colors = (colors * self.color[index]).astype(np.uint8)
+        if self.alpha is not None:
+            alphas = alphas * self.alpha[index, 0]
+        if self.size is not None:
+            sizes = sizes * self.size[index, 0]
+        return colors, alphas, sizes
@@ -0,0 +1,74 @@
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.particle_system.store import ParticleStore
+
+
+GRAVITY = (0.0, 98.1)
+WHITE = ((255, 255, 255),)
+
+
+class BurstEmitter:
+    """Emite partículas a uma taxa contínua (partículas por segundo).
+
+    A fração de partícula que sobra em cada frame é acumulada para o próximo, então
+    taxas acima do FPS funcionam sem arredondar para uma rajada por frame. Todos os
+    atributos aleatórios de uma rajada saem de uma única chamada ao gerador NumPy e
+    são escritos direto nas colunas do ParticleStore.
+    """
+
+    def __init__(
+        self,
+        rate: float = 60.0,
+        size_range: tuple[float, float] = (2.0, 4.0),
+        lifespan_range: tuple[float, float] = (2.0, 4.0),
+        acceleration: tuple[float, float] = GRAVITY,
+        seed: Optional[int] = None,
+    ):
+        self.rate = rate
+        self.size_range = size_range
+        self.lifespan_range = lifespan_range
+        self.acceleration = acceleration
+        self.remainder = 0.0
+        self.rng = np.random.default_rng(seed)
+
+    def pending(self, dt: float) -> int:
+        # Quantas partículas inteiras a taxa libera neste frame; a fração fica para o próximo
+        self.remainder += max(self.rate, 0.0) * dt
+        count = math.floor(self.remainder)
+        self.remainder -= count
+        return count
+
+    def emit(
+        self,
+        store: ParticleStore,
+        count: int,
+        position: tuple[float, float],
+        speed: float,
+        palette: Sequence[tuple[int, int, int]] = WHITE,
+        emitter: int = 0,
+    ) -> slice:
+        if count <= 0:
+            return slice(store.count, store.count)
+
+        # Uma chamada ao RNG: ângulo, velocidade, tamanho, tempo de vida e cor de cada partícula
+        angle, speed_t, size_t, lifespan_t, color_t = self.rng.random((5, count), dtype=np.float32)
+        angle *= np.float32(2 * math.pi)
+
+        rows = store.extend(count)
+        store.position[rows] = position
+        store.previous_position[rows] = position
+        velocity = store.velocity[rows]
+        magnitude = speed * (0.5 + 0.5 * speed_t)
+        velocity[:, 0] = np.cos(angle) * magnitude
+        velocity[:, 1] = np.sin(angle) * magnitude
+        store.acceleration[rows] = self.acceleration
+        store.size[rows] = self.size_range[0] + (self.size_range[1] - self.size_range[0]) * size_t
+        store.lifespan[rows] = self.lifespan_range[0] + (self.lifespan_range[1] - self.lifespan_range[0]) * lifespan_t
+        store.alpha[rows] = 255.0
+        store.emitter[rows] = emitter
+        palette = np.asarray(palette, dtype=np.uint8)
+        store.color[rows] = palette[np.minimum((color_t * len(palette)).astype(np.intp), len(palette) - 1)]
+        return rows
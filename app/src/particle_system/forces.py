@@ -0,0 +1,88 @@
+from typing import Iterable, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.particle_system.nbody import BarnesHut
+
+
+class Attractor(BaseModel):
+    position: tuple[float, float]
+    strength: float = 500.0  # > 0 atrai, < 0 repele
+    falloff: float = 0.0  # expoente de queda com a distância (0 = intensidade constante)
+    radius: Optional[float] = None  # alcance (None = sem limite); fora dele a força é zero
+    softening: float = 10.0  # distância abaixo da qual a força para de crescer
+
+
+class ForceEngine:
+    """Soma as forças externas (atratores, repulsores, vento e arrasto) de todas as partículas.
+
+    Os atratores são avaliados juntos como uma matriz (partículas x atratores);
+    o resultado é uma aceleração somada à gravidade de cada partícula. Com
+    ``nbody`` as partículas também se atraem entre si (ver BarnesHut); essa força
+    depende de todas as partículas, então ``positions`` precisa ser o pool inteiro.
+    """
+
+    def __init__(
+        self,
+        attractors: Optional[list[Attractor]] = None,
+        wind: tuple[float, float] = (0.0, 0.0),
+        drag: float = 0.0,
+        nbody: Optional[BarnesHut] = None,
+    ):
+        self.attractors: list[Attractor] = list(attractors or [])
+        self.wind = wind
+        self.drag = drag
+        self.nbody = nbody
+
+    def add(self, attractor: Attractor) -> Attractor:
+        self.attractors.append(attractor)
+        return attractor
+
+    def remove(self, attractor: Attractor):
+        self.attractors.remove(attractor)
+
+    def is_active(self, extra: Iterable[Attractor] = ()) -> bool:
+        return bool(self.attractors or list(extra) or self.drag or any(self.wind) or self.nbody)
+
+    def accelerations(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        extra: Iterable[Attractor] = (),
+        mutual: bool = True,
+    ) -> np.ndarray:
+        # `extra` são atratores temporários do frame (ex.: o ímã do mouse e toques na tela);
+        # `mutual=False` deixa de fora a gravidade mútua (quando já foi calculada para o passo)
+        attractors = self.attractors + list(extra)
+        acceleration = np.empty_like(positions)
+        acceleration[:] = self.wind
+        if self.drag:
+            acceleration -= velocities * np.float32(self.drag)
+        if mutual and self.nbody is not None:
+            acceleration += self.nbody.accelerations(positions)
+        if not attractors or len(positions) == 0:
+            return acceleration
+
+        dtype = positions.dtype
+        centers = np.array([a.position for a in attractors], dtype=dtype)
+        strength = np.array([a.strength for a in attractors], dtype=dtype)
+        falloff = np.array([a.falloff for a in attractors], dtype=dtype)
+        reach = np.array([np.inf if a.radius is None else a.radius for a in attractors], dtype=dtype)
+        softening = np.array([a.softening for a in attractors], dtype=dtype)
+
+        # (N, M): componentes da direção de cada partícula para cada atrator
+        dx = centers[:, 0] - positions[:, 0, None]
+        dy = centers[:, 1] - positions[:, 1, None]
+        distance = np.sqrt(dx * dx + dy * dy)
+        magnitude = np.repeat(strength[None, :], len(positions), axis=0)
+        decaying = falloff != 0
+        if decaying.any():
+            # Queda só nas colunas com falloff, saturando abaixo do softening
+            ratio = softening[decaying] / np.maximum(distance[:, decaying], softening[decaying])
+            magnitude[:, decaying] *= ratio ** falloff[decaying]
+        magnitude[(distance > reach) | (distance == 0)] = 0  # Evitar divisão por zero
+        np.divide(magnitude, distance, out=magnitude, where=distance > 0)
+        acceleration[:, 0] += np.einsum("nm,nm->n", magnitude, dx)
+        acceleration[:, 1] += np.einsum("nm,nm->n", magnitude, dy)
+        return acceleration
@@ -0,0 +1,172 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+import numpy as np
+
+
+DEFAULT_INTEGRATOR = "euler"
+DEFAULT_MAX_SUBSTEPS = 8  # Potência de 2; 1 desliga os subpassos
+DEFAULT_TOLERANCE = 0.05  # Deslocamento (px) que a aceleração pode causar num subpasso: ½|a|h² <= tolerância
+
+# accelerations(position, velocity, index) -> aceleração total das linhas `index` (None = todas)
+AccelerationFunction = Callable[[np.ndarray, np.ndarray, Optional[np.ndarray]], np.ndarray]
+
+
+class Integrator(ABC):
+    """Avança posição e velocidade de um bloco de partículas por ``dt``.
+
+    ``integrate`` escolhe por partícula quantos subpassos usar a partir da
+    aceleração no início do passo: ½|a|h² não pode passar de ``tolerance``. As
+    contagens são arredondadas para potências de 2 (até ``max_substeps``), e cada
+    grupo é integrado junto, então só as partículas sob forças fortes (ex.: perto
+    do ímã) pagam os subpassos. O integrador não guarda estado entre chamadas, então
+    as fatias do ShardedStepper podem usar o mesmo objeto.
+    """
+
+    name = ""
+    evaluations = 1  # Avaliações de força por subpasso
+
+    def __init__(self, max_substeps: int = DEFAULT_MAX_SUBSTEPS, tolerance: float = DEFAULT_TOLERANCE):
+        self.max_level = max(int(max_substeps), 1).bit_length() - 1  # log2 do maior número de subpassos
+        self.tolerance = tolerance
+
+    @property
+    def max_substeps(self) -> int:
+        return 1 << self.max_level
+
+    def levels(self, acceleration: np.ndarray, dt: float) -> Optional[np.ndarray]:
+        # log2 dos subpassos de cada partícula, ou None quando nenhuma precisa subdividir
+        if self.max_level == 0 or len(acceleration) == 0:
+            return None
+        magnitude = np.sqrt(np.einsum("ij,ij->i", acceleration, acceleration))
+        limit = 2 * self.tolerance / (dt * dt)  # |a| acima disso não cabe num passo só
+        if magnitude.max() <= limit:
+            return None
+        needed = np.ceil(np.log2(np.maximum(magnitude / limit, 1)) / 2)  # ½|a|(dt/2^k)² <= tol
+        return np.minimum(needed, self.max_level).astype(np.int8)
+
+    def integrate(
+        self,
+        position: np.ndarray,
+        velocity: np.ndarray,
+        acceleration: np.ndarray,
+        dt: float,
+        accelerations: AccelerationFunction,
+    ) -> int:
+        # `acceleration` é a aceleração total no início do passo; position e velocity mudam no lugar.
+        # Retorna o total de subpassos de partícula (o número de partículas se ninguém subdividiu)
+        levels = self.levels(acceleration, dt)
+
+        def every(position, velocity):
+            return accelerations(position, velocity, None)
+
+        if levels is None:
+            self.advance(position, velocity, acceleration, dt, 1, every)
+            return len(position)
+        # O bloco inteiro avança num passo só, no lugar (sem copiar a maioria, que não subdivide);
+        # as partículas com subpassos refazem o passo a partir do estado guardado
+        stiff = np.flatnonzero(levels)
+        levels = levels[stiff]
+        start = position[stiff], velocity[stiff], acceleration[stiff]
+        self.advance(position, velocity, acceleration, dt, 1, every)
+        substeps = len(position) - len(stiff)
+        for level in np.unique(levels).tolist():
+            group = levels == level
+            index = stiff[group]
+            group_position, group_velocity, group_acceleration = (values[group] for values in start)
+            self.advance(
+                group_position, group_velocity, group_acceleration, dt, 1 << level,
+                lambda p, v, index=index: accelerations(p, v, index),
+            )
+            position[index] = group_position
+            velocity[index] = group_velocity
+            substeps += len(index) << level
+        return substeps
+
+    def advance(self, position, velocity, acceleration, dt: float, substeps: int, accelerations):
+        h = np.float32(dt / substeps)
+        for _ in range(substeps):
+            if acceleration is None:
+                acceleration = accelerations(position, velocity)
+            acceleration = self.step(position, velocity, acceleration, h, accelerations)
+
+    @abstractmethod
+    def step(self, position, velocity, acceleration, h, accelerations) -> Optional[np.ndarray]:
+        # Um subpasso no lugar; retorna a aceleração no fim dele quando já foi calculada
+        ...
+
+
+class SemiImplicitEuler(Integrator):
+    """Euler semi-implícito (simplético): velocidade primeiro, depois a posição com a velocidade nova."""
+
+    name = "euler"
+
+    def step(self, position, velocity, acceleration, h, accelerations):
+        velocity += acceleration * h
+        position += velocity * h
+        return None
+
+
+class VelocityVerlet(Integrator):
+    """Velocity Verlet (meio impulso, deslocamento, meio impulso).
+
+    A aceleração do fim de um subpasso é a do começo do seguinte, então custa uma
+    avaliação de força por subpasso, como o Euler, com erro de segunda ordem. Com
+    arrasto a força do fim usa a velocidade do meio do subpasso.
+    """
+
+    name = "verlet"
+
+    def step(self, position, velocity, acceleration, h, accelerations):
+        half = h * np.float32(0.5)
+        velocity += acceleration * half
+        position += velocity * h
+        acceleration = accelerations(position, velocity)
+        velocity += acceleration * half
+        return acceleration
+
+
+class RungeKutta4(Integrator):
+    """Runge–Kutta clássico de quarta ordem: quatro avaliações de força por subpasso."""
+
+    name = "rk4"
+    evaluations = 4
+
+    def step(self, position, velocity, acceleration, h, accelerations):
+        half = h * np.float32(0.5)
+        x0, v0 = position.copy(), velocity.copy()
+        v2 = v0 + acceleration * half
+        a2 = accelerations(x0 + v0 * half, v2)
+        v3 = v0 + a2 * half
+        a3 = accelerations(x0 + v2 * half, v3)
+        v4 = v0 + a3 * h
+        a4 = accelerations(x0 + v3 * h, v4)
+        sixth = h / np.float32(6)
+        position += (v0 + 2 * v2 + 2 * v3 + v4) * sixth
+        velocity += (acceleration + 2 * a2 + 2 * a3 + a4) * sixth
+        return None
+
+
+INTEGRATORS = {integrator.name: integrator for integrator in (SemiImplicitEuler, VelocityVerlet, RungeKutta4)}
+
+
+def create_integrator(
+    name: str = DEFAULT_INTEGRATOR,
+    max_substeps: int = DEFAULT_MAX_SUBSTEPS,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Integrator:
+    # Integrador escolhido pelo nome (ex.: variável de ambiente PARTICLE_INTEGRATOR)
+    if name not in INTEGRATORS:
+        raise ValueError(f"integrador desconhecido: {name!r} (opções: {', '.join(INTEGRATORS)})")
+    return INTEGRATORS[name](max_substeps, tolerance)
+
+
+def substep_level(ax: float, ay: float, dt: float, max_substeps: int = DEFAULT_MAX_SUBSTEPS, tolerance: float = DEFAULT_TOLERANCE) -> int:
+    # Mesma escolha de Integrator.levels para uma partícula, em Python puro (ReferenceBackend)
+    max_level = max(int(max_substeps), 1).bit_length() - 1
+    limit = 2 * tolerance / (dt * dt)
+    magnitude = math.hypot(ax, ay)
+    if max_level == 0 or magnitude <= limit:
+        return 0
+    return min(math.ceil(math.log2(magnitude / limit) / 2), max_level)
@@ -0,0 +1,332 @@
+from typing import Optional
+
+import numpy as np
+
+
+DEFAULT_THETA = 0.4  # Ângulo de abertura: maior = mais rápido e menos preciso
+DEFAULT_STRENGTH = 50.0  # G * massa de uma partícula de massa 1
+DEFAULT_SOFTENING = 6.0  # Distância abaixo da qual a atração para de crescer
+MAX_DEPTH = 16  # Níveis da quadtree (a grade mais fina tem 2^MAX_DEPTH células por lado)
+DEFAULT_LEAF_SIZE = 8  # Até quantas partículas de cada lado um par próximo vira soma direta
+BLOCK_ELEMENTS = 1 << 18  # Pares por bloco na soma direta entre grupos
+DIRECT_CHUNK = 512  # Linhas por bloco na soma direta (limita a matriz temporária)
+EXPANSION_TERMS = 9  # Aceleração (2), derivadas (3) e derivadas segundas (4) da expansão local de um nó
+
+
+def _spread_bits(value: np.ndarray) -> np.ndarray:
+    # Intercala zeros entre os bits (16 bits -> 32 bits), para montar códigos de Morton
+    value = value.astype(np.uint64) & np.uint64(0xFFFF)
+    value = (value | (value << np.uint64(8))) & np.uint64(0x00FF00FF)
+    value = (value | (value << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    value = (value | (value << np.uint64(2))) & np.uint64(0x33333333)
+    value = (value | (value << np.uint64(1))) & np.uint64(0x55555555)
+    return value
+
+
+def morton_codes(cells: np.ndarray) -> np.ndarray:
+    # Código de Morton (curva Z) de células inteiras (N, 2); nós da quadtree viram prefixos do código
+    return (_spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << np.uint64(1))).astype(np.int64)
+
+
+class QuadTreeLevel:
+    # Nós ocupados de um nível: intervalo em `order`, massa, centro de massa, segundo momento
+    # em torno dele (xx, xy, yy), raio e índices dos até 4 filhos no próximo nível (-1 onde não há filho)
+    __slots__ = ("prefix", "start", "count", "mass", "center", "quadrupole", "radius", "children")
+
+
+class QuadTree:
+    """Quadtree linear reconstruída a cada frame a partir dos arrays de posição.
+
+    As partículas são ordenadas pelo código de Morton; cada nó de cada nível é um
+    intervalo contíguo dessa ordem, então massa e centro de massa de um nível inteiro
+    saem de uma soma por intervalos (``np.add.reduceat``). Os níveis param quando
+    todo nó tem uma partícula só ou em ``max_depth``.
+    """
+
+    def __init__(self, max_depth: int = MAX_DEPTH):
+        self.max_depth = max_depth
+        self.levels: list[QuadTreeLevel] = []
+        self.origin = np.zeros(2)
+        self.span = 1.0
+        self.order = np.empty(0, dtype=np.int64)
+        self.codes = np.empty(0, dtype=np.int64)  # Código de Morton de cada partícula (índice original)
+
+    def build(self, positions: np.ndarray, masses: np.ndarray) -> "QuadTree":
+        positions = np.asarray(positions, dtype=np.float64)
+        masses = np.asarray(masses, dtype=np.float64)
+        depth = self.max_depth
+        self.origin = positions.min(axis=0)
+        self.span = max(float(np.ptp(positions, axis=0).max()), 1e-6) * (1 + 1e-6)
+        cells = np.minimum(((positions - self.origin) / self.span * (1 << depth)).astype(np.int64), (1 << depth) - 1)
+        self.codes = morton_codes(cells)
+        self.order = np.argsort(self.codes, kind="stable")
+        codes = self.codes[self.order]
+        points = positions[self.order]
+        weighted = points * masses[self.order, None]
+        masses = masses[self.order]
+
+        self.levels = []
+        for level in range(depth + 1):
+            prefix = codes >> (2 * (depth - level))
+            node = QuadTreeLevel()
+            node.start = np.flatnonzero(np.r_[True, prefix[1:] != prefix[:-1]])
+            node.prefix = prefix[node.start]
+            node.count = np.diff(np.r_[node.start, len(codes)])
+            node.mass = np.add.reduceat(masses, node.start)
+            node.center = np.add.reduceat(weighted, node.start) / np.maximum(node.mass, 1e-12)[:, None]
+            # Raio: maior distância entre o centro de massa e uma partícula do nó
+            offset = points - np.repeat(node.center, node.count, axis=0)
+            node.radius = np.sqrt(np.maximum.reduceat(np.einsum("ij,ij->i", offset, offset), node.start))
+            moments = offset[:, [0, 0, 1]] * (offset[:, [0, 1, 1]] * masses[:, None])
+            node.quadrupole = np.add.reduceat(moments, node.start)
+            if self.levels:
+                # Filhos de cada nó do nível anterior: nós deste nível com o mesmo prefixo
+                parent = self.levels[-1]
+                node_parent = node.prefix >> 2
+                first = np.searchsorted(node_parent, parent.prefix, side="left")
+                count = np.searchsorted(node_parent, parent.prefix, side="right") - first
+                quadrants = np.arange(4)
+                parent.children = np.where(quadrants < count[:, None], first[:, None] + quadrants, -1)
+            self.levels.append(node)
+            if node.count.max() == 1:
+                break
+        self.levels[-1].children = np.full((len(self.levels[-1].start), 4), -1)
+        return self
+
+    def node_size(self, level: int) -> float:
+        return self.span / (1 << level)
+
+
+class BarnesHut:
+    """Gravidade mútua entre partículas pela aproximação de Barnes–Hut.
+
+    A travessia é dupla: pares de nós (quem recebe, quem atrai) descem a árvore
+    juntos, nível a nível, como arrays. Um par bem separado ((raio de um + raio do
+    outro) / distância < ``theta``, raios medidos do centro de massa) é aceito: o nó
+    que atrai age pela sua massa e seu quadrupolo em torno do centro de massa, e o
+    efeito vira uma expansão local de segunda ordem (aceleração e suas duas
+    primeiras derivadas) no centro de massa de quem recebe. Os dois lados erram só
+    em terceira ordem de (raio / distância).
+    Pares próximos são divididos nos filhos; quando os dois lados têm até
+    ``leaf_size`` partículas viram soma direta. No fim as expansões descem até as
+    partículas. O custo cresce quase linearmente com ``n``, contra ``n²`` da soma
+    direta. ``interactions`` é o número de pares (de nós ou de partículas)
+    avaliados no último cálculo.
+    """
+
+    def __init__(
+        self,
+        theta: float = DEFAULT_THETA,
+        strength: float = DEFAULT_STRENGTH,
+        softening: float = DEFAULT_SOFTENING,
+        max_depth: int = MAX_DEPTH,
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+    ):
+        self.theta = theta
+        self.strength = strength
+        self.softening = softening
+        self.leaf_size = leaf_size
+        self.tree = QuadTree(max_depth)
+        self.interactions = 0
+
+    def accelerations(self, positions: np.ndarray, masses: Optional[np.ndarray] = None) -> np.ndarray:
+        n = len(positions)
+        if n < 2:
+            return np.zeros((n, 2), dtype=positions.dtype)
+        masses = np.ones(n) if masses is None else np.asarray(masses, dtype=np.float64)
+        tree = self.tree.build(positions, masses)
+        # Tudo em ordem de Morton: partículas do mesmo nó são contíguas
+        points = np.asarray(positions, dtype=np.float64)[tree.order]
+        masses = masses[tree.order]
+        acceleration = np.zeros((n, 2), dtype=np.float64)
+        # A soma direta entre vizinhos próximos roda em float32 (metade da memória por bloco)
+        points32, masses32 = points.astype(np.float32), masses.astype(np.float32)
+        eps2 = self.softening * self.softening
+        last = len(tree.levels) - 1
+        self.interactions = 0
+
+        # Expansão local de cada nó (ver EXPANSION_TERMS): aceleração no centro de massa,
+        # derivadas (xx, xy, yy) e derivadas segundas (xxx, xxy, xyy, yyy)
+        expansions = [np.zeros((len(node.start), EXPANSION_TERMS)) for node in tree.levels]
+
+        # Pares não ordenados (a, b) com a <= b: cada par aceito ou somado direto age nos
+        # dois sentidos (ação e reação), então cada par de nós é visitado uma vez só
+        firsts = np.zeros(1, dtype=np.int64)
+        seconds = np.zeros(1, dtype=np.int64)
+        quadrant = np.arange(4)
+        upper = quadrant[:, None] <= quadrant[None, :]
+        for level, node in enumerate(tree.levels):
+            if len(firsts) == 0:
+                break
+            self.interactions += len(firsts)
+            # np.take em vez de indexação: bem mais rápido para linhas de arrays (k, 2)
+            d = np.take(node.center, seconds, axis=0) - np.take(node.center, firsts, axis=0)
+            r2 = np.einsum("ij,ij->i", d, d)
+            reach = node.radius[firsts] + node.radius[seconds]
+            same = firsts == seconds
+            accept = ~same & (reach * reach < self.theta * self.theta * r2)
+            if accept.any():
+                a, b = firsts[accept], seconds[accept]
+                self._expand(expansions[level], a, b, d[accept], r2[accept], node.mass, node.quadrupole, eps2)
+
+            # Pares próximos com poucas partículas dos dois lados: soma direta
+            small = node.count[firsts] * node.count[seconds] <= self.leaf_size * self.leaf_size
+            direct = ~accept & (small | (level == last))
+            if direct.any():
+                self._direct(acceleration, points32, masses32, eps2, node.start[firsts[direct]], node.count[firsts[direct]],
+                             node.start[seconds[direct]], node.count[seconds[direct]], same[direct])
+
+            # Os outros se dividem: filhos de um com filhos do outro (até 4 x 4; num nó
+            # consigo mesmo, só os pares de filhos com i <= j)
+            split = ~accept & ~direct
+            first_children = np.take(node.children, firsts[split], axis=0)[:, :, None]
+            second_children = np.take(node.children, seconds[split], axis=0)[:, None, :]
+            valid = (first_children >= 0) & (second_children >= 0) & (upper | ~same[split, None, None])
+            firsts = np.broadcast_to(first_children, valid.shape)[valid]
+            seconds = np.broadcast_to(second_children, valid.shape)[valid]
+
+        # Desce as expansões: cada filho herda a do pai, deslocada até o seu centro de massa
+        for level in range(1, last + 1):
+            parent, node = tree.levels[level - 1], tree.levels[level]
+            up = np.searchsorted(parent.prefix, node.prefix >> 2)
+            offset = node.center - np.take(parent.center, up, axis=0)
+            expansions[level] += self._shift(np.take(expansions[level - 1], up, axis=0), offset)
+
+        # Partículas: expansão do nó do último nível, deslocada até a posição de cada uma
+        node = tree.levels[last]
+        owner = np.repeat(np.arange(len(node.start)), node.count)
+        offset = points - np.take(node.center, owner, axis=0)
+        acceleration += self._shift(np.take(expansions[last], owner, axis=0), offset)[:, :2]
+
+        result = np.empty_like(acceleration)
+        result[tree.order] = acceleration * self.strength
+        return result.astype(positions.dtype)
+
+    @staticmethod
+    def _shift(parent: np.ndarray, offset: np.ndarray) -> np.ndarray:
+        # Expansão `parent` reescrita a `offset` do centro dela (exata para a segunda ordem)
+        _, _, txx, txy, tyy, uxxx, uxxy, uxyy, uyyy = parent.T
+        ox, oy = offset[:, 0], offset[:, 1]
+        shifted = parent.copy()
+        # Derivadas deslocadas: T + U o
+        shifted[:, 2] += uxxx * ox + uxxy * oy
+        shifted[:, 3] += uxxy * ox + uxyy * oy
+        shifted[:, 4] += uxyy * ox + uyyy * oy
+        # a + T o + ½ U o o = a + ½ (T + (T + U o)) o
+        shifted[:, 0] += 0.5 * ((txx + shifted[:, 2]) * ox + (txy + shifted[:, 3]) * oy)
+        shifted[:, 1] += 0.5 * ((txy + shifted[:, 3]) * ox + (tyy + shifted[:, 4]) * oy)
+        return shifted
+
+    @staticmethod
+    def _expand(expansion, a, b, d, r2, mass, quadrupole, eps2):
+        # Expansão de b em torno de a e de a em torno de b, com φ = -1/s^½, s = r² + ε² e d de a para b:
+        #   aceleração       m d / s^{3/2} + ½ Σ Q_jk ∂_j∂_k (d / s^{3/2})  (o termo de quadrupolo)
+        #   derivadas        m (3 d dᵀ / s^{5/2} - I / s^{3/2})
+        #   derivadas 2ªs    m (15 d d d / s^{7/2} - 3 (I d + permutações) / s^{5/2})
+        # Só massa e quadrupolo mudam com o sentido; os termos ímpares em d trocam de sinal. As contas
+        # por par rodam em float32 (o erro da aproximação é bem maior); as somas por nó, em float64
+        d, r2 = d.astype(np.float32), r2.astype(np.float32)
+        mass, quadrupole, eps2 = mass.astype(np.float32), quadrupole.astype(np.float32), np.float32(eps2)
+        s = r2 + eps2
+        inv3 = 1 / (s * np.sqrt(s))
+        inv5 = inv3 / s
+        inv7 = inv5 / s
+        dx, dy = d[:, 0], d[:, 1]
+        xx, xy, yy = dx * dx, dx * dy, dy * dy
+        even = (3 * xx * inv5 - inv3, 3 * xy * inv5, 3 * yy * inv5 - inv3)
+        xx15, yy15 = 15 * xx * inv7, 15 * yy * inv7
+        odd = (dx * (xx15 - 9 * inv5), dy * (xx15 - 3 * inv5), dx * (yy15 - 3 * inv5), dy * (yy15 - 9 * inv5))
+        total = len(expansion)
+
+        def add(term, weights_a, weights_b):
+            expansion[:, term] += np.bincount(a, weights=weights_a, minlength=total)
+            expansion[:, term] += np.bincount(b, weights=weights_b, minlength=total)
+
+        mass_a, mass_b = mass[a], mass[b]
+        fields = []
+        for source in (b, a):
+            qxx, qxy, qyy = np.take(quadrupole, source, axis=0).T
+            qdx, qdy = qxx * dx + qxy * dy, qxy * dx + qyy * dy
+            radial = mass[source] * inv3 - 1.5 * (qxx + qyy) * inv5 + 7.5 * (dx * qdx + dy * qdy) * inv7
+            fields.append((dx * radial - 3 * qdx * inv5, dy * radial - 3 * qdy * inv5))
+        for term in range(2):
+            add(term, fields[0][term], -fields[1][term])
+        for term, geometry in enumerate(even, start=2):
+            add(term, geometry * mass_b, geometry * mass_a)
+        for term, geometry in enumerate(odd, start=5):
+            add(term, geometry * mass_b, -geometry * mass_a)
+
+    def _direct(self, acceleration, points, masses, eps2, first_start, first_count, second_start, second_count, same):
+        # Pares agrupados pela forma do bloco (potências de 2), para não pagar o maior bloco em todos
+        shape = np.ceil(np.log2(first_count)).astype(np.int64) * 64 + np.ceil(np.log2(second_count)).astype(np.int64)
+        particles, ax, ay = [], [], []
+        for key in np.unique(shape):
+            group = shape == key
+            blocks = self._direct_blocks(points, masses, eps2, first_start[group], first_count[group],
+                                         second_start[group], second_count[group], same[group])
+            for block_particles, block_ax, block_ay in blocks:
+                particles.append(block_particles)
+                ax.append(block_ax)
+                ay.append(block_ay)
+        particles = np.concatenate(particles)
+        acceleration[:, 0] += np.bincount(particles, weights=np.concatenate(ax), minlength=len(points))
+        acceleration[:, 1] += np.bincount(particles, weights=np.concatenate(ay), minlength=len(points))
+
+    def _direct_blocks(self, points, masses, eps2, first_start, first_count, second_start, second_count, same):
+        # Soma direta em blocos densos (pares x partículas de a x partículas de b). Linhas e
+        # colunas que sobram têm massa 0; a própria partícula tem distância 0 e não contribui.
+        # O mesmo bloco dá a força de b em a (soma nas colunas) e de a em b (soma nas linhas),
+        # menos quando a == b, em que o bloco já tem todos os pares ordenados.
+        # Gera (partícula, ax, ay) de cada bloco
+        n = len(points)
+        self.interactions += int(np.dot(first_count, second_count))
+        rows, columns = int(first_count.max()), int(second_count.max())
+        chunk = max(BLOCK_ELEMENTS // (rows * columns), 1)
+        row_offsets, column_offsets = np.arange(rows), np.arange(columns)
+        eps2 = np.float32(eps2)
+        zero = np.float32(0)
+        for start in range(0, len(first_start), chunk):
+            block = slice(start, start + chunk)
+            own = np.minimum(first_start[block, None] + row_offsets, n - 1)
+            own_valid = row_offsets < first_count[block, None]
+            other = np.minimum(second_start[block, None] + column_offsets, n - 1)
+            other_valid = (column_offsets < second_count[block, None]) & ~same[block, None]
+            dx = points[other, 0][:, None, :] - points[own, 0][:, :, None]
+            dy = points[other, 1][:, None, :] - points[own, 1][:, :, None]
+            d2 = dx * dx + dy * dy + eps2
+            inverse = np.float32(1) / (d2 * np.sqrt(d2))
+            own_mass = np.where(own_valid, masses[own], zero)
+            other_mass = np.where(column_offsets < second_count[block, None], masses[other], zero)
+            scale = inverse * other_mass[:, None, :]
+            yield own[own_valid], np.einsum("pij,pij->pi", dx, scale)[own_valid], np.einsum("pij,pij->pi", dy, scale)[own_valid]
+            if other_valid.any():
+                scale = inverse * own_mass[:, :, None]
+                yield (
+                    other[other_valid],
+                    -np.einsum("pij,pij->pj", dx, scale)[other_valid],
+                    -np.einsum("pij,pij->pj", dy, scale)[other_valid],
+                )
+
+
+def direct_accelerations(
+    positions: np.ndarray,
+    masses: Optional[np.ndarray] = None,
+    strength: float = DEFAULT_STRENGTH,
+    softening: float = DEFAULT_SOFTENING,
+    chunk: int = DIRECT_CHUNK,
+) -> np.ndarray:
+    # Soma direta O(n²) de todos os pares, em blocos de linhas; referência para a Barnes–Hut
+    n = len(positions)
+    points = np.asarray(positions, dtype=np.float64)
+    masses = np.ones(n) if masses is None else np.asarray(masses, dtype=np.float64)
+    acceleration = np.zeros((n, 2), dtype=np.float64)
+    eps2 = softening * softening
+    for start in range(0, n, chunk):
+        rows = slice(start, min(start + chunk, n))
+        dx = points[None, :, 0] - points[rows, 0, None]
+        dy = points[None, :, 1] - points[rows, 1, None]
+        scale = strength * masses[None, :] * (dx * dx + dy * dy + eps2) ** -1.5
+        # A própria partícula tem dx = dy = 0 e não contribui
+        acceleration[rows, 0] = np.einsum("ij,ij->i", scale, dx)
+        acceleration[rows, 1] = np.einsum("ij,ij->i", scale, dy)
+    return acceleration.astype(np.asarray(positions).dtype)
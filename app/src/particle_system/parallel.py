@@ -0,0 +1,65 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.integrators import Integrator
+from src.particle_system.store import ParticleStore
+
+
+MIN_SHARD_SIZE = 8192
+
+
+class ShardedStepper:
+    """Executa ParticleStore.step dividindo as partículas em fatias entre threads.
+
+    Cada fatia é um intervalo contíguo de linhas; expiração e integração são
+    independentes por linha, então cada thread trabalha só na sua fatia com
+    kernels NumPy que liberam o GIL. A compactação fica na thread principal, entre
+    as duas fases, assim como a gravidade mútua (``forces.nbody``), que depende de
+    todas as partículas: é calculada uma vez sobre o pool inteiro e cada fatia lê
+    as suas linhas. O resultado é idêntico ao de ``ParticleStore.step``.
+    """
+
+    def __init__(self, workers: Optional[int] = None, min_shard_size: int = MIN_SHARD_SIZE):
+        self.workers = max(int(workers or os.cpu_count() or 1), 1)
+        self.min_shard_size = min_shard_size
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="particle-shard")
+
+    def shards(self, count: int) -> list[slice]:
+        # Fatias contíguas e de tamanho parecido; nunca menores que `min_shard_size`
+        shards = max(min(self.workers, count // self.min_shard_size), 1)
+        bounds = np.linspace(0, count, shards + 1).astype(int)
+        return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def _map(self, function, shards: list[slice]):
+        if len(shards) == 1:
+            return [function(shards[0])]
+        return list(self._pool.map(function, shards))
+
+    def step(
+        self,
+        store: ParticleStore,
+        dt: float,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+        integrator: Optional[Integrator] = None,
+    ) -> int:
+        attractors = list(attractors)
+        keep = self._map(lambda rows: store.expire(dt, center, radius, rows), self.shards(store.count))
+        removed = store.compact(np.concatenate(keep) if keep else np.ones(0, dtype=bool))
+        mutual = None
+        if forces is not None and forces.nbody is not None:
+            mutual = forces.nbody.accelerations(store.position[:store.count])
+        self._map(
+            lambda rows: store.integrate(dt, forces, attractors, rows, integrator, None if mutual is None else mutual[rows]),
+            self.shards(store.count),
+        )
+        return removed
+
+    def close(self):
+        self._pool.shutdown(wait=True)
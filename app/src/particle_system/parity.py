@@ -0,0 +1,160 @@
+import os
+
+# O relatório sai em JSON no stdout: a mensagem de boas-vindas do pygame (importado pelos schemas) iria junto
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import sys
+from typing import Optional
+
+import numpy as np
+
+from src.particle_system.backends import BACKENDS, DEFAULT_BACKEND, create_backend
+from src.particle_system.emitter import BurstEmitter
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.integrators import DEFAULT_INTEGRATOR, INTEGRATORS, create_integrator
+from src.particle_system.schemas import ParticleSystem
+from src.particle_system.store import ParticleStore
+
+
+DEFAULT_STEPS = 180
+DEFAULT_DT = 1 / 60
+DEFAULT_RATE = 240.0  # partículas por segundo em cada emissor
+# Erro aceito por coluna: |a - b| <= ATOL + RTOL * |referência| (float32 contra contas em float64)
+DEFAULT_RTOL = 1e-4
+DEFAULT_ATOL = 1e-2
+SHARD_SIZE = 64  # Fatias pequenas: com `workers` > 1 a cena da paridade é de fato dividida entre threads
+EXACT_COLUMNS = ("color", "emitter", "trail_size", "trail_head")
+COMPARED_COLUMNS = (
+    "position", "previous_position", "velocity", "acceleration", "size", "alpha", "age", "lifespan", "trail",
+) + EXACT_COLUMNS
+
+# Cena fixa: dois emissores com raios diferentes, vento, arrasto, um atrator e um repulsor com alcance, ambos com queda
+EMITTERS = (((400.0, 300.0), 150.0), ((700.0, 360.0), 90.0))
+PALETTE = ((66, 135, 245), (50, 205, 50), (255, 215, 0), (255, 20, 147))
+SPEED = 185.0
+
+
+def scene_forces() -> ForceEngine:
+    return ForceEngine(
+        attractors=[
+            Attractor(position=(520.0, 320.0), strength=900.0, falloff=2.0, softening=25.0),
+            # Com queda, a força no limite do alcance é pequena: float32 e float64 podem cair em lados
+            # diferentes do corte (mais provável no RK4, que avalia a força em mais pontos)
+            Attractor(position=(650.0, 300.0), strength=-400.0, falloff=2.0, softening=20.0, radius=240.0),
+        ],
+        wind=(12.0, -4.0),
+        drag=0.3,
+    )
+
+
+def column_errors(reference: ParticleStore, candidate: ParticleStore) -> dict[str, float]:
+    # Maior erro de cada coluna relativo à tolerância (> 1 reprova)
+    n = reference.count
+    errors = {}
+    for name in COMPARED_COLUMNS:
+        expected = getattr(reference, name)[:n].astype(np.float64)
+        actual = getattr(candidate, name)[:n].astype(np.float64)
+        if name == "trail":
+            # Só os pontos já escritos de cada trilha contam
+            valid = np.arange(reference.trail_length) < reference.trail_size[:n, None]
+            expected, actual = expected[valid], actual[valid]
+        if expected.size == 0:
+            errors[name] = 0.0
+            continue
+        difference = np.abs(actual - expected)
+        if name in EXACT_COLUMNS:
+            errors[name] = float(np.inf if difference.any() else 0.0)
+        else:
+            errors[name] = float(np.max(difference / (DEFAULT_ATOL + DEFAULT_RTOL * np.abs(expected))))
+    return errors
+
+
+def run_parity(
+    candidate: str = DEFAULT_BACKEND,
+    reference: str = "reference",
+    seed: int = 0,
+    steps: int = DEFAULT_STEPS,
+    dt: float = DEFAULT_DT,
+    rate: float = DEFAULT_RATE,
+    tolerance: float = 1.0,
+    integrator: str = DEFAULT_INTEGRATOR,
+    workers: int = 1,
+) -> dict:
+    """Roda a mesma cena com dois backends e compara o estado depois de cada passo.
+
+    Os dois sistemas usam emissores com a mesma semente e o mesmo integrador, então
+    qualquer diferença vem do backend. ``tolerance`` multiplica a tolerância de cada coluna. ``workers``
+    divide o passo do candidato entre threads. A comparação para no primeiro passo que reprova
+    (contagens diferentes ou erro acima da tolerância).
+    """
+    systems, emitters = [], []
+    for name, threads in ((reference, 1), (candidate, workers)):
+        backend = create_backend(name, threads, SHARD_SIZE)
+        systems.append(ParticleSystem(store=ParticleStore(), backend=backend, integrator=create_integrator(integrator)))
+        emitters.append([BurstEmitter(rate=rate, seed=seed + i) for i in range(len(EMITTERS))])
+    forces = scene_forces()
+    center = np.array([position for position, _ in EMITTERS], dtype=np.float32)
+    radius = np.array([radius for _, radius in EMITTERS], dtype=np.float32)
+
+    worst: dict[str, float] = {}
+    failure: Optional[dict] = None
+    particles = 0
+    for step in range(steps):
+        for system, bursts in zip(systems, emitters):
+            for index, (emitter, (position, _)) in enumerate(zip(bursts, EMITTERS)):
+                system.spawn(emitter, emitter.pending(dt), position, SPEED, PALETTE, index)
+            system.step(dt, forces, center=center, radius=radius)
+
+        expected, actual = systems[0].store, systems[1].store
+        particles = max(particles, expected.count)
+        if expected.count != actual.count:
+            failure = {"step": step, "reason": "count", "reference": expected.count, "candidate": actual.count}
+            break
+        errors = column_errors(expected, actual)
+        for name, error in errors.items():
+            worst[name] = max(worst.get(name, 0.0), error)
+        failed = sorted(name for name, error in errors.items() if error > tolerance)
+        if failed:
+            failure = {"step": step, "reason": "tolerance", "columns": failed}
+            break
+
+    for system in systems:
+        system.backend.close()
+    return {
+        "reference": reference,
+        "candidate": candidate,
+        "integrator": integrator,
+        "workers": workers,
+        "seed": seed,
+        "steps": steps,
+        "max_particles": particles,
+        "ok": failure is None,
+        "failure": failure,
+        "max_error": worst,  # em unidades de tolerância
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compara um backend da física com o de referência")
+    parser.add_argument("--candidate", default=DEFAULT_BACKEND, choices=list(BACKENDS))
+    parser.add_argument("--reference", default="reference", choices=list(BACKENDS))
+    parser.add_argument("--integrator", default=DEFAULT_INTEGRATOR, choices=list(INTEGRATORS))
+    parser.add_argument("--workers", type=int, default=1, help="threads do passo do candidato")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE)
+    parser.add_argument("--tolerance", type=float, default=1.0, help="multiplicador da tolerância de cada coluna")
+    args = parser.parse_args(argv)
+
+    reports = [
+        run_parity(args.candidate, args.reference, seed, args.steps, rate=args.rate, tolerance=args.tolerance, integrator=args.integrator, workers=args.workers)
+        for seed in args.seeds
+    ]
+    print(json.dumps(reports, indent=2))
+    return 0 if all(report["ok"] for report in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.particle_system.schemas import ParticleSystem
+from src.particle_system.store import ParticleStore, survivors
+
+
+class PipelinedSimulation:
+    """Dois buffers de estado: a simulação do próximo frame roda numa thread
+    enquanto a thread principal renderiza o frame atual.
+
+    ``front`` é o buffer que a thread principal lê (render, gravação); ``back`` é
+    o da simulação, que só a thread de simulação escreve e que segue de passo em
+    passo sem ser recopiado. A cada frame a thread principal chama ``barrier``:
+    espera o passo em andamento e publica o resultado em ``front`` copiando só as
+    colunas que a física escreve (ver ``ParticleStore.sync_from``), aplica a
+    entrada do usuário e chama ``submit`` com o próximo passo. As trilhas têm um
+    dono só, o buffer da frente: o de trás não guarda histórico, e cada publicação
+    compacta as trilhas e acrescenta às sobreviventes a posição do início do último
+    passo, como faria o passo sem pipeline (um ponto por frame, mesmo quando o
+    frame roda mais de um passo). Entre ``barrier`` e
+    ``submit`` nenhuma thread mexe no estado, então controles e ímã só mudam
+    nessa fronteira. O preço é um frame de latência.
+    """
+
+    def __init__(self, particle_system: ParticleSystem):
+        self.front = particle_system
+        store = particle_system.store
+        self.back = ParticleSystem(
+            store=ParticleStore(capacity=store.capacity, trail_length=0),
+            backend=particle_system.backend,
+            integrator=particle_system.integrator,
+        )
+        self.back.store.copy_from(store, trails=False)
+        self.back.emitter_counts = dict(particle_system.emitter_counts)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="particle-pipeline")
+        self._pending: Optional[Future] = None
+        self.wait_time = 0.0  # Tempo que a última barreira esperou pela simulação
+        self.simulation_time = 0.0  # Duração do último passo na thread de simulação
+
+    @property
+    def busy(self) -> bool:
+        return self._pending is not None
+
+    def barrier(self) -> Any:
+        # Espera o passo em andamento, publica o resultado em `front` e retorna o que o passo retornou
+        if self._pending is None:
+            return None
+        start = time.perf_counter()
+        try:
+            result, keep = self._pending.result()
+        finally:
+            self._pending = None
+            self.wait_time = time.perf_counter() - start
+        self.front.store.sync_from(self.back.store, keep)
+        self.front.emitter_counts = dict(self.back.emitter_counts)
+        return result
+
+    def submit(self, step: Callable[[ParticleSystem], Any]):
+        # `step(particle_system)` roda na thread de simulação sobre o buffer de trás
+        if self._pending is not None:
+            raise RuntimeError("submit sem barrier: o passo anterior ainda não foi publicado")
+        self._pending = self._pool.submit(self._run, step, self.front, self.back)
+
+    def _run(self, step: Callable[[ParticleSystem], Any], front: ParticleSystem, back: ParticleSystem) -> tuple[Any, Any]:
+        start = time.perf_counter()
+        try:
+            result = step(back)
+            # Quem sobreviveu desde a última publicação, calculado aqui para aliviar a barreira
+            # (enquanto o passo roda a thread principal só lê `front`)
+            return result, survivors(front.store.serial[:front.store.count], back.store.serial[:back.store.count])
+        finally:
+            self.simulation_time = time.perf_counter() - start
+
+    def close(self):
+        self.barrier()
+        self._pool.shutdown(wait=True)
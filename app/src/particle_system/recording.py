@@ -0,0 +1,215 @@
+import json
+import queue
+import struct
+import threading
+from typing import Optional
+
+import numpy as np
+
+from src.particle_system.store import ParticleStore
+
+
+# Formato do arquivo:
+#   cabeçalho  FILE_HEADER (magic, versão)
+#   chunks     CHUNK_HEADER (magic, nº de frames, bytes) + frames
+#   frame      FRAME_HEADER (magic, índice, nº de partículas, tempo, bytes dos controles)
+#              + controles em JSON + os arrays de FRAME_ARRAYS, na ordem
+# Cada bloco é alinhado em 8 bytes para que os arrays possam ser lidos direto do mmap.
+FILE_MAGIC = b"PSREC"
+FILE_VERSION = 3
+FILE_HEADER = struct.Struct("<5sxxxI4x")  # 16 bytes, para o primeiro chunk começar alinhado
+CHUNK_HEADER = struct.Struct("<4sIQ")
+FRAME_HEADER = struct.Struct("<4sIIdI")
+CHUNK_MAGIC = b"CHNK"
+FRAME_MAGIC = b"FRAM"
+DEFAULT_CHUNK_FRAMES = 30
+DEFAULT_MAX_PENDING = 120
+
+# (nome, forma por partícula, dtype) de cada coluna gravada. Idade, duração e emissor vão junto
+# para que as curvas de vida sejam amostradas no replay como na simulação
+FRAME_ARRAYS = (
+    ("position", (2,), np.float32),
+    ("size", (), np.float32),
+    ("alpha", (), np.float32),
+    ("age", (), np.float32),
+    ("lifespan", (), np.float32),
+    ("emitter", (), np.int32),
+    ("color", (3,), np.uint8),
+)
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+def _frame_arrays(count: int, offset: int) -> tuple[list[tuple[str, int, tuple[int, ...], type]], int]:
+    # (nome, offset, forma, dtype) de cada array de um frame com `count` partículas e o offset do fim
+    layout = []
+    for name, shape, dtype in FRAME_ARRAYS:
+        shape = (count, *shape)
+        layout.append((name, offset, shape, dtype))
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset += nbytes + _padding(nbytes)
+    return layout, offset
+
+
+def encode_frame(index: int, time: float, controls: dict, arrays: dict[str, np.ndarray]) -> bytes:
+    count = len(arrays["position"])
+    # JSON estrito: um valor não finito (NaN, Infinity) falha aqui em vez de gerar um arquivo ilegível fora do Python
+    controls_bytes = json.dumps(controls, separators=(",", ":"), allow_nan=False).encode()
+    parts = [
+        FRAME_HEADER.pack(FRAME_MAGIC, index, count, time, len(controls_bytes)),
+        controls_bytes,
+        b"\0" * _padding(FRAME_HEADER.size + len(controls_bytes)),
+    ]
+    for name, _, _, dtype in _frame_arrays(count, 0)[0]:
+        data = np.ascontiguousarray(arrays[name], dtype=dtype).tobytes()
+        parts.append(data)
+        parts.append(b"\0" * _padding(len(data)))
+    return b"".join(parts)
+
+
+class Recorder:
+    """Grava o estado das partículas quadro a quadro em segundo plano.
+
+    ``record`` só copia as colunas usadas na renderização e coloca na fila; uma
+    thread empacota os frames em chunks e escreve no disco. Se a fila encher, o
+    frame é descartado (contado em ``dropped``) em vez de travar o loop.
+    """
+
+    def __init__(self, path: str, chunk_frames: int = DEFAULT_CHUNK_FRAMES, max_pending: int = DEFAULT_MAX_PENDING):
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self.frames = 0
+        self.dropped = 0
+        self._error: Optional[BaseException] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._file = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION))
+        self._thread = threading.Thread(target=self._writer, name="particle-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, store: ParticleStore, controls: dict, time: float, positions: Optional[np.ndarray] = None) -> bool:
+        n = len(store)
+        arrays = {
+            "position": (store.position[:n] if positions is None else positions).copy(),
+            "size": store.size[:n].copy(),
+            "alpha": store.alpha[:n].copy(),
+            "color": store.color[:n].copy(),
+            "age": store.age[:n].copy(),
+            "lifespan": store.lifespan[:n].copy(),
+            "emitter": store.emitter[:n].copy(),
+        }
+        try:
+            self._queue.put_nowait((self.frames, time, controls, arrays))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self.frames += 1
+        return True
+
+    def _writer(self):
+        chunk: list[bytes] = []
+        while True:
+            item = self._queue.get()
+            if self._error is not None:
+                # Depois de um erro só esvazia a fila, para que close() não fique bloqueado
+                if item is None:
+                    return
+                continue
+            try:
+                if item is not None:
+                    chunk.append(encode_frame(*item))
+                if chunk and (item is None or len(chunk) >= self.chunk_frames):
+                    body = b"".join(chunk)
+                    self._file.write(CHUNK_HEADER.pack(CHUNK_MAGIC, len(chunk), len(body)))
+                    self._file.write(body)
+                    self._file.flush()
+                    chunk = []
+            except Exception as error:
+                self._error = error
+            if item is None:
+                return
+
+    def close(self):
+        # Espera a escrita terminar; um erro da thread de escrita é relançado aqui
+        self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise self._error
+
+
+class ReplayFrame:
+    def __init__(self, index: int, time: float, controls: dict, arrays: dict[str, np.ndarray]):
+        self.index = index
+        self.time = time
+        self.controls = controls
+        self.position = arrays["position"]
+        self.size = arrays["size"]
+        self.alpha = arrays["alpha"]
+        self.color = arrays["color"]
+        self.age = arrays["age"]
+        self.lifespan = arrays["lifespan"]
+        self.emitter = arrays["emitter"]
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def load_into(self, store: ParticleStore):
+        # Substitui o conteúdo do store pelo frame gravado (sem trilhas: a identidade das partículas não é gravada)
+        store.count = 0
+        rows = store.extend(len(self))
+        store.position[rows] = self.position
+        store.previous_position[rows] = self.position
+        store.size[rows] = self.size
+        store.alpha[rows] = self.alpha
+        store.color[rows] = self.color
+        store.age[rows] = self.age
+        store.lifespan[rows] = self.lifespan
+        store.emitter[rows] = self.emitter
+
+
+class Replay:
+    """Lê uma gravação via memory-map; os arrays de cada frame são views do arquivo."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version = FILE_HEADER.unpack_from(self._data, 0)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError(f"{path} não é uma gravação de partículas compatível")
+        self._frames = self._index()
+
+    def _index(self) -> list[tuple[int, int, float, int, int]]:
+        # Percorre só os cabeçalhos: (offset dos arrays, nº de partículas, tempo, offset e tamanho dos controles)
+        frames = []
+        offset = FILE_HEADER.size
+        size = len(self._data)
+        while offset + CHUNK_HEADER.size <= size:
+            magic, frame_count, length = CHUNK_HEADER.unpack_from(self._data, offset)
+            offset += CHUNK_HEADER.size
+            if magic != CHUNK_MAGIC or offset + length > size:
+                break  # Chunk truncado (gravação interrompida)
+            for _ in range(frame_count):
+                _, _, count, time, controls_length = FRAME_HEADER.unpack_from(self._data, offset)
+                controls_offset = offset + FRAME_HEADER.size
+                arrays_offset = controls_offset + controls_length + _padding(FRAME_HEADER.size + controls_length)
+                frames.append((arrays_offset, count, time, controls_offset, controls_length))
+                offset = _frame_arrays(count, arrays_offset)[1]
+        return frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def frame(self, index: int) -> ReplayFrame:
+        arrays_offset, count, time, controls_offset, controls_length = self._frames[index]
+        controls = json.loads(bytes(self._data[controls_offset:controls_offset + controls_length]))
+        arrays = {
+            name: np.frombuffer(self._data, dtype=dtype, count=int(np.prod(shape)), offset=offset).reshape(shape)
+            for name, offset, shape, dtype in _frame_arrays(count, arrays_offset)[0]
+        }
+        return ReplayFrame(index, time, controls, arrays)
+
+    def close(self):
+        del self._data
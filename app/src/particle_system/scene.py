@@ -0,0 +1,98 @@
+from typing import Annotated, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+Channel = Annotated[int, Field(ge=0, le=255)]
+Age = Annotated[float, Field(ge=0, le=1)]  # idade normalizada: 0 ao nascer, 1 ao expirar
+
+
+class LifetimeCurves(BaseModel):
+    """Curvas ao longo da vida das partículas de um emissor.
+
+    Cada curva é uma lista de pontos ``(idade, valor)`` interpolados linearmente e
+    constante antes do primeiro e depois do último ponto; sem curva, nada muda.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    color: Optional[list[tuple[Age, tuple[Channel, Channel, Channel]]]] = Field(default=None, min_length=1)  # multiplica a cor
+    alpha: Optional[list[tuple[Age, Annotated[float, Field(ge=0, le=1)]]]] = Field(default=None, min_length=1)  # fração do alpha
+    size: Optional[list[tuple[Age, Annotated[float, Field(ge=0)]]]] = Field(default=None, min_length=1)  # escala do tamanho
+
+
+class EmitterConfig(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str = ""
+    position: tuple[float, float]
+    radius: float = Field(default=110.0, gt=0)  # raio de culling das partículas deste emissor
+    rate: float = Field(default=60.0, ge=0)  # partículas por segundo
+    speed: float = Field(default=185.0, ge=0)
+    rgb: bool = False  # cores sorteadas da paleta padrão em vez de branco
+    palette: Optional[list[tuple[Channel, Channel, Channel]]] = Field(default=None, min_length=1)  # sobrepõe `rgb`
+    max_particles: Optional[int] = Field(default=None, gt=0)  # limite próprio dentro do pool compartilhado
+    curves: Optional[LifetimeCurves] = None  # cor, alpha e tamanho ao longo da vida
+    gravity: Optional[tuple[float, float]] = None  # aceleração própria das partículas (padrão: gravidade para baixo)
+    lifespan: Optional[tuple[Annotated[float, Field(gt=0)], Annotated[float, Field(gt=0)]]] = None  # segundos (mín., máx.)
+
+
+class NBodyConfig(BaseModel):
+    """Gravidade mútua entre as partículas (ver ``src.particle_system.nbody``)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    theta: float = Field(default=0.4, gt=0, le=1.5)  # ângulo de abertura da Barnes–Hut
+    strength: float = Field(default=50.0)  # G * massa de cada partícula (negativo repele)
+    softening: float = Field(default=6.0, gt=0)
+
+
+class CircleObstacle(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Literal["circle"] = "circle"
+    center: tuple[float, float]
+    radius: float = Field(gt=0)
+
+
+class PolygonObstacle(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Literal["polygon"] = "polygon"
+    points: list[tuple[float, float]] = Field(min_length=3)  # vértices em ordem (horário ou anti-horário)
+
+
+class MaskObstacle(BaseModel):
+    """Obstáculo desenhado numa imagem (lida com Pillow): pixels opacos ou claros são sólidos."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    kind: Literal["mask"] = "mask"
+    path: str  # relativo ao arquivo da cena
+    position: tuple[float, float] = (0.0, 0.0)  # canto superior esquerdo na tela
+    size: Optional[tuple[Annotated[float, Field(gt=0)], Annotated[float, Field(gt=0)]]] = None  # padrão: tamanho da imagem
+    threshold: Channel = 128  # alpha (ou luminância, sem alpha) a partir do qual o pixel é sólido
+    invert: bool = False
+
+
+Obstacle = Annotated[Union[CircleObstacle, PolygonObstacle, MaskObstacle], Field(discriminator="kind")]
+
+
+class Scene(BaseModel):
+    """Cena declarativa: vários emissores escrevendo no mesmo pool de partículas."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    max_particles: int = Field(default=10000, gt=0)  # tamanho do pool compartilhado
+    emitters: list[EmitterConfig] = Field(min_length=1)
+    nbody: Optional[NBodyConfig] = None  # liga a gravidade mútua desde o início
+    obstacles: list[Obstacle] = Field(default_factory=list)  # assados num campo de distância (ver obstacles.py)
+    obstacle_cell: float = Field(default=4.0, gt=0)  # pixels por célula da grade dos obstáculos
+    restitution: float = Field(default=0.5, ge=0, le=1)  # fração da velocidade normal devolvida no choque
+    friction: float = Field(default=0.1, ge=0, le=1)  # fração da velocidade tangencial perdida no choque
+
+
+def load_scene(path: str) -> Scene:
+    # Arquivo JSON validado pelos modelos acima (erros de validação do pydantic sobem como estão)
+    with open(path) as f:
+        return Scene.model_validate_json(f.read())
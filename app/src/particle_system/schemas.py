@@ -1,8 +1,13 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 import pygame
 from collections import deque
-from typing import Optional
-import math
+from typing import Iterable, Optional, Sequence
+
+from src.particle_system.backends import SimulationBackend, VectorizedBackend, reference_acceleration, reference_integrate
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.integrators import Integrator, create_integrator
+from src.particle_system.sprites import default_sprite_cache
+from src.particle_system.store import TRAIL_LENGTH, ParticleStore, ParticleView
 
 
 class Particle(BaseModel):
@@ -21,9 +26,15 @@ class Particle(BaseModel):
     def __init__(self, **data):
         super().__init__(**data)
         if self.trail is None:
-            self.trail = deque(maxlen=30)
+            self.trail = deque(maxlen=TRAIL_LENGTH)
 
-    def update(self, dt: float, mouse_pos: Optional[tuple[int, int]] = None, is_magnetic: bool = False):
+    def update(
+        self,
+        dt: float,
+        mouse_pos: Optional[tuple[int, int]] = None,
+        is_magnetic: bool = False,
+        integrator: Optional[Integrator] = None,
+    ):
         self.age += dt
         if self.age >= self.lifespan:
             return False
@@ -32,27 +43,16 @@ class Particle(BaseModel):
         x, y = self.position
         vx, vy = self.velocity
         ax, ay = self.acceleration
-        
-        # Se estiver no modo magnético e o mouse estiver pressionado
-        if is_magnetic and mouse_pos:
-            # Calcular direção para o mouse
-            dx = mouse_pos[0] - x
-            dy = mouse_pos[1] - y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            if distance > 0:  # Evitar divisão por zero
-                # Normalizar e aplicar força magnética
-                dx /= distance
-                dy /= distance
-                vx += dx * self.magnetic_strength * dt
-                vy += dy * self.magnetic_strength * dt
-        else:
-            # Aplicar gravidade normalmente
-            vx += ax * dt
-            vy += ay * dt
-        
-        new_x = x + vx * dt
-        new_y = y + vy * dt
+
+        # Se estiver no modo magnético e o mouse estiver pressionado, a atração soma-se à gravidade
+        # (mesma física do ReferenceBackend; sem integrador, Euler semi-implícito num passo só)
+        attractors = [Attractor(position=mouse_pos, strength=self.magnetic_strength)] if is_magnetic and mouse_pos else []
+
+        def accelerations(x, y, vx, vy):
+            fx, fy = reference_acceleration(x, y, vx, vy, attractors)
+            return ax + fx, ay + fy
+
+        new_x, new_y, vx, vy = reference_integrate(x, y, vx, vy, dt, accelerations, integrator)
         
         # Atualizar trilha
         self.trail.append((x, y))
@@ -62,71 +62,107 @@ class Particle(BaseModel):
         return True
 
     def render(self, screen: pygame.Surface, bloom_effect: bool = False, bloom_intensity: float = 1.0):
-        # Renderizar trilha
-        if len(self.trail) > 1:
-            points = list(self.trail)
-            if bloom_effect:
-                # Desenhar trilha com efeito de bloom (usando a cor da partícula)
-                for i in range(len(points) - 1):
-                    alpha = int(255 * (i / len(points)) * bloom_intensity)
-                    alpha = min(max(alpha, 0), 255)
-                    # Trilha principal com cor da partícula
-                    pygame.draw.line(screen, (*[int(c) for c in self.color], alpha), points[i], points[i + 1], 3)
-                    # Trilha com brilho branco suave
-                    white_alpha = min(max(alpha // 3, 0), 255)
-                    pygame.draw.line(screen, (255, 255, 255, white_alpha), points[i], points[i + 1], 4)
-            else:
-                # Desenhar trilha normal com a cor da partícula
-                pygame.draw.lines(screen, self.color, False, points, 2)
-
-        # Renderizar partícula
+        render_particle(self, screen, bloom_effect, bloom_intensity)
+
+
+def render_particle(particle, screen: pygame.Surface, bloom_effect: bool = False, bloom_intensity: float = 1.0):
+    # Renderizar trilha
+    if len(particle.trail) > 1:
+        points = list(particle.trail)
         if bloom_effect:
-            # Efeito de bloom
-            for i in range(8):  # Aumentado para 8 camadas para mais blur
-                size = self.size * (1 + i * 1.2 * bloom_intensity)  # Aumentado o incremento para mais blur
-                alpha = int(self.alpha * (1 - i * 0.15) * bloom_intensity)  # Reduzido a perda de alpha para mais blur
+            # Desenhar trilha com efeito de bloom (usando a cor da partícula)
+            for i in range(len(points) - 1):
+                alpha = int(255 * (i / len(points)) * bloom_intensity)
                 alpha = min(max(alpha, 0), 255)
-                
-                # Camada de brilho branco
-                surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+                # Trilha principal com cor da partícula
+                pygame.draw.line(screen, (*[int(c) for c in particle.color], alpha), points[i], points[i + 1], 3)
+                # Trilha com brilho branco suave
                 white_alpha = min(max(alpha // 3, 0), 255)
-                pygame.draw.circle(
-                    surf,
-                    (255, 255, 255, white_alpha),
-                    (int(size), int(size)),
-                    int(size)
-                )
-                screen.blit(surf, (self.position[0] - size, self.position[1] - size))
-                
-                # Camada com cor da partícula
-                surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    surf,
-                    (*[int(c) for c in self.color], alpha),
-                    (int(size), int(size)),
-                    int(size)
-                )
-                screen.blit(surf, (self.position[0] - size, self.position[1] - size))
+                pygame.draw.line(screen, (255, 255, 255, white_alpha), points[i], points[i + 1], 4)
         else:
-            # Partícula normal
-            surf = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                surf,
-                (*[int(c) for c in self.color], int(min(max(self.alpha, 0), 255))),
-                (int(self.size), int(self.size)),
-                int(self.size)
-            )
-            screen.blit(surf, (self.position[0] - self.size, self.position[1] - self.size))
+            # Desenhar trilha normal com a cor da partícula
+            pygame.draw.lines(screen, particle.color, False, points, 2)
+
+    # Renderizar partícula com um único blit de um sprite do cache
+    if bloom_effect:
+        sprite = default_sprite_cache.bloom(
+            particle.size, particle.color, particle.alpha, spread=bloom_intensity, gain=bloom_intensity
+        )
+    else:
+        sprite = default_sprite_cache.circle(particle.size, particle.color, particle.alpha)
+    x, y = particle.position
+    screen.blit(sprite, (x - sprite.get_width() / 2, y - sprite.get_height() / 2))
 
 
 class ParticleSystem(BaseModel):
-    particles: list[Particle]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    # Estado das partículas em arrays contíguos (ver ParticleStore)
+    store: ParticleStore = Field(default_factory=ParticleStore)
+    # Onde a física roda (ver src/particle_system/backends.py); o vetorizado é o padrão
+    backend: SimulationBackend = Field(default_factory=VectorizedBackend)
+    # Como posição e velocidade avançam (ver src/particle_system/integrators.py)
+    integrator: Integrator = Field(default_factory=create_integrator)
+    # Partículas vivas de cada emissor (índice da coluna `emitter` -> quantidade), atualizadas pelo
+    # passo e pela emissão; ficam junto do store para que cada buffer do modo em pipeline tenha as suas
+    emitter_counts: dict[int, int] = Field(default_factory=dict)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _particles_to_store(cls, data):
+        # Compatibilidade: ParticleSystem(particles=[...]) copia as partículas para o store
+        if isinstance(data, dict) and "particles" in data:
+            data = dict(data)
+            particles = data.pop("particles")
+            store = data.get("store") or ParticleStore(capacity=max(len(particles), 1))
+            for particle in particles:
+                if not isinstance(particle, Particle):
+                    particle = Particle.model_validate(particle)
+                store.append(**particle.model_dump(exclude={"trail", "magnetic_strength"}), trail=particle.trail)
+            data["store"] = store
+        return data
+
+    @property
+    def particles(self) -> list[ParticleView]:
+        return [self.store.view(i) for i in range(len(self.store))]
+
+    def add(self, particle: Particle) -> ParticleView:
+        index = self.store.append(**particle.model_dump(exclude={"trail", "magnetic_strength"}), trail=particle.trail)
+        return self.store.view(index)
+
+    def spawn(
+        self,
+        emitter,
+        count: int,
+        position: tuple[float, float],
+        speed: float,
+        palette: Sequence[tuple[int, int, int]],
+        index: int = 0,
+    ) -> slice:
+        # Rajada de `count` partículas sorteadas pelo BurstEmitter `emitter`
+        return self.backend.spawn(self.store, emitter, count, position, speed, palette, index)
+
+    def step(
+        self,
+        dt: float,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+    ) -> int:
+        return self.backend.step(self.store, dt, forces, attractors, center, radius, self.integrator)
 
-    def update(self, dt: float):
-        for particle in self.particles[:]:
-            if not particle.update(dt):
-                self.particles.remove(particle)
+    def update(
+        self,
+        dt: float,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+    ) -> int:
+        # Mesmo passo de `step` (e de update_particle_system): não há outro caminho de física
+        return self.step(dt, forces, attractors, center, radius)
 
     def render(self, screen: pygame.Surface, bloom_effect: bool = False, bloom_intensity: float = 1.0):
         for particle in self.particles:
-            particle.render(screen, bloom_effect, bloom_intensity)
+            render_particle(particle, screen, bloom_effect, bloom_intensity)
@@ -0,0 +1,141 @@
+from typing import Optional
+
+import numpy as np
+
+
+# Metade da vizinhança 3x3 (a própria célula + 4 vizinhas): cada par de células é visitado uma vez
+HALF_NEIGHBORHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _cell_keys(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    # Empacota as coordenadas inteiras da célula em uma chave int64 ordenável
+    return (cx.astype(np.int64) << 32) | (cy.astype(np.int64) & 0xFFFFFFFF)
+
+
+def _expand_ranges(owners: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Para cada owner com intervalo [start, start + length), gera os pares (owner, índice)
+    total = int(lengths.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    repeated = np.repeat(owners, lengths)
+    offsets = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return repeated, np.repeat(starts, lengths) + offsets
+
+
+class SpatialHashGrid:
+    """Grade uniforme de hash espacial, reconstruída a cada frame a partir das posições.
+
+    As partículas são ordenadas pela chave da célula; cada célula ocupada vira um
+    intervalo contíguo de ``order``. Consultas e pares candidatos saem de buscas
+    binárias nas chaves, sem laços em Python por partícula.
+    """
+
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self.positions = np.empty((0, 2), dtype=np.float32)
+        self.cells = np.empty((0, 2), dtype=np.int64)
+        self.order = np.empty(0, dtype=np.int64)
+        self.cell_keys = np.empty(0, dtype=np.int64)
+        self.cell_start = np.empty(0, dtype=np.int64)
+        self.cell_count = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def build(self, positions: np.ndarray) -> "SpatialHashGrid":
+        self.positions = positions
+        self.cells = np.floor(positions / self.cell_size).astype(np.int64)
+        keys = _cell_keys(self.cells[:, 0], self.cells[:, 1])
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_keys, self.cell_start, self.cell_count = np.unique(
+            keys[self.order], return_index=True, return_counts=True
+        )
+        return self
+
+    def _lookup(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Início e tamanho (em `order`) das células com as chaves dadas; tamanho 0 se vazia
+        if len(self.cell_keys) == 0:
+            return np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), dtype=np.int64)
+        slot = np.minimum(np.searchsorted(self.cell_keys, keys), len(self.cell_keys) - 1)
+        found = self.cell_keys[slot] == keys
+        return self.cell_start[slot], np.where(found, self.cell_count[slot], 0)
+
+    def candidate_pairs(self) -> tuple[np.ndarray, np.ndarray]:
+        # Pares (i, j) de partículas em células iguais ou vizinhas, cada par uma única vez
+        n = len(self.order)
+        if n < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        sorted_cells = self.cells[self.order]
+        rank = np.arange(n)
+        firsts, seconds = [], []
+        for dx, dy in HALF_NEIGHBORHOOD:
+            starts, lengths = self._lookup(_cell_keys(sorted_cells[:, 0] + dx, sorted_cells[:, 1] + dy))
+            if dx == 0 and dy == 0:
+                # Na própria célula, só os que vêm depois na ordenação
+                ends = starts + lengths
+                starts = rank + 1
+                lengths = np.maximum(ends - starts, 0)
+            a, b = _expand_ranges(rank, starts, lengths)
+            firsts.append(a)
+            seconds.append(b)
+        return self.order[np.concatenate(firsts)], self.order[np.concatenate(seconds)]
+
+    def query(self, point: tuple[float, float], radius: float) -> np.ndarray:
+        # Índices das partículas a até `radius` do ponto
+        if len(self.order) == 0:
+            return np.empty(0, dtype=np.int64)
+        low = np.floor((np.asarray(point) - radius) / self.cell_size).astype(np.int64)
+        high = np.floor((np.asarray(point) + radius) / self.cell_size).astype(np.int64)
+        cx, cy = np.meshgrid(np.arange(low[0], high[0] + 1), np.arange(low[1], high[1] + 1), indexing="ij")
+        starts, lengths = self._lookup(_cell_keys(cx.ravel(), cy.ravel()))
+        _, ranks = _expand_ranges(np.zeros(len(starts), dtype=np.int64), starts, lengths)
+        candidates = self.order[ranks]
+        offset = self.positions[candidates] - np.asarray(point, dtype=self.positions.dtype)
+        return candidates[np.einsum("ij,ij->i", offset, offset) <= radius * radius]
+
+
+def resolve_collisions(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    radii: np.ndarray,
+    restitution: float = 0.8,
+    grid: Optional[SpatialHashGrid] = None,
+) -> int:
+    # Separa partículas sobrepostas e troca impulso ao longo da normal (massas iguais).
+    # Os arrays são alterados no lugar; retorna o número de colisões resolvidas.
+    n = len(positions)
+    if n < 2:
+        return 0
+    if grid is None:
+        grid = SpatialHashGrid(cell_size=max(float(radii.max()) * 2, 1e-3))
+    grid.build(positions)
+    i, j = grid.candidate_pairs()
+
+    delta = positions[j] - positions[i]
+    distance = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+    overlap = radii[i] + radii[j] - distance
+    hit = overlap > 0
+    if not hit.any():
+        return 0
+    i, j, delta, distance, overlap = i[hit], j[hit], delta[hit], distance[hit], overlap[hit]
+
+    # Partículas na mesma posição: escolhe uma normal fixa para separá-las
+    normal = np.empty_like(delta)
+    coincident = distance == 0
+    normal[~coincident] = delta[~coincident] / distance[~coincident, None]
+    normal[coincident] = (1.0, 0.0)
+
+    # Correção de posição: cada partícula anda metade da sobreposição
+    push = normal * (overlap * 0.5)[:, None]
+    for axis in range(2):
+        positions[:, axis] += np.bincount(j, push[:, axis], minlength=n) - np.bincount(i, push[:, axis], minlength=n)
+
+    # Impulso só para pares que estão se aproximando
+    approaching = np.einsum("ij,ij->i", velocities[j] - velocities[i], normal)
+    impulse = np.where(approaching < 0, -(1 + restitution) * approaching * 0.5, 0.0)
+    kick = normal * impulse[:, None]
+    for axis in range(2):
+        velocities[:, axis] += np.bincount(j, kick[:, axis], minlength=n) - np.bincount(i, kick[:, axis], minlength=n)
+    return len(i)
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+import pygame
+
+
+BLOOM_LAYERS = 8
+SIZE_STEP = 0.5
+ALPHA_STEP = 16
+INTENSITY_STEP = 0.1
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _quantize(value: float, step: float) -> float:
+    return round(value / step) * step
+
+
+class SpriteCache:
+    """Cache LRU de sprites de partícula já compostos (círculo simples ou bloom).
+
+    As chaves usam tamanho, alpha e intensidade quantizados, então partículas
+    parecidas compartilham o mesmo sprite. O total de pixels guardados é limitado
+    por ``max_bytes``; os sprites menos usados recentemente são descartados.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        size_step: float = SIZE_STEP,
+        alpha_step: int = ALPHA_STEP,
+        intensity_step: float = INTENSITY_STEP,
+    ):
+        self.max_bytes = max_bytes
+        self.size_step = size_step
+        self.alpha_step = alpha_step
+        self.intensity_step = intensity_step
+        self._sprites: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def clear(self):
+        self._sprites.clear()
+        self.nbytes = 0
+
+    def circle(self, size: float, color: tuple[int, int, int], alpha: float) -> pygame.Surface:
+        return self._get((
+            max(_quantize(size, self.size_step), self.size_step),
+            tuple(color),
+            self._quantize_alpha(alpha),
+            0, 0.0, 0.0,
+        ))
+
+    def bloom(
+        self,
+        size: float,
+        color: tuple[int, int, int],
+        alpha: float,
+        spread: float = 1.0,
+        gain: float = 1.0,
+        layers: int = BLOOM_LAYERS,
+    ) -> pygame.Surface:
+        # `spread` aumenta o raio entre camadas e `gain` multiplica o alpha de cada camada
+        return self._get((
+            max(_quantize(size, self.size_step), self.size_step),
+            tuple(color),
+            self._quantize_alpha(alpha),
+            int(layers),
+            _quantize(spread, self.intensity_step),
+            _quantize(gain, self.intensity_step),
+        ))
+
+    def _quantize_alpha(self, alpha: float) -> int:
+        return min(max(int(round(alpha / self.alpha_step) * self.alpha_step), 0), 255)
+
+    def _get(self, key: tuple) -> pygame.Surface:
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = _compose(*key)
+        self._sprites[key] = sprite
+        self.nbytes += _sprite_nbytes(sprite)
+        while self.nbytes > self.max_bytes and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self.nbytes -= _sprite_nbytes(evicted)
+            self.evictions += 1
+        return sprite
+
+
+def _sprite_nbytes(sprite: pygame.Surface) -> int:
+    return sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+
+
+def _compose(size: float, color: tuple[int, int, int], alpha: int, layers: int, spread: float, gain: float) -> pygame.Surface:
+    if layers == 0:
+        # Partícula normal
+        sprite = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (int(size), int(size)), int(size))
+        return _prepare(sprite)
+
+    # Efeito de bloom: mesmas camadas do desenho por partícula, compostas uma única vez
+    extent = size * (1 + (layers - 1) * 1.2 * spread)
+    sprite = pygame.Surface((int(extent * 2), int(extent * 2)), pygame.SRCALPHA)
+    for i in range(layers):
+        layer_size = size * (1 + i * 1.2 * spread)
+        layer_alpha = int(alpha * (1 - i * 0.15) * gain)
+        layer_alpha = min(max(layer_alpha, 0), 255)
+        offset = (int(extent - layer_size), int(extent - layer_size))
+
+        # Camada de brilho branco
+        surf = pygame.Surface((int(layer_size * 2), int(layer_size * 2)), pygame.SRCALPHA)
+        white_alpha = min(max(layer_alpha // 3, 0), 255)
+        pygame.draw.circle(surf, (255, 255, 255, white_alpha), (int(layer_size), int(layer_size)), int(layer_size))
+        sprite.blit(surf, offset)
+
+        # Camada com cor da partícula
+        surf = pygame.Surface((int(layer_size * 2), int(layer_size * 2)), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, layer_alpha), (int(layer_size), int(layer_size)), int(layer_size))
+        sprite.blit(surf, offset)
+    return _prepare(sprite)
+
+
+def _prepare(sprite: pygame.Surface) -> pygame.Surface:
+    # Converte para o formato da tela quando existe uma janela, o que acelera o blit
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return sprite.convert_alpha()
+    return sprite
+
+
+default_sprite_cache = SpriteCache()
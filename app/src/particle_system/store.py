@@ -0,0 +1,377 @@
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.integrators import Integrator, SemiImplicitEuler
+
+
+TRAIL_LENGTH = 30
+DEFAULT_CAPACITY = 1024
+
+# Colunas contíguas por partícula: nome -> (forma extra, dtype)
+COLUMNS: dict[str, tuple[tuple[int, ...], type]] = {
+    "position": ((2,), np.float32),
+    "previous_position": ((2,), np.float32),  # Posição no passo anterior (interpolação)
+    "velocity": ((2,), np.float32),
+    "acceleration": ((2,), np.float32),
+    "rotation": ((), np.float32),
+    "size": ((), np.float32),
+    "color": ((3,), np.uint8),
+    "alpha": ((), np.float32),
+    "age": ((), np.float32),
+    "lifespan": ((), np.float32),
+    "emitter": ((), np.int32),  # Índice do emissor que criou a partícula
+    "serial": ((), np.int64),  # Número de série, em ordem de criação (crescente ao longo do store)
+}
+
+
+def survivors(previous: np.ndarray, serial: np.ndarray) -> np.ndarray:
+    # Máscara sobre `previous` das partículas cujo número de série ainda está em `serial` (ambos crescentes)
+    index = np.searchsorted(serial, previous)
+    keep = index < len(serial)
+    keep[keep] = serial[index[keep]] == previous[keep]
+    return keep
+
+
+class ParticleStore:
+    """Armazena as partículas em arrays NumPy (structure-of-arrays).
+
+    Apenas as primeiras ``count`` linhas de cada coluna são válidas. Remoções
+    compactam os arrays mantendo a ordem das partículas vivas.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, trail_length: int = TRAIL_LENGTH):
+        self.capacity = 0
+        self.count = 0
+        self.next_serial = 0
+        self.trail_length = max(int(trail_length), 0)
+        # Trilhas num ring buffer único (N, trail_length, 2) com cabeça de escrita por partícula.
+        # float64 porque o pygame.draw aceita esses arrays diretamente, sem cópia.
+        # Com trail_length=0 não há histórico (trilhas persistentes desenhadas na tela).
+        self.columns = {
+            **COLUMNS,
+            "trail": ((self.trail_length, 2), np.float64),
+            "trail_head": ((), np.int32),
+            "trail_size": ((), np.int32),
+        }
+        self._allocate(max(int(capacity), 1))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @staticmethod
+    def trail_nbytes_for(capacity: int, trail_length: int = TRAIL_LENGTH) -> int:
+        # Custo fixo de memória das trilhas para uma dada capacidade
+        return capacity * (trail_length * 2 * np.dtype(np.float64).itemsize + 2 * np.dtype(np.int32).itemsize)
+
+    @property
+    def trail_nbytes(self) -> int:
+        return self.trail.nbytes + self.trail_head.nbytes + self.trail_size.nbytes
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.columns)
+
+    def _allocate(self, capacity: int):
+        for name, (shape, dtype) in self.columns.items():
+            column = np.zeros((capacity, *shape), dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None:
+                column[:self.count] = old[:self.count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def set_trail_length(self, trail_length: int):
+        # Troca o tamanho do histórico de trilhas (0 libera o ring buffer); as trilhas recomeçam vazias
+        trail_length = max(int(trail_length), 0)
+        if trail_length == self.trail_length:
+            return
+        self.trail_length = trail_length
+        self.columns["trail"] = ((trail_length, 2), np.float64)
+        self.trail = np.zeros((self.capacity, trail_length, 2), dtype=np.float64)
+        self.trail_head[:] = 0
+        self.trail_size[:] = 0
+
+    def copy_from(self, other: "ParticleStore", trails: bool = True):
+        # Torna este store uma cópia do estado de `other` (só as linhas válidas são copiadas);
+        # com `trails=False` só as colunas de COLUMNS, e as trilhas deste store recomeçam vazias
+        if trails:
+            self.set_trail_length(other.trail_length)
+        if other.count > self.capacity:
+            self.count = 0
+            self._allocate(other.capacity)
+        n = other.count
+        for name in self.columns if trails else COLUMNS:
+            getattr(self, name)[:n] = getattr(other, name)[:n]
+        if not trails:
+            self.trail_head[:n] = 0
+            self.trail_size[:n] = 0
+        self.count = n
+        self.next_serial = other.next_serial
+
+    def sync_from(self, other: "ParticleStore", keep: Optional[np.ndarray] = None):
+        """Traz o estado de ``other``, que seguiu simulando a partir deste store, sem copiar as trilhas.
+
+        Só as colunas de COLUMNS são copiadas; as trilhas continuam sendo deste store. As
+        partículas que ainda existem (mesmo ``serial``) vêm primeiro e na mesma ordem, já que a
+        compactação preserva a ordem e as novas entram no fim: levam a própria trilha e ganham
+        nela a posição do início do último passo. As novas começam sem trilha. ``keep`` é a
+        máscara de ``survivors`` já calculada, se houver.
+        """
+        n = other.count
+        if keep is None:
+            keep = survivors(self.serial[:self.count], other.serial[:n])
+        alive = int(np.count_nonzero(keep))
+        if alive < self.count:
+            for name in ("trail", "trail_head", "trail_size"):
+                column = getattr(self, name)
+                column[:alive] = column[:self.count][keep]
+        if n > self.capacity:
+            self.count = alive
+            self._allocate(other.capacity)
+        for name in COLUMNS:
+            getattr(self, name)[:n] = getattr(other, name)[:n]
+        new = slice(alive, n)
+        self.trail[new] = 0
+        self.trail_head[new] = 0
+        self.trail_size[new] = 0
+        self.count = n
+        self.next_serial = other.next_serial
+        self.append_trail(slice(0, alive), self.previous_position)
+
+    def reserve(self, extra: int):
+        # Garante espaço para mais `extra` partículas, dobrando a capacidade
+        required = self.count + extra
+        if required <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < required:
+            capacity *= 2
+        self._allocate(capacity)
+
+    def append(
+        self,
+        position: tuple[float, float],
+        velocity: tuple[float, float],
+        acceleration: tuple[float, float],
+        rotation: float,
+        size: float,
+        color: tuple[int, int, int],
+        alpha: float = 255.0,
+        lifespan: float = 1.0,
+        age: float = 0.0,
+        trail: Optional[Iterable[tuple[float, float]]] = None,
+    ) -> int:
+        self.reserve(1)
+        i = self.count
+        self.position[i] = position
+        self.previous_position[i] = position
+        self.velocity[i] = velocity
+        self.acceleration[i] = acceleration
+        self.rotation[i] = rotation
+        self.size[i] = size
+        self.color[i] = color
+        self.alpha[i] = alpha
+        self.age[i] = age
+        self.lifespan[i] = lifespan
+        self.serial[i] = self.next_serial
+        self.next_serial += 1
+        points = list(trail or ())[-self.trail_length:] if self.trail_length else []
+        if points:
+            self.trail[i, :len(points)] = points
+        self.trail_size[i] = len(points)
+        self.trail_head[i] = len(points) % self.trail_length if self.trail_length else 0
+        self.count += 1
+        return i
+
+    def extend(self, count: int) -> slice:
+        # Reserva `count` linhas novas no fim e devolve o slice para serem preenchidas em lote
+        self.reserve(count)
+        rows = slice(self.count, self.count + count)
+        for name in self.columns:
+            getattr(self, name)[rows] = 0
+        self.serial[rows] = np.arange(self.next_serial, self.next_serial + count)
+        self.next_serial += count
+        self.count += count
+        return rows
+
+    def compact(self, keep: np.ndarray) -> int:
+        # Remove as partículas onde `keep` é False; retorna quantas saíram
+        n = self.count
+        alive = int(np.count_nonzero(keep))
+        if alive == n:
+            return 0
+        for name in self.columns:
+            column = getattr(self, name)
+            column[:alive] = column[:n][keep]
+        self.count = alive
+        return n - alive
+
+    def expire(
+        self,
+        dt: float,
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+        rows: Optional[slice] = None,
+    ) -> np.ndarray:
+        # Envelhece as partículas de `rows` e retorna a máscara das que continuam vivas:
+        # não expiraram e (opcionalmente) estavam dentro do raio antes de se mover.
+        # `center` (E, 2) e `radius` (E,) também podem ser arrays com um valor por emissor,
+        # escolhido pela coluna `emitter` de cada partícula
+        rows = slice(0, self.count) if rows is None else rows
+        keep = np.ones(len(self.age[rows]), dtype=bool)
+        if center is not None and radius is not None:
+            center = np.asarray(center, dtype=np.float32)
+            radius = np.asarray(radius, dtype=np.float32)
+            if radius.ndim:
+                emitter = self.emitter[rows]
+                center, radius = center[emitter], radius[emitter]
+            offset = self.position[rows] - center
+            keep &= np.einsum("ij,ij->i", offset, offset) <= radius * radius
+        age = self.age[rows]
+        age += np.float32(dt)
+        keep &= age < self.lifespan[rows]
+        return keep
+
+    def integrate(
+        self,
+        dt: float,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+        rows: Optional[slice] = None,
+        integrator: Optional[Integrator] = None,
+        mutual: Optional[np.ndarray] = None,
+    ) -> int:
+        # Integra as partículas de `rows` (todas por padrão); cada linha é independente.
+        # `mutual` é a gravidade mútua destas linhas já calculada sobre o pool inteiro (ShardedStepper).
+        # Retorna o total de subpassos de partícula usados (ver Integrator.integrate)
+        rows = slice(0, self.count) if rows is None else rows
+        position = self.position[rows]
+        velocity = self.velocity[rows]
+        if len(position) == 0:
+            return 0
+        integrator = integrator or SemiImplicitEuler(max_substeps=1)
+
+        # Atualizar trilha com a posição anterior
+        self.append_trail(rows)
+        self.previous_position[rows] = position
+
+        # Gravidade de cada partícula mais as forças externas (atratores, vento, arrasto)
+        gravity = self.acceleration[rows]
+        attractors = list(attractors)
+        if forces is None and attractors:
+            forces = ForceEngine()
+        active = forces is not None and forces.is_active(attractors)
+        # A gravidade mútua depende de todas as partículas: calculada uma vez por passo e
+        # mantida nos subpassos (é suave; o que exige subpassos são atratores e ímã)
+        if mutual is None and active and forces.nbody is not None:
+            mutual = forces.nbody.accelerations(position)
+
+        def accelerations(position, velocity, index=None):
+            total = gravity if index is None else gravity[index]
+            if active:
+                total = total + forces.accelerations(position, velocity, attractors, mutual=False)
+            if mutual is not None:
+                total = total + (mutual if index is None else mutual[index])
+            return total
+
+        return integrator.integrate(position, velocity, accelerations(position, velocity), dt, accelerations)
+
+    def step(
+        self,
+        dt: float,
+        forces: Optional[ForceEngine] = None,
+        attractors: Iterable[Attractor] = (),
+        center: Optional[tuple[float, float]] = None,
+        radius: Optional[float] = None,
+        integrator: Optional[Integrator] = None,
+    ) -> int:
+        # Culling pelo raio (posição atual), envelhecimento, expiração e integração
+        removed = self.compact(self.expire(dt, center, radius))
+        self.integrate(dt, forces, attractors, integrator=integrator)
+        return removed
+
+    def interpolated_position(self, alpha: float = 1.0) -> np.ndarray:
+        # Posições entre o passo anterior (alpha=0) e o atual (alpha=1)
+        n = self.count
+        if alpha >= 1.0:
+            return self.position[:n]
+        previous = self.previous_position[:n]
+        return previous + (self.position[:n] - previous) * np.float32(alpha)
+
+    def append_trail(self, rows: Optional[slice] = None, position: Optional[np.ndarray] = None):
+        # Escreve a posição das partículas de `rows` (coluna `position` por padrão) na cabeça de cada trilha
+        if self.trail_length == 0:
+            return
+        rows = slice(0, self.count) if rows is None else rows
+        position = self.position if position is None else position
+        head = self.trail_head[rows]
+        self.trail[rows][np.arange(len(head)), head] = position[rows]
+        head += 1
+        head[head == self.trail_length] = 0
+        np.minimum(self.trail_size[rows] + 1, self.trail_length, out=self.trail_size[rows])
+
+    def trail_segments(self, index: int) -> tuple[np.ndarray, ...]:
+        # Trechos da trilha em ordem cronológica, como views do ring buffer (sem cópia)
+        size = int(self.trail_size[index])
+        trail = self.trail[index]
+        if size < self.trail_length:
+            return (trail[:size],)
+        head = int(self.trail_head[index])
+        if head == 0:
+            return (trail,)
+        return (trail[head:], trail[:head])
+
+    def trail_points(self, index: int) -> list[tuple[float, float]]:
+        return [tuple(point) for segment in self.trail_segments(index) for point in segment.tolist()]
+
+    def view(self, index: int) -> "ParticleView":
+        return ParticleView(self, index)
+
+
+def _vector_property(name: str, cast=float):
+    def fget(self):
+        return tuple(cast(v) for v in getattr(self._store, name)[self._index])
+
+    def fset(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(fget, fset)
+
+
+def _scalar_property(name: str):
+    def fget(self):
+        return float(getattr(self._store, name)[self._index])
+
+    def fset(self, value):
+        getattr(self._store, name)[self._index] = value
+
+    return property(fget, fset)
+
+
+class ParticleView:
+    """Visão de uma partícula dentro do ParticleStore, com a API de `Particle`.
+
+    O índice é válido apenas até a próxima compactação do store.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: ParticleStore, index: int):
+        self._store = store
+        self._index = index
+
+    position = _vector_property("position")
+    velocity = _vector_property("velocity")
+    acceleration = _vector_property("acceleration")
+    color = _vector_property("color", int)
+    rotation = _scalar_property("rotation")
+    size = _scalar_property("size")
+    alpha = _scalar_property("alpha")
+    age = _scalar_property("age")
+    lifespan = _scalar_property("lifespan")
+
+    @property
+    def trail(self) -> list[tuple[float, float]]:
+        return self._store.trail_points(self._index)
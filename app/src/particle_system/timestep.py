@@ -0,0 +1,41 @@
+class FixedTimestep:
+    """Acumulador de passo fixo: a simulação sempre avança em passos de ``1 / rate``.
+
+    O tempo real do frame entra no acumulador e sai em passos inteiros, limitados a
+    ``max_substeps`` por frame para que uma travada não vire uma espiral de
+    recuperação. O resto fracionário vira ``alpha``, usado para interpolar as
+    posições entre o passo anterior e o atual na hora de renderizar.
+    """
+
+    def __init__(self, rate: float = 60.0, max_substeps: int = 5):
+        self.rate = rate
+        self.max_substeps = max_substeps
+        self.accumulator = 0.0
+        self.steps = 0  # Total de passos simulados
+        self.dropped = 0.0  # Tempo descartado por exceder max_substeps
+
+    @property
+    def step_dt(self) -> float:
+        return 1.0 / self.rate
+
+    @property
+    def alpha(self) -> float:
+        return min(self.accumulator / self.step_dt, 1.0)
+
+    def advance(self, frame_dt: float) -> int:
+        # Retorna quantos passos fixos devem ser simulados neste frame
+        step_dt = self.step_dt
+        self.accumulator += max(frame_dt, 0.0)
+        steps = int(self.accumulator / step_dt)
+        if steps > self.max_substeps:
+            # Descarta o atraso que não dá para recuperar, mantendo só a fração do passo
+            excess = (steps - self.max_substeps) * step_dt
+            self.dropped += excess
+            self.accumulator -= excess
+            steps = self.max_substeps
+        self.accumulator -= steps * step_dt
+        self.steps += steps
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
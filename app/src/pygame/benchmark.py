@@ -0,0 +1,173 @@
+import os
+
+# Benchmark roda sem janela: driver de vídeo "dummy" do SDL e Surfaces fora da tela
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import itertools
+import json
+import sys
+import time
+
+import numpy as np
+import pygame
+
+from src.pygame.helper import (
+    PARTICLE_COLORS,
+    RENDER_BACKEND_SPRITES,
+    TRAIL_MODE_HISTORY,
+    ParticleGenerator,
+    create_particle_system,
+    render_particle_system,
+    update_particle_system,
+)
+
+
+DEFAULT_COUNTS = (1_000, 10_000, 100_000)
+DEFAULT_FRAMES = 60
+SCREEN_SIZE = (1280, 720)
+PERCENTILES = (50, 90, 99)
+PHASES = ("update", "spawn", "render")
+
+
+def prefill(particle_system, count: int, center: tuple[float, float], speed: float, rng: np.random.Generator):
+    # Preenche o store direto com `count` partículas que não expiram durante a medição
+    store = particle_system.store
+    rows = store.extend(count)
+    angle = rng.uniform(0, 2 * np.pi, count)
+    distance = rng.uniform(0, 200, count)
+    store.position[rows] = np.column_stack((np.cos(angle), np.sin(angle))) * distance[:, None] + center
+    store.previous_position[rows] = store.position[rows]
+    velocity = rng.uniform(speed * 0.5, speed, count)
+    store.velocity[rows] = np.column_stack((np.cos(angle), np.sin(angle))) * velocity[:, None]
+    store.acceleration[rows] = (0, 98.1)
+    store.size[rows] = rng.uniform(2, 4, count)
+    store.color[rows] = np.asarray(PARTICLE_COLORS)[rng.integers(len(PARTICLE_COLORS), size=count)]
+    store.alpha[rows] = 255.0
+    store.lifespan[rows] = 1e9
+
+
+def summarize(samples: list[float], particles: int) -> dict:
+    times = np.asarray(samples)
+    mean = float(times.mean())
+    summary = {f"p{p}_ms": float(np.percentile(times, p) * 1000) for p in PERCENTILES}
+    summary["mean_ms"] = mean * 1000
+    summary["max_ms"] = float(times.max() * 1000)
+    summary["particles_per_second"] = particles / mean if mean > 0 else None
+    return summary
+
+
+def run_case(
+    count: int,
+    bloom: bool,
+    trails: bool,
+    frames: int,
+    warmup: int,
+    seed: int,
+    backend: str = RENDER_BACKEND_SPRITES,
+    trail_mode: str = TRAIL_MODE_HISTORY,
+) -> dict:
+    screen = pygame.Surface(SCREEN_SIZE)
+    center = (SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+    generator = ParticleGenerator(position=center, radius=1e9, spawn_interval=0)
+    generator.bloom_effect = bloom
+    generator.trails_enabled = trails
+    generator.rgb_mode = True
+    generator.render_backend = backend
+    generator.trail_mode = trail_mode
+
+    particle_system = create_particle_system([], capacity=count + 4 * (frames + warmup))
+    prefill(particle_system, count, center, 185.0, np.random.default_rng(seed))
+    dt = 1 / 60
+
+    # Aquecimento: enche as trilhas e o cache de sprites antes de medir
+    for _ in range(warmup):
+        update_particle_system(particle_system, dt, generator)
+    render_particle_system(particle_system, screen, generator)
+
+    samples = {phase: [] for phase in PHASES}
+    spawned = 0
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+
+        start = time.perf_counter()
+        update_particle_system(particle_system, dt, generator)
+        samples["update"].append(time.perf_counter() - start)
+
+        before = len(particle_system.store)
+        start = time.perf_counter()
+        generator.spawn_particle(particle_system, sys.maxsize)
+        samples["spawn"].append(time.perf_counter() - start)
+        spawned += len(particle_system.store) - before
+
+        start = time.perf_counter()
+        render_particle_system(particle_system, screen, generator)
+        samples["render"].append(time.perf_counter() - start)
+
+    frame_times = [sum(phase) for phase in zip(*samples.values())]
+    phases = {phase: summarize(values, count) for phase, values in samples.items()}
+    # Para o spawn, partículas/segundo é a vazão de criação, não o tamanho do sistema
+    phases["spawn"]["particles_per_second"] = spawned / sum(samples["spawn"]) if spawned else 0.0
+    return {
+        "particles": count,
+        "backend": backend,
+        "bloom": bloom,
+        "trails": trails,
+        "trail_mode": trail_mode,
+        "frames": frames,
+        "phases": phases,
+        "frame": summarize(frame_times, count),
+    }
+
+
+def run_benchmark(
+    counts=DEFAULT_COUNTS,
+    frames: int = DEFAULT_FRAMES,
+    warmup: int = 30,
+    seed: int = 0,
+    backends=(RENDER_BACKEND_SPRITES,),
+    trail_modes=(TRAIL_MODE_HISTORY,),
+) -> dict:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    try:
+        cases = [
+            run_case(count, bloom, trails, frames, warmup, seed, backend, trail_mode)
+            for backend, trail_mode, count, bloom, trails in itertools.product(
+                backends, trail_modes, counts, (False, True), (False, True)
+            )
+        ]
+    finally:
+        pygame.quit()
+    return {
+        "screen": list(SCREEN_SIZE),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "python": sys.version.split()[0],
+        "cases": cases,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless de update, spawn e render")
+    parser.add_argument("--counts", type=int, nargs="+", default=list(DEFAULT_COUNTS))
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backends", nargs="+", default=[RENDER_BACKEND_SPRITES], help="sprites e/ou splat")
+    parser.add_argument("--trail-modes", nargs="+", default=[TRAIL_MODE_HISTORY], help="history e/ou persistent")
+    parser.add_argument("--output", help="arquivo JSON de saída (padrão: stdout)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.counts, args.frames, args.warmup, args.seed, args.backends, args.trail_modes)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
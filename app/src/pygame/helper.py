@@ -1,9 +1,25 @@
+from src.particle_system.backends import DEFAULT_BACKEND, create_backend
+from src.particle_system.curves import LifetimeTables
+from src.particle_system.emitter import BurstEmitter
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.integrators import DEFAULT_INTEGRATOR, DEFAULT_MAX_SUBSTEPS, create_integrator
+from src.particle_system.obstacles import ObstacleField
+from src.particle_system.scene import EmitterConfig, LifetimeCurves
 from src.particle_system.schemas import Particle, ParticleSystem
+from src.particle_system.spatial import resolve_collisions
+from src.particle_system.sprites import SpriteCache, default_sprite_cache
+from src.particle_system.store import DEFAULT_CAPACITY, TRAIL_LENGTH, ParticleStore
+from src.pygame.overlay import texts
+from src.pygame.postfx import DEFAULT_LEVELS as BLOOM_LEVELS, BloomPass
+from src.pygame.splat import SplatRenderer
+from src.pygame.trails import PersistentTrails
 import random
 import math
+import numpy as np
 import pygame
 import time
 from collections import deque
+from typing import Optional, Sequence
 
 
 PARTICLE_COLORS = [
@@ -16,6 +32,14 @@ PARTICLE_COLORS = [
     (255, 140, 0), (255, 69, 0),        # Laranja
 ]
 
+# Backends de renderização das partículas
+RENDER_BACKEND_SPRITES = "sprites"  # Um blit de sprite em cache por partícula
+RENDER_BACKEND_SPLAT = "splat"  # Acumulação aditiva em NumPy (SplatRenderer)
+
+# Modos de trilha
+TRAIL_MODE_HISTORY = "history"  # Polilinha com as últimas TRAIL_LENGTH posições de cada partícula
+TRAIL_MODE_PERSISTENT = "persistent"  # Surface que esmaece a cada frame (PersistentTrails)
+
 
 class Slider:
     def __init__(self, x: int, y: int, width: int, height: int, min_val: float, max_val: float, initial_val: float, label: str = "", step: float = 1.0):
@@ -49,10 +73,12 @@ class Slider:
             self.value = round(raw_value / self.step) * self.step
             self.update_handle_position()
 
+    def state(self):
+        return (self.value, self.handle_rect.x)
+
     def draw(self, screen):
-        # Desenha o label
-        font = pygame.font.Font(None, 24)
-        label_text = font.render(f"{self.label}: {self.value:.1f}", True, (255, 255, 255))
+        # Desenha o label (fonte e texto vêm dos caches da camada de UI)
+        label_text = texts.render(f"{self.label}: {self.value:.1f}")
         screen.blit(label_text, (self.rect.x, self.rect.y - 25))
         
         # Desenha a barra do slider
@@ -75,92 +101,176 @@ class Button:
                 return True
         return False
 
+    def state(self):
+        return (self.text, self.is_active)
+
     def draw(self, screen):
         # Desenha o botão
         pygame.draw.rect(screen, self.color if self.is_active else (100, 100, 100), self.rect)
         # Desenha a borda
         pygame.draw.rect(screen, (200, 200, 200), self.rect, 2)
         # Desenha o texto
-        font = pygame.font.Font(None, 24)
-        text = font.render(self.text, True, (255, 255, 255))
+        text = texts.render(self.text)
         text_rect = text.get_rect(center=self.rect.center)
         screen.blit(text, text_rect)
 
 
 class ParticleGenerator:
-    def __init__(self, position: tuple[int, int], radius: float = 50.0, spawn_interval: float = 1.0):
+    def __init__(self, position: tuple[int, int], radius: float = 50.0, spawn_interval: float = 1.0, emission_rate: float = 60.0, index: int = 0):
         self.position = position
         self.radius = radius
         self.spawn_interval = spawn_interval
+        self.emission_rate = emission_rate  # Partículas por segundo no modo contínuo
+        self.index = index  # Valor gravado na coluna `emitter` das partículas deste gerador
+        self.speed = 185.0
+        self.colors: Optional[list[tuple[int, int, int]]] = None  # Paleta própria (cena); sobrepõe o modo RGB
+        self.max_particles: Optional[int] = None  # Limite próprio dentro do pool compartilhado
+        self.show_info = True  # Só o gerador principal mostra o painel de informações
+        self.curves: Optional[LifetimeCurves] = None  # Cor, alpha e tamanho ao longo da vida
+        self.lifetime_tables = LifetimeTables()  # Curvas de todos os emissores (usadas pelo gerador principal)
+        self.emitter = BurstEmitter(rate=emission_rate)
         self.last_spawn_time = 0
-        self.current_particles = 0
+        self.current_particles = 0  # Só para o painel: copiado do buffer mostrado, na thread principal
         self.rgb_mode = False
         self.bloom_effect = False
         self.bloom_intensity = 1.0  # Novo atributo para controlar a intensidade do bloom
         self.trails_enabled = True  # Novo atributo para controlar as trails
+        self.trail_mode = TRAIL_MODE_HISTORY
+        self.trail_length = TRAIL_LENGTH  # Pontos do histórico de trilhas (reduzido pelo governador de qualidade)
+        self.bloom_levels = BLOOM_LEVELS  # Níveis da cadeia de bloom (0 = sem bloom)
+        self.rate_scale = 1.0  # Fração da taxa de emissão aplicada (governador de qualidade)
+        self.persistent_trails: Optional[PersistentTrails] = None
+        self.collisions_enabled = False  # Colisão entre partículas (grade de hash espacial)
+        self.forces = ForceEngine()  # Atratores fixos, vento e arrasto
+        self.obstacles: Optional[ObstacleField] = None  # Obstáculos estáticos da cena (campo de distância)
+        self.magnetic_strength = 500.0  # Força do ímã do botão direito e dos toques
+        self.touch_points: dict[int, Attractor] = {}  # Um atrator por dedo na tela
+        self.render_backend = RENDER_BACKEND_SPRITES
+        self.splat_renderer: Optional[SplatRenderer] = None
+        self.bloom_pass: Optional[BloomPass] = None  # Bloom em espaço de tela (ver render_particle_system)
+
+    @classmethod
+    def from_config(cls, config: EmitterConfig, index: int) -> "ParticleGenerator":
+        generator = cls(position=config.position, radius=config.radius, emission_rate=config.rate, index=index)
+        generator.speed = config.speed
+        generator.rgb_mode = config.rgb
+        generator.colors = config.palette
+        generator.max_particles = config.max_particles
+        generator.curves = config.curves
+        if config.gravity is not None:
+            generator.emitter.acceleration = config.gravity
+        if config.lifespan is not None:
+            generator.emitter.lifespan_range = config.lifespan
+        return generator
 
     def can_spawn(self, current_time: float) -> bool:
         return current_time - self.last_spawn_time >= self.spawn_interval
 
+    @property
+    def palette(self) -> list[tuple[int, int, int]]:
+        # Paleta da cena, cores sorteadas no modo RGB ou branco por padrão
+        if self.colors:
+            return self.colors
+        return PARTICLE_COLORS if self.rgb_mode else [(255, 255, 255)]
+
+    def emit(self, particle_system: ParticleSystem, dt: float, max_particles: int, particle_speed: Optional[float] = None) -> int:
+        # Emissão contínua a `emission_rate` partículas por segundo, direto no store
+        store = particle_system.store
+        current = particle_system.emitter_counts.get(self.index, 0)
+        if self.max_particles is not None:
+            max_particles = min(max_particles, len(store) + self.max_particles - current)
+        self.emitter.rate = self.emission_rate * self.rate_scale
+        speed = self.speed if particle_speed is None else particle_speed
+        # A taxa decide quantas; o backend da simulação escreve a rajada no store
+        emitted = min(self.emitter.pending(dt), max(int(max_particles) - len(store), 0))
+        particle_system.spawn(self.emitter, emitted, self.position, speed, self.palette, self.index)
+        particle_system.emitter_counts[self.index] = current + emitted
+        return emitted
+
     def spawn_particle(self, particle_system: ParticleSystem, max_particles: int, particle_speed: float = 100.0):
         # Determinar quantas partículas serão geradas (1 a 4)
-        num_particles = random.randint(1, 4)
+        num_particles = int(self.emitter.rng.integers(1, 5))
         
         # Verificar se há espaço suficiente para todas as partículas
-        if self.current_particles + num_particles > max_particles:
+        current = particle_system.emitter_counts.get(self.index, 0)
+        if current + num_particles > max_particles:
             return
 
-        for _ in range(num_particles):
-            # Gerar ângulo aleatório
-            angle = random.uniform(0, 2 * math.pi)
-            
-            # Calcular velocidade baseada no ângulo
-            speed = random.uniform(particle_speed * 0.5, particle_speed)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            # Gerar cor
-            if self.rgb_mode:
-                color = random.choice(PARTICLE_COLORS)
-            else:
-                color = (255, 255, 255)  # Branco por padrão
-            
-            # Criar partícula
-            particle = Particle(
-                position=self.position,  # Agora sempre spawna do centro
-                velocity=(vx, vy),
-                acceleration=(0, 98.1),  # Gravidade
-                rotation=0,
-                size=random.uniform(2, 4),
-                color=color,
-                alpha=255.0,
-                lifespan=random.uniform(2, 4)
-            )
-            
-            particle_system.particles.append(particle)
-            self.current_particles += 1
+        # Gerar a rajada inteira de uma vez, sempre do centro
+        particle_system.spawn(self.emitter, num_particles, self.position, particle_speed, self.palette, self.index)
+        particle_system.emitter_counts[self.index] = current + num_particles
         
         self.last_spawn_time = pygame.time.get_ticks() / 1000.0
 
-    def draw(self, screen: pygame.Surface):
-        # Desenhar círculo do gerador
-        pygame.draw.circle(screen, (255, 255, 255), self.position, self.radius, 2)
-        
-        # Desenhar informações
-        font = pygame.font.Font(None, 24)
-        info_text = [
+    def handle_touch(self, event, screen_size: tuple[int, int]):
+        # Cada dedo na tela vira um atrator enquanto estiver pressionado
+        if event.type in (pygame.FINGERDOWN, pygame.FINGERMOTION):
+            position = (event.x * screen_size[0], event.y * screen_size[1])
+            touch = self.touch_points.get(event.finger_id)
+            if touch is None:
+                self.touch_points[event.finger_id] = Attractor(position=position, strength=self.magnetic_strength)
+            else:
+                touch.position = position
+        elif event.type == pygame.FINGERUP:
+            self.touch_points.pop(event.finger_id, None)
+
+    def attractors(self) -> list[Attractor]:
+        # Atratores do frame: toques na tela e o ímã do mouse (botão direito)
+        attractors = list(self.touch_points.values())
+        if pygame.mouse.get_pressed()[2]:
+            attractors.append(Attractor(position=pygame.mouse.get_pos(), strength=self.magnetic_strength))
+        return attractors
+
+    def controls(self) -> dict:
+        # Configuração do gerador e entrada do ímã no frame (gravada junto com as partículas)
+        return {
+            "position": list(self.position),
+            "radius": self.radius,
+            "emission_rate": self.emission_rate,
+            "rgb_mode": self.rgb_mode,
+            "bloom_effect": self.bloom_effect,
+            "bloom_intensity": self.bloom_intensity,
+            "trails_enabled": self.trails_enabled,
+            "trail_mode": self.trail_mode,
+            "collisions_enabled": self.collisions_enabled,
+            "attractors": [attractor.model_dump() for attractor in self.attractors()],
+        }
+
+    def apply_controls(self, controls: dict):
+        # Aplica controles gravados (replay); o ímã é só informativo, pois não há física
+        self.position = tuple(controls["position"])
+        self.radius = controls["radius"]
+        self.emission_rate = controls["emission_rate"]
+        self.rgb_mode = controls["rgb_mode"]
+        self.bloom_effect = controls["bloom_effect"]
+        self.bloom_intensity = controls["bloom_intensity"]
+        self.trails_enabled = controls["trails_enabled"]
+        self.trail_mode = controls.get("trail_mode", TRAIL_MODE_HISTORY)
+        self.collisions_enabled = controls["collisions_enabled"]
+
+    def info_lines(self) -> list[str]:
+        return [
             f"Partículas: {self.current_particles}",
             f"Raio: {self.radius:.1f}",
-            f"Intervalo: {self.spawn_interval:.1f}s",
+            f"Taxa: {self.emission_rate:.0f}/s",
             f"RGB: {'Ativado' if self.rgb_mode else 'Desativado'}",
             f"Bloom: {'Ativado' if self.bloom_effect else 'Desativado'}",
             f"Tamanho: {self.bloom_intensity:.1f}x",
             f"Trails: {'Ativado' if self.trails_enabled else 'Desativado'}"
         ]
+
+    def state(self):
+        return (self.position, self.radius, *self.info_lines())
+
+    def draw(self, screen: pygame.Surface):
+        # Desenhar círculo do gerador
+        pygame.draw.circle(screen, (255, 255, 255), self.position, self.radius, 2)
         
-        for i, text in enumerate(info_text):
-            text_surface = font.render(text, True, (255, 255, 255))
-            screen.blit(text_surface, (10, 10 + i * 25))
+        # Desenhar informações
+        if not self.show_info:
+            return
+        for i, text in enumerate(self.info_lines()):
+            screen.blit(texts.render(text), (10, 10 + i * 25))
 
 
 def create_particle(
@@ -183,12 +293,28 @@ def create_particle(
         color=color,
         alpha=alpha,
         lifespan=lifespan,
-        trail=trail or deque(maxlen=30)
+        trail=trail or deque(maxlen=TRAIL_LENGTH)
     )
 
 
-def create_particle_system(particles: list[Particle]) -> ParticleSystem:
-    return ParticleSystem(particles=particles)
+def create_particle_system(
+    particles: list[Particle],
+    capacity: int = DEFAULT_CAPACITY,
+    trail_length: int = TRAIL_LENGTH,
+    workers: int = 1,
+    backend: str = DEFAULT_BACKEND,
+    integrator: str = DEFAULT_INTEGRATOR,
+    integrator_substeps: int = DEFAULT_MAX_SUBSTEPS,
+) -> ParticleSystem:
+    # A memória das trilhas é fixa por capacidade: ParticleStore.trail_nbytes_for(capacity, trail_length)
+    store = ParticleStore(capacity=max(capacity, len(particles)), trail_length=trail_length)
+    # Com mais de um worker, o backend vetorizado divide o passo de simulação entre threads
+    return ParticleSystem(
+        particles=particles,
+        store=store,
+        backend=create_backend(backend, workers),
+        integrator=create_integrator(integrator, integrator_substeps),
+    )
 
 
 def generate_particles(
@@ -234,83 +360,152 @@ def generate_particles(
     return particles
 
 
-def update_particle_system(particle_system: ParticleSystem, dt: float, generator: ParticleGenerator):
-    # Atualiza as partículas e conta quantas morreram
-    dead_particles = 0
-    initial_count = len(particle_system.particles)
-    
-    # Verificar se o botão direito está pressionado
-    mouse_pos = pygame.mouse.get_pos()
-    is_magnetic = pygame.mouse.get_pressed()[2]  # Botão direito
-    
-    for particle in particle_system.particles[:]:
-        # Verificar se a partícula saiu do raio do gerador
-        dx = particle.position[0] - generator.position[0]
-        dy = particle.position[1] - generator.position[1]
-        distance = math.sqrt(dx * dx + dy * dy)
-        
-        if distance > generator.radius:
-            particle_system.particles.remove(particle)
-            dead_particles += 1
-            continue
-        
-        # Atualizar partícula e remover se morreu
-        if not particle.update(dt, mouse_pos if is_magnetic else None, is_magnetic):
-            particle_system.particles.remove(particle)
-            dead_particles += 1
-    
-    # Atualiza o contador do gerador considerando todas as partículas que morreram
-    final_count = len(particle_system.particles)
-    generator.current_particles = final_count
-
-
-def render_particle_system(particle_system: ParticleSystem, screen, generator: ParticleGenerator):
-    for particle in particle_system.particles:
-        # Renderizar trilha (sempre com a cor original da partícula)
-        if generator.trails_enabled and len(particle.trail) > 1:
-            points = list(particle.trail)
-            # Desenhar trilha normal com a cor da partícula
-            pygame.draw.lines(screen, particle.color, False, points, 2)
-
-        # Calcular tamanho base da partícula
-        base_size = particle.size * generator.bloom_intensity
-
-        # Renderizar partícula
-        if generator.bloom_effect:
-            # Efeito de bloom
-            for i in range(8):  # Aumentado para 8 camadas para mais blur
-                size = base_size * (1 + i * 1.2)  # Aumentado o incremento para mais blur
-                alpha = int(particle.alpha * (1 - i * 0.15))  # Reduzido a perda de alpha para mais blur
-                alpha = min(max(alpha, 0), 255)
-                
-                # Camada de brilho branco
-                surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-                white_alpha = min(max(alpha // 3, 0), 255)
-                pygame.draw.circle(
-                    surf,
-                    (255, 255, 255, white_alpha),
-                    (int(size), int(size)),
-                    int(size)
-                )
-                screen.blit(surf, (particle.position[0] - size, particle.position[1] - size))
-                
-                # Camada com cor da partícula
-                surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    surf,
-                    (*[int(c) for c in particle.color], alpha),
-                    (int(size), int(size)),
-                    int(size)
-                )
-                screen.blit(surf, (particle.position[0] - size, particle.position[1] - size))
-        else:
-            # Partícula normal
-            surf = pygame.Surface((int(base_size * 2), int(base_size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(
-                surf,
-                (*[int(c) for c in particle.color], int(min(max(particle.alpha, 0), 255))),
-                (int(base_size), int(base_size)),
-                int(base_size)
-            )
-            screen.blit(surf, (particle.position[0] - base_size, particle.position[1] - base_size))
+def draw_trail(screen: pygame.Surface, color, segments, width: int = 2):
+    # Os trechos são views do ring buffer; quando a trilha deu a volta, liga a emenda entre eles
+    if len(segments) == 2:
+        pygame.draw.line(screen, color, segments[0][-1], segments[1][0], width)
+    for points in segments:
+        if len(points) > 1:
+            pygame.draw.lines(screen, color, False, points, width)
+
+
+def update_particle_system(
+    particle_system: ParticleSystem,
+    dt: float,
+    generator: ParticleGenerator,
+    emitters: Optional[Sequence[ParticleGenerator]] = None,
+    attractors: Optional[Sequence[Attractor]] = None,
+    trail_length: Optional[int] = None,
+) -> int:
+    # `generator` é o gerador principal (forças, ímã, opções de renderização); `emitters`
+    # são todos os geradores que escrevem no pool, indexados pela coluna `emitter`;
+    # `attractors` sobrepõe a leitura do ímã e dos toques (entrada capturada na fronteira do frame)
+    # e `trail_length` o tamanho do histórico de trilhas (o modo em pipeline passa 0: as trilhas
+    # ficam só no buffer que a tela lê)
+    emitters = list(emitters) if emitters else [generator]
+
+    # O histórico de posições só existe no modo de polilinhas; no modo persistente a
+    # memória das trilhas não depende do número de partículas
+    if trail_length is None:
+        trail_length = generator.trail_length if generator.trail_mode == TRAIL_MODE_HISTORY else 0
+    particle_system.store.set_trail_length(trail_length)
+
+    # Culling pelo raio do gerador de cada partícula (uma passada só, com um centro e um
+    # raio por emissor), expiração e integração em operações de array;
+    # o ímã do mouse e os toques entram como atratores somados à gravidade
+    if len(emitters) == 1:
+        center, radius = emitters[0].position, emitters[0].radius
+    else:
+        center = np.array([emitter.position for emitter in emitters], dtype=np.float32)
+        radius = np.array([emitter.radius for emitter in emitters], dtype=np.float32)
+    dead_particles = particle_system.step(
+        dt,
+        generator.forces,
+        generator.attractors() if attractors is None else attractors,
+        center=center,
+        radius=radius,
+    )
+
+    # Colisão entre partículas usando os pares candidatos da grade de hash espacial
+    if generator.collisions_enabled:
+        store = particle_system.store
+        n = len(store)
+        resolve_collisions(store.position[:n], store.velocity[:n], store.size[:n])
+
+    # Obstáculos da cena: uma amostragem do campo de distância por partícula, por último para
+    # que nenhuma partícula termine o passo dentro de um obstáculo
+    if generator.obstacles is not None:
+        store = particle_system.store
+        n = len(store)
+        generator.obstacles.resolve(store.position[:n], store.velocity[:n], store.size[:n])
+
+    # Recontagem por emissor depois das mortes, guardada no próprio sistema (e não nos geradores,
+    # que a thread principal lê enquanto o modo em pipeline simula)
+    store = particle_system.store
+    counts = np.bincount(store.emitter[:len(store)], minlength=len(emitters))
+    particle_system.emitter_counts = dict(enumerate(counts.tolist()))
+    return dead_particles
+
+
+def create_obstacle_surface(obstacles: ObstacleField, color: tuple[int, int, int] = (70, 70, 80)) -> pygame.Surface:
+    # Desenho dos obstáculos, feito uma vez a partir da grade assada (sólido = `color`, o resto transparente)
+    rows, columns = obstacles.solid.shape
+    cells = pygame.Surface((columns, rows), pygame.SRCALPHA)
+    cells.fill((*color, 255))
+    alpha = pygame.surfarray.pixels_alpha(cells)
+    alpha[:] = np.where(obstacles.solid.T, 255, 0)
+    del alpha  # Libera o lock da Surface
+    width, height = obstacles.size
+    return pygame.transform.smoothscale(cells, (int(width), int(height)))
+
+
+def emit_particles(
+    particle_system: ParticleSystem,
+    dt: float,
+    emitters: Sequence[ParticleGenerator],
+    max_particles: int,
+) -> int:
+    # Todos os geradores emitem no mesmo pool, respeitando o limite total
+    return sum(emitter.emit(particle_system, dt, max_particles) for emitter in emitters)
+
+
+def render_particle_system(
+    particle_system: ParticleSystem,
+    screen,
+    generator: ParticleGenerator,
+    sprite_cache: SpriteCache = default_sprite_cache,
+    interpolation: float = 1.0,
+    frame_dt: float = 1 / 60,
+    emitters: Optional[Sequence[ParticleGenerator]] = None,
+) -> int:
+    # `interpolation` é a fração do passo fixo já decorrida (ver FixedTimestep.alpha);
+    # `frame_dt` é o tempo simulado desde o último frame (tamanho do trecho das trilhas persistentes);
+    # `emitters` são os geradores do pool, com as curvas de vida de cada um
+    store = particle_system.store
+    n = len(store)
+    positions = store.interpolated_position(interpolation)
+
+    # Cor, alpha e tamanho na idade atual de cada partícula, lidos das tabelas das curvas
+    # (as tabelas só são refeitas quando alguma curva muda)
+    generator.lifetime_tables.update([emitter.curves for emitter in (emitters or [generator])])
+    colors, alphas, sizes = generator.lifetime_tables.sample(store)
+    sizes = sizes * generator.bloom_intensity
+
+    # Renderizar trilhas (sempre com a cor original da partícula)
+    if generator.trails_enabled and generator.trail_mode == TRAIL_MODE_PERSISTENT:
+        if generator.persistent_trails is None or generator.persistent_trails.size != screen.get_size():
+            generator.persistent_trails = PersistentTrails(screen.get_size())
+        generator.persistent_trails.update(positions, store.velocity[:n], store.color[:n], frame_dt)
+        generator.persistent_trails.composite(screen)
+    else:
+        # Fora do modo persistente a Surface é descartada, para recomeçar vazia
+        generator.persistent_trails = None
+        if generator.trails_enabled:
+            trail_colors = store.color[:n].tolist()
+            for index, trail_size in enumerate(store.trail_size[:n].tolist()):
+                if trail_size > 1:
+                    # Desenhar trilha normal com a cor da partícula, lendo direto do ring buffer
+                    draw_trail(screen, trail_colors[index], store.trail_segments(index), 2)
+
+    # Backend de splat: todas as partículas acumuladas num buffer NumPy e somadas à tela de uma vez
+    if generator.render_backend == RENDER_BACKEND_SPLAT:
+        if generator.splat_renderer is None or generator.splat_renderer.size != screen.get_size():
+            generator.splat_renderer = SplatRenderer(screen.get_size())
+        generator.splat_renderer.render(screen, positions, sizes, colors, alphas)
+        blits = 1
+    else:
+        # Renderizar partículas: um sprite de círculo em cache e um blit por partícula
+        sprites = []
+        for (x, y), size, color, alpha in zip(positions.tolist(), sizes.tolist(), map(tuple, colors.tolist()), alphas.tolist()):
+            sprite = sprite_cache.circle(size, color, alpha)
+            sprites.append((sprite, (x - sprite.get_width() / 2, y - sprite.get_height() / 2)))
+        screen.blits(sprites, doreturn=False)
+        blits = len(sprites)
 
+    # Bloom: um passe sobre a tela inteira, com custo que não depende do número de partículas
+    if generator.bloom_effect and generator.bloom_levels > 0:
+        bloom_pass = generator.bloom_pass
+        if bloom_pass is None or bloom_pass.size != screen.get_size() or bloom_pass.levels != generator.bloom_levels:
+            generator.bloom_pass = BloomPass(screen.get_size(), levels=generator.bloom_levels)
+        generator.bloom_pass.apply(screen)
+    return blits
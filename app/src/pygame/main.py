@@ -1,6 +1,10 @@
+import os
+import sys
+from typing import Optional
+
 import pygame
-from src.particle_system.schemas import Particle, ParticleSystem
-from src.pygame.helper import *
+
+from src.startup import StartupTimer
 
 # Constantes de layout
 SCREEN_WIDTH = 1280
@@ -14,177 +18,505 @@ SLIDER_SPACING = 50
 BUTTON_SPACING = 110
 INFO_SPACING = 25
 
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.NOFRAME)
-clock = pygame.time.Clock()
-running = True
-last_time = pygame.time.get_ticks() / 1000.0
-
-# Criar sliders
-particle_limit_slider = Slider(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 4,
-    width=SLIDER_WIDTH,
-    height=SLIDER_HEIGHT,
-    min_val=10,
-    max_val=1000,
-    initial_val=315,
-    label="Limite de Partículas"
-)
-
-generator_radius_slider = Slider(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 5,
-    width=SLIDER_WIDTH,
-    height=SLIDER_HEIGHT,
-    min_val=10,
-    max_val=350,
-    initial_val=110,
-    label="Raio do Gerador"
-)
-
-spawn_interval_slider = Slider(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 6,
-    width=SLIDER_WIDTH,
-    height=SLIDER_HEIGHT,
-    min_val=0,
-    max_val=5,
-    initial_val=1.5,
-    label="Intervalo de Geração",
-    step=0.5
-)
-
-speed_slider = Slider(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 7,
-    width=SLIDER_WIDTH,
-    height=SLIDER_HEIGHT,
-    min_val=50,
-    max_val=500,
-    initial_val=185,
-    label="Velocidade"
-)
-
-bloom_intensity_slider = Slider(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 8,
-    width=SLIDER_WIDTH,
-    height=SLIDER_HEIGHT,
-    min_val=1,
-    max_val=3.0,
-    initial_val=1.0,
-    label="Tamanho"
-)
-
-# Criar botões
-rgb_button = Button(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 9,
-    width=BUTTON_WIDTH,
-    height=BUTTON_HEIGHT,
-    text="RGB",
-    color=(255, 0, 0)
-)
-
-bloom_button = Button(
-    x=MARGIN + BUTTON_SPACING,
-    y=MARGIN + SLIDER_SPACING * 9,
-    width=BUTTON_WIDTH,
-    height=BUTTON_HEIGHT,
-    text="Bloom",
-    color=(0, 255, 0)
-)
-
-trails_button = Button(
-    x=MARGIN + BUTTON_SPACING * 2,
-    y=MARGIN + SLIDER_SPACING * 9,
-    width=BUTTON_WIDTH,
-    height=BUTTON_HEIGHT,
-    text="Trails",
-    color=(0, 0, 255)
-)
-
-exit_button = Button(
-    x=MARGIN,
-    y=MARGIN + SLIDER_SPACING * 10,
-    width=SLIDER_WIDTH,
-    height=BUTTON_HEIGHT,
-    text="Sair",
-    color=(255, 0, 0)
-)
-
-# Inicializar gerador de partículas
-generator = ParticleGenerator(
-    position=(screen.get_width() // 2 + 100, screen.get_height() // 2),
-    radius=generator_radius_slider.value,
-    spawn_interval=spawn_interval_slider.value
-)
-
-# Criar sistema de partículas vazio
-particle_system = create_particle_system([])
-
-while running:
-    current_time = pygame.time.get_ticks() / 1000.0
-    dt = current_time - last_time
-    last_time = current_time
-
-    # Processar eventos
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        
-        # Atualizar sliders
-        particle_limit_slider.handle_event(event)
-        generator_radius_slider.handle_event(event)
-        spawn_interval_slider.handle_event(event)
-        speed_slider.handle_event(event)
-        bloom_intensity_slider.handle_event(event)
-        
-        # Atualizar botões
-        rgb_button.handle_event(event)
-        bloom_button.handle_event(event)
-        trails_button.handle_event(event)
-        if exit_button.handle_event(event):
-            running = False
-        
-        # Atualizar gerador
-        generator.radius = generator_radius_slider.value
-        generator.spawn_interval = spawn_interval_slider.value
-        generator.rgb_mode = rgb_button.is_active
-        generator.bloom_effect = bloom_button.is_active
-        generator.bloom_intensity = bloom_intensity_slider.value
-        generator.trails_enabled = trails_button.is_active
-
-    # Limpar tela
-    screen.fill((0, 0, 0))
+# Simulação em passo fixo, independente do FPS da tela
+SIMULATION_RATE = 60
+MAX_SUBSTEPS = 5
+
+# Threads da simulação (1 = tudo na thread principal); definido na inicialização
+SIMULATION_WORKERS = int(os.environ.get("PARTICLE_SIMULATION_WORKERS", "1"))
+
+# Backend da física (ver src/particle_system/backends.py): "vectorized" ou "reference"
+SIMULATION_BACKEND = os.environ.get("PARTICLE_BACKEND", "vectorized")
+
+# Integrador (ver src/particle_system/integrators.py): "euler", "verlet" ou "rk4", e o máximo
+# de subpassos por partícula sob forças fortes (1 desliga os subpassos adaptativos)
+SIMULATION_INTEGRATOR = os.environ.get("PARTICLE_INTEGRATOR", "euler")
+INTEGRATOR_SUBSTEPS = int(os.environ.get("PARTICLE_INTEGRATOR_SUBSTEPS", "8"))
 
-    # Atualizar sistema de partículas
-    update_particle_system(particle_system, dt, generator)
+# Pipeline: simula o próximo frame numa thread enquanto renderiza o atual (um frame de latência)
+SIMULATION_PIPELINED = os.environ.get("PARTICLE_PIPELINED", "0") != "0"
 
-    # Gerar novas partículas
-    if generator.can_spawn(current_time):
-        generator.spawn_particle(particle_system, particle_limit_slider.value, speed_slider.value)
+# Trace de desempenho (.json ou .csv) gravado ao sair; vazio = sem trace
+PROFILE_TRACE_FILE = os.environ.get("PARTICLE_PROFILE_TRACE", "")
 
-    # Renderizar sistema de partículas
-    render_particle_system(particle_system, screen, generator)
+# Gravação do estado da simulação e replay de uma gravação (sem física)
+RECORD_FILE = os.environ.get("PARTICLE_RECORD", "")
+REPLAY_FILE = os.environ.get("PARTICLE_REPLAY", "")
 
-    # Renderizar gerador
-    generator.draw(screen)
+# Governador de qualidade (0 desliga) e ajustes fixados, ex.: "bloom=0,trails=2"
+QUALITY_GOVERNOR = os.environ.get("PARTICLE_QUALITY_GOVERNOR", "1") != "0"
+QUALITY_PINS = os.environ.get("PARTICLE_QUALITY_PIN", "")
 
-    # Renderizar controles
-    particle_limit_slider.draw(screen)
-    generator_radius_slider.draw(screen)
-    spawn_interval_slider.draw(screen)
-    speed_slider.draw(screen)
-    bloom_intensity_slider.draw(screen)
-    rgb_button.draw(screen)
-    bloom_button.draw(screen)
-    trails_button.draw(screen)
-    exit_button.draw(screen)
+# Cena com vários emissores (JSON, ver src/particle_system/scene.py); vazio = um gerador no centro
+SCENE_FILE = os.environ.get("PARTICLE_SCENE", "")
 
-    # Atualizar tela
+
+def show_loading_frame(screen: pygame.Surface):
+    # Primeiro frame da janela, desenhado só com pygame
+    from src.pygame.overlay import texts
+
+    screen.fill((0, 0, 0))
+    text = texts.render("Carregando...")
+    screen.blit(text, text.get_rect(center=screen.get_rect().center))
     pygame.display.flip()
-    clock.tick(60)
 
-pygame.quit()
+
+def main(
+    scene_file: str = SCENE_FILE,
+    workers: int = SIMULATION_WORKERS,
+    backend: str = SIMULATION_BACKEND,
+    integrator: str = SIMULATION_INTEGRATOR,
+    integrator_substeps: int = INTEGRATOR_SUBSTEPS,
+    pipelined: bool = SIMULATION_PIPELINED,
+    record_file: str = RECORD_FILE,
+    replay_file: str = REPLAY_FILE,
+    profile_trace_file: str = PROFILE_TRACE_FILE,
+    quality_governor: bool = QUALITY_GOVERNOR,
+    quality_pins: str = QUALITY_PINS,
+    max_frames: Optional[int] = None,
+    frame_rate: int = 60,
+    headless: bool = False,
+    seed: int = 0,
+    startup: Optional[StartupTimer] = None,
+):
+    # Roda a simulação até o usuário sair (ou por `max_frames` frames) e retorna o FrameProfiler;
+    # `frame_rate` 0 não limita o FPS. `headless` torna a execução reproduzível: cada frame avança
+    # exatamente um passo de SIMULATION_RATE em vez de ler o relógio, os emissores sorteiam com
+    # `seed` e o governador de qualidade (que mede tempo real) fica desligado
+    startup = startup or StartupTimer()
+
+    # A janela e um primeiro frame aparecem antes de importar pydantic e os módulos da simulação e da
+    # interface (o NumPy já vem com o pygame)
+    pygame.display.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.NOFRAME)
+    startup.mark("window")
+    show_loading_frame(screen)
+    startup.mark("first_frame")
+    pygame.init()
+
+    import numpy as np
+
+    from src.particle_system.timestep import FixedTimestep
+    from src.pygame.helper import (
+        RENDER_BACKEND_SPLAT,
+        RENDER_BACKEND_SPRITES,
+        TRAIL_MODE_HISTORY,
+        TRAIL_MODE_PERSISTENT,
+        Button,
+        ParticleGenerator,
+        Slider,
+        create_obstacle_surface,
+        create_particle_system,
+        default_sprite_cache,
+        emit_particles,
+        render_particle_system,
+        update_particle_system,
+    )
+    from src.pygame.overlay import UIOverlay, texts
+    from src.pygame.profiler import FrameProfiler, ProfilerHUD
+    from src.pygame.quality import QualityGovernor, parse_pins
+
+    scene = None
+    if scene_file:
+        from src.particle_system.scene import load_scene
+        scene = load_scene(scene_file)
+
+    clock = pygame.time.Clock()
+    running = True
+    last_time = pygame.time.get_ticks() / 1000.0
+
+    # Criar sliders
+    particle_limit_slider = Slider(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 4,
+        width=SLIDER_WIDTH,
+        height=SLIDER_HEIGHT,
+        min_val=10,
+        max_val=100000,
+        initial_val=scene.max_particles if scene else 315,
+        label="Limite de Partículas",
+        step=5
+    )
+
+    generator_radius_slider = Slider(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 5,
+        width=SLIDER_WIDTH,
+        height=SLIDER_HEIGHT,
+        min_val=10,
+        max_val=350,
+        initial_val=110,
+        label="Raio do Gerador"
+    )
+
+    emission_rate_slider = Slider(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 6,
+        width=SLIDER_WIDTH,
+        height=SLIDER_HEIGHT,
+        min_val=0,
+        max_val=20000,
+        initial_val=60,
+        label="Taxa de Emissão (/s)",
+        step=10
+    )
+
+    speed_slider = Slider(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 7,
+        width=SLIDER_WIDTH,
+        height=SLIDER_HEIGHT,
+        min_val=50,
+        max_val=500,
+        initial_val=185,
+        label="Velocidade"
+    )
+
+    bloom_intensity_slider = Slider(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 8,
+        width=SLIDER_WIDTH,
+        height=SLIDER_HEIGHT,
+        min_val=1,
+        max_val=3.0,
+        initial_val=1.0,
+        label="Tamanho"
+    )
+
+    # Criar botões
+    rgb_button = Button(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 9,
+        width=BUTTON_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="RGB",
+        color=(255, 0, 0)
+    )
+
+    bloom_button = Button(
+        x=MARGIN + BUTTON_SPACING,
+        y=MARGIN + SLIDER_SPACING * 9,
+        width=BUTTON_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="Bloom",
+        color=(0, 255, 0)
+    )
+
+    trails_button = Button(
+        x=MARGIN + BUTTON_SPACING * 2,
+        y=MARGIN + SLIDER_SPACING * 9,
+        width=BUTTON_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="Trails",
+        color=(0, 0, 255)
+    )
+
+    collisions_button = Button(
+        x=MARGIN + BUTTON_SPACING * 3,
+        y=MARGIN + SLIDER_SPACING * 9,
+        width=BUTTON_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="Colisão",
+        color=(255, 255, 0)
+    )
+
+    exit_button = Button(
+        x=MARGIN,
+        y=MARGIN + SLIDER_SPACING * 10,
+        width=SLIDER_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="Sair",
+        color=(255, 0, 0)
+    )
+
+    splat_button = Button(
+        x=MARGIN + BUTTON_SPACING * 2,
+        y=MARGIN + SLIDER_SPACING * 10,
+        width=BUTTON_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="Splat",
+        color=(0, 255, 255)
+    )
+
+    persistent_trails_button = Button(
+        x=MARGIN + BUTTON_SPACING * 3,
+        y=MARGIN + SLIDER_SPACING * 10,
+        width=BUTTON_WIDTH,
+        height=BUTTON_HEIGHT,
+        text="Rastro",
+        color=(255, 0, 255)
+    )
+
+    # Inicializar geradores de partículas: o primeiro é o principal, controlado pelos sliders
+    if scene is not None:
+        emitters = [ParticleGenerator.from_config(config, index) for index, config in enumerate(scene.emitters)]
+        for emitter in emitters[1:]:
+            emitter.show_info = False
+        generator = emitters[0]
+        generator_radius_slider.value = generator.radius
+        emission_rate_slider.value = generator.emission_rate
+        speed_slider.value = generator.speed
+        rgb_button.is_active = generator.rgb_mode
+        for slider in (particle_limit_slider, generator_radius_slider, emission_rate_slider, speed_slider):
+            slider.update_handle_position()
+    else:
+        generator = ParticleGenerator(
+            position=(screen.get_width() // 2 + 100, screen.get_height() // 2),
+            radius=generator_radius_slider.value,
+            emission_rate=emission_rate_slider.value
+        )
+        emitters = [generator]
+    if headless:
+        for emitter in emitters:
+            emitter.emitter.rng = np.random.default_rng(seed + emitter.index)
+
+    # Obstáculos da cena assados uma vez num campo de distância do tamanho da tela
+    obstacle_surface = None
+    if scene is not None and scene.obstacles:
+        from src.particle_system.obstacles import ObstacleField
+
+        generator.obstacles = ObstacleField.bake(
+            scene.obstacles,
+            screen.get_size(),
+            scene.obstacle_cell,
+            scene.restitution,
+            scene.friction,
+            base_dir=os.path.dirname(os.path.abspath(scene_file)),
+        )
+        obstacle_surface = create_obstacle_surface(generator.obstacles)
+
+    # Gravidade mútua entre as partículas: custa dezenas de ms por passo, então só roda sem janela
+    # (a cena é gravada em headless e a janela reproduz a gravação)
+    if scene is not None and scene.nbody is not None:
+        if headless:
+            from src.particle_system.nbody import BarnesHut
+
+            generator.forces.nbody = BarnesHut(**scene.nbody.model_dump())
+        elif not replay_file:
+            print("a gravidade mútua (nbody) da cena só roda no modo headless; ignorada", file=sys.stderr)
+
+    # Criar sistema de partículas vazio
+    particle_system = create_particle_system(
+        [], workers=workers, backend=backend, integrator=integrator, integrator_substeps=integrator_substeps
+    )
+
+    # Camada de interface com gerador, sliders e botões
+    overlay = UIOverlay(
+        screen.get_size(),
+        [
+            *emitters,
+            particle_limit_slider,
+            generator_radius_slider,
+            emission_rate_slider,
+            speed_slider,
+            bloom_intensity_slider,
+            rgb_button,
+            bloom_button,
+            trails_button,
+            collisions_button,
+            exit_button,
+            splat_button,
+            persistent_trails_button,
+        ],
+    )
+
+    # Medição de tempo por fase e painel de desempenho (F3)
+    profiler = FrameProfiler(trace=bool(profile_trace_file))
+    profiler_hud = ProfilerHUD(position=(SCREEN_WIDTH - 320, MARGIN))
+
+    # Acumulador de passo fixo da simulação
+    timestep = FixedTimestep(rate=SIMULATION_RATE, max_substeps=MAX_SUBSTEPS)
+
+    # Reduz bloom, trilhas, limite e taxa de partículas quando o frame passa do orçamento
+    governor = QualityGovernor(target_fps=60)
+    governor.enabled = quality_governor and not headless
+    pins, errors = parse_pins(quality_pins, governor.knobs)
+    for error in errors:
+        print(f"PARTICLE_QUALITY_PIN/--pin: {error}; ignorado", file=sys.stderr)
+    for name, step in pins.items():
+        governor.pin(name, step)
+
+    # Gravação e replay só carregam o módulo quando pedidos
+    recorder = replay = None
+    if record_file or replay_file:
+        from src.particle_system.recording import Recorder, Replay
+        recorder = Recorder(record_file) if record_file else None
+        replay = Replay(replay_file) if replay_file else None
+    replay_frame = 0
+
+    def simulate(system, steps: int, attractors, particle_cap: int, alpha: float):
+        # Passos fixos do frame; no modo em pipeline roda na thread de simulação
+        culled = spawned = 0
+        for _ in range(steps):
+            culled += update_particle_system(system, timestep.step_dt, generator, emitters, attractors, trail_length=0)
+            spawned += emit_particles(system, timestep.step_dt, emitters, particle_cap)
+        return culled, spawned, alpha
+
+    # No modo em pipeline (sem replay) o frame mostra o estado simulado durante o frame anterior
+    pipeline = None
+    if pipelined and replay is None:
+        from src.particle_system.pipeline import PipelinedSimulation
+        pipeline = PipelinedSimulation(particle_system)
+    render_alpha = timestep.alpha
+
+    while running:
+        if headless:
+            dt = timestep.step_dt
+            current_time = profiler.frame_index * dt
+        else:
+            current_time = pygame.time.get_ticks() / 1000.0
+            dt = current_time - last_time
+            last_time = current_time
+        surfaces_before = default_sprite_cache.misses + texts.renders
+
+        # Fronteira do frame: publica o passo que rodou durante o frame anterior; daqui até o
+        # próximo submit a thread de simulação está parada e a entrada pode ser aplicada
+        if pipeline is not None:
+            # As trilhas são só do buffer da frente, atualizadas pela barreira na thread principal
+            pipeline.front.store.set_trail_length(
+                generator.trail_length if generator.trail_mode == TRAIL_MODE_HISTORY else 0
+            )
+            with profiler.phase("sync"):
+                result = pipeline.barrier()
+            if result is not None:
+                culled, spawned, render_alpha = result
+                profiler.count("culled", culled)
+                profiler.count("spawned", spawned)
+                profiler.count("simulation_ms", pipeline.simulation_time * 1000)
+            particle_system = pipeline.front
+
+        # Processar eventos
+        with profiler.phase("events"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+
+                # F3 mostra/esconde o painel de desempenho
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    profiler_hud.toggle()
+
+                # Toques na tela viram atratores
+                generator.handle_touch(event, screen.get_size())
+
+                # Atualizar sliders
+                particle_limit_slider.handle_event(event)
+                generator_radius_slider.handle_event(event)
+                emission_rate_slider.handle_event(event)
+                speed_slider.handle_event(event)
+                bloom_intensity_slider.handle_event(event)
+            
+                # Atualizar botões
+                rgb_button.handle_event(event)
+                bloom_button.handle_event(event)
+                trails_button.handle_event(event)
+                collisions_button.handle_event(event)
+                splat_button.handle_event(event)
+                persistent_trails_button.handle_event(event)
+                if exit_button.handle_event(event):
+                    running = False
+            
+                # Atualizar gerador
+                generator.radius = generator_radius_slider.value
+                generator.emission_rate = emission_rate_slider.value
+                generator.speed = speed_slider.value
+                generator.rgb_mode = rgb_button.is_active
+                generator.bloom_effect = bloom_button.is_active
+                generator.bloom_intensity = bloom_intensity_slider.value
+                generator.trails_enabled = trails_button.is_active
+                generator.trail_mode = TRAIL_MODE_PERSISTENT if persistent_trails_button.is_active else TRAIL_MODE_HISTORY
+                generator.collisions_enabled = collisions_button.is_active
+                generator.render_backend = RENDER_BACKEND_SPLAT if splat_button.is_active else RENDER_BACKEND_SPRITES
+
+        # Aplicar o nível de qualidade atual por cima dos valores dos controles
+        quality = governor.values()
+        generator.bloom_levels = quality["bloom"]
+        generator.trail_length = quality["trails"]
+        for emitter in emitters:
+            emitter.rate_scale = quality["emission_rate"]
+        particle_cap = int(particle_limit_slider.value * quality["particle_cap"])
+
+        # Limpar tela
+        screen.fill((0, 0, 0))
+        if obstacle_surface is not None:
+            screen.blit(obstacle_surface, (0, 0))
+
+        if replay is not None and len(replay):
+            # Replay: carrega o próximo frame gravado no store, sem rodar a física
+            with profiler.phase("replay"):
+                frame = replay.frame(replay_frame % len(replay))
+                frame.load_into(particle_system.store)
+                generator.apply_controls(frame.controls)
+                generator.current_particles = len(frame)
+                replay_frame += 1
+        elif pipeline is not None:
+            # Próximo passo com a entrada deste frame (ímã e toques lidos aqui, na thread principal)
+            steps, alpha, attractors, cap = timestep.advance(dt), timestep.alpha, generator.attractors(), particle_cap
+            pipeline.submit(lambda system: simulate(system, steps, attractors, cap, alpha))
+        else:
+            # Atualizar sistema de partículas e gerar novas partículas em passos fixos
+            for _ in range(timestep.advance(dt)):
+                with profiler.phase("update"):
+                    profiler.count("culled", update_particle_system(particle_system, timestep.step_dt, generator, emitters))
+                with profiler.phase("spawn"):
+                    profiler.count("spawned", emit_particles(particle_system, timestep.step_dt, emitters, particle_cap))
+            render_alpha = timestep.alpha
+        if replay is None:
+            # Contagem do painel lida do estado mostrado (no pipeline, o buffer da frente publicado na barreira)
+            generator.current_particles = particle_system.emitter_counts.get(generator.index, 0)
+
+        # Gravar o frame (a escrita em disco acontece em outra thread)
+        if recorder is not None:
+            with profiler.phase("record"):
+                recorder.record(
+                    particle_system.store,
+                    generator.controls(),
+                    current_time,
+                    positions=particle_system.store.interpolated_position(render_alpha),
+                )
+
+        # Renderizar sistema de partículas
+        with profiler.phase("render"):
+            profiler.count("blits", render_particle_system(
+                particle_system,
+                screen,
+                generator,
+                interpolation=render_alpha,
+                frame_dt=min(dt, MAX_SUBSTEPS * timestep.step_dt),
+                emitters=emitters,
+            ))
+
+        # Renderizar gerador e controles: a camada só é redesenhada quando algo muda
+        with profiler.phase("ui"):
+            overlay.draw(screen)
+            profiler.count("blits", 1 + profiler_hud.draw(screen, profiler))
+
+        # Atualizar tela
+        with profiler.phase("flip"):
+            pygame.display.flip()
+        startup.mark("simulation_frame")
+        profiler.count("particles", len(particle_system.store))
+        profiler.count("surfaces", default_sprite_cache.misses + texts.renders - surfaces_before)
+        profiler.count("quality", governor.level)
+        profiler.end_frame()
+        clock.tick(frame_rate)
+
+        # O governador mede só o trabalho do frame, sem a espera do clock
+        governor.record(clock.get_rawtime() / 1000.0)
+        if max_frames is not None and profiler.frame_index >= max_frames:
+            running = False
+
+    if pipeline is not None:
+        pipeline.close()
+    if recorder is not None:
+        recorder.close()
+
+    # Exportar o trace de desempenho, se pedido
+    if profile_trace_file:
+        profiler.export(profile_trace_file)
+
+    pygame.quit()
+    return profiler
+
+
+if __name__ == "__main__":
+    main()
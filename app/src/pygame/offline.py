@@ -0,0 +1,241 @@
+import os
+
+# Renderização offline roda sem janela: a simulação usa o driver de vídeo "dummy" do SDL
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+import pygame
+from PIL import Image, ImageChops, ImageDraw, ImageFilter
+
+from src.pygame.helper import ParticleGenerator, create_particle_system, emit_particles, update_particle_system
+
+
+SIMULATION_SIZE = (1280, 720)
+
+# Colunas de um frame no buffer compartilhado: nome -> (forma extra, dtype)
+FRAME_COLUMNS = {
+    "position": ((2,), np.float32),
+    "size": ((), np.float32),
+    "alpha": ((), np.float32),
+    "color": ((3,), np.uint8),
+}
+
+
+def slot_layout(capacity: int) -> tuple[dict[str, tuple[int, tuple[int, ...], type]], int]:
+    # Offsets das colunas dentro de um slot e o tamanho total do slot em bytes
+    layout, offset = {}, 0
+    for name, (shape, dtype) in FRAME_COLUMNS.items():
+        layout[name] = (offset, (capacity, *shape), dtype)
+        offset += capacity * int(np.prod(shape, dtype=int)) * np.dtype(dtype).itemsize
+        offset += -offset % 8
+    return layout, offset
+
+
+def slot_arrays(buffer, slot: int, capacity: int) -> dict[str, np.ndarray]:
+    layout, slot_size = slot_layout(capacity)
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=slot * slot_size + offset)
+        for name, (offset, shape, dtype) in layout.items()
+    }
+
+
+# Estado de cada processo do pool (preenchido pelo initializer)
+_worker: dict = {}
+
+
+def _init_worker(memory_name: str, capacity: int, settings: dict):
+    memory = shared_memory.SharedMemory(name=memory_name)
+    _worker.update(memory=memory, capacity=capacity, settings=settings)
+
+
+def rasterize(arrays: dict[str, np.ndarray], count: int, settings: dict) -> Image.Image:
+    # Desenha as partículas com Pillow numa tela supersampled e reduz para a resolução final.
+    # A área da simulação entra inteira e centralizada, na mesma escala nos dois eixos
+    # (faixas pretas onde a proporção da imagem é diferente de SIMULATION_SIZE)
+    width, height = settings["size"]
+    supersample = settings["supersample"]
+    scale = min(width / SIMULATION_SIZE[0], height / SIMULATION_SIZE[1]) * supersample
+    offset = (np.array([width, height]) * supersample - np.array(SIMULATION_SIZE) * scale) / 2
+    image = Image.new("RGB", (width * supersample, height * supersample))
+    draw = ImageDraw.Draw(image)
+
+    positions = (arrays["position"][:count] * scale + offset).tolist()
+    radii = np.maximum(arrays["size"][:count] * settings["particle_scale"] * scale, 0.5).tolist()
+    alphas = (np.clip(arrays["alpha"][:count], 0, 255) / 255)[:, None]
+    colors = (arrays["color"][:count] * alphas).astype(np.uint8).tolist()
+    for (x, y), radius, color in zip(positions, radii, colors):
+        draw.ellipse((x - radius, y - radius, x + radius, y + radius), fill=tuple(color))
+
+    if settings["bloom"]:
+        # Brilho: soma uma cópia desfocada da imagem
+        glow = image.filter(ImageFilter.GaussianBlur(radius=settings["bloom_radius"] * scale))
+        image = ImageChops.add(image, glow)
+    if supersample > 1:
+        image = image.resize((width, height), Image.LANCZOS)
+    return image
+
+
+def _render_frame(slot: int, count: int, index: int) -> str:
+    settings = _worker["settings"]
+    arrays = slot_arrays(_worker["memory"].buf, slot, _worker["capacity"])
+    image = rasterize(arrays, count, settings)
+    path = os.path.join(settings["output"], f"frame_{index:05d}.png")
+    image.save(path, compress_level=settings["compress_level"])
+    return path
+
+
+class OfflineRenderer:
+    """Simula em passo fixo sem janela e envia cada frame para um pool de processos.
+
+    O processo principal só avança a simulação e copia as colunas de renderização
+    para um slot de um anel de buffers em ``multiprocessing.shared_memory``; os
+    workers rasterizam com Pillow e gravam os PNGs. Um slot só é reutilizado quando
+    o frame anterior que o ocupava terminou.
+    """
+
+    def __init__(
+        self,
+        output: str,
+        size: tuple[int, int] = (1920, 1080),
+        supersample: int = 2,
+        fps: float = 60.0,
+        substeps: int = 1,
+        max_particles: int = 20000,
+        emission_rate: float = 2000.0,
+        speed: float = 185.0,
+        radius: float = 350.0,
+        bloom: bool = False,
+        rgb: bool = True,
+        workers: Optional[int] = None,
+        slots: Optional[int] = None,
+        seed: int = 0,
+        scene_file: Optional[str] = None,
+    ):
+        self.fps = fps
+        self.substeps = substeps
+        self.max_particles = max_particles
+        self.workers = max(int(workers or os.cpu_count() or 1), 1)
+        self.slots = slots or self.workers * 2
+        self.settings = {
+            "output": output,
+            "size": size,
+            "supersample": max(int(supersample), 1),
+            "particle_scale": 1.0,
+            "bloom": bloom,
+            "bloom_radius": 6.0,
+            "compress_level": 1,
+        }
+        os.makedirs(output, exist_ok=True)
+
+        _, slot_size = slot_layout(max_particles)
+        self.memory = shared_memory.SharedMemory(create=True, size=slot_size * self.slots)
+        self.pool = multiprocessing.Pool(
+            self.workers, initializer=_init_worker, initargs=(self.memory.name, max_particles, self.settings)
+        )
+
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+        if scene_file:
+            # Emissores da cena, com as curvas de vida de cada um (ver src/particle_system/scene.py)
+            from src.particle_system.scene import load_scene
+
+            scene = load_scene(scene_file)
+            self.emitters = [ParticleGenerator.from_config(config, index) for index, config in enumerate(scene.emitters)]
+        else:
+            generator = ParticleGenerator(
+                position=(SIMULATION_SIZE[0] // 2, SIMULATION_SIZE[1] // 2), radius=radius, emission_rate=emission_rate
+            )
+            generator.rgb_mode = rgb
+            generator.speed = speed
+            self.emitters = [generator]
+        for emitter in self.emitters:
+            emitter.emitter.rng = np.random.default_rng(seed + emitter.index)
+        self.generator = self.emitters[0]
+        # Cor, alpha e tamanho ao longo da vida: as mesmas tabelas que a janela usa no render
+        self.generator.lifetime_tables.update([emitter.curves for emitter in self.emitters])
+        self.particle_system = create_particle_system([], capacity=max_particles)
+
+    def step(self):
+        dt = 1.0 / (self.fps * self.substeps)
+        for _ in range(self.substeps):
+            update_particle_system(self.particle_system, dt, self.generator, self.emitters)
+            emit_particles(self.particle_system, dt, self.emitters, self.max_particles)
+
+    def render(self, frames: int) -> dict:
+        pending: list = [None] * self.slots
+        start = time.perf_counter()
+        for index in range(frames):
+            self.step()
+            slot = index % self.slots
+            if pending[slot] is not None:
+                pending[slot].get()  # Espera o worker liberar o slot
+            store = self.particle_system.store
+            count = len(store)
+            colors, alphas, sizes = self.generator.lifetime_tables.sample(store)
+            arrays = slot_arrays(self.memory.buf, slot, self.max_particles)
+            arrays["position"][:count] = store.position[:count]
+            arrays["color"][:count] = colors
+            arrays["alpha"][:count] = alphas
+            arrays["size"][:count] = sizes
+            del arrays  # Não manter views do buffer compartilhado
+            pending[slot] = self.pool.apply_async(_render_frame, (slot, count, index))
+        paths = [result.get() for result in pending if result is not None]
+        elapsed = time.perf_counter() - start
+        return {"frames": frames, "seconds": elapsed, "fps": frames / elapsed if elapsed else None, "last": paths[-1:]}
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+        self.memory.close()
+        self.memory.unlink()
+        pygame.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza a simulação offline em uma sequência de PNGs")
+    parser.add_argument("output", help="pasta de saída dos frames")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--supersample", type=int, default=2)
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--substeps", type=int, default=1)
+    parser.add_argument("--max-particles", type=int, default=20000)
+    parser.add_argument("--rate", type=float, default=2000.0, help="partículas emitidas por segundo")
+    parser.add_argument("--speed", type=float, default=185.0)
+    parser.add_argument("--bloom", action="store_true")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scene", help="cena em JSON (emissores e curvas de vida) no lugar do gerador único")
+    args = parser.parse_args(argv)
+
+    renderer = OfflineRenderer(
+        args.output,
+        size=(args.width, args.height),
+        supersample=args.supersample,
+        fps=args.fps,
+        substeps=args.substeps,
+        max_particles=args.max_particles,
+        emission_rate=args.rate,
+        speed=args.speed,
+        bloom=args.bloom,
+        workers=args.workers,
+        seed=args.seed,
+        scene_file=args.scene,
+    )
+    try:
+        result = renderer.render(args.frames)
+    finally:
+        renderer.close()
+    print(f"{result['frames']} frames em {result['seconds']:.1f}s ({result['fps']:.1f} frames/s)")
+
+
+if __name__ == "__main__":
+    main()
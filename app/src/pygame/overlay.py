@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+import pygame
+
+
+DEFAULT_FONT_SIZE = 24
+MAX_TEXT_SURFACES = 512
+
+
+class FontCache:
+    # Uma instância de pygame.font.Font por (arquivo, tamanho), carregada uma única vez
+    def __init__(self):
+        self._fonts: dict[tuple[Optional[str], int], pygame.font.Font] = {}
+
+    def get(self, size: int = DEFAULT_FONT_SIZE, name: Optional[str] = None) -> pygame.font.Font:
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self._fonts[key] = pygame.font.Font(name, size)
+        return font
+
+
+class TextCache:
+    # Surfaces de texto renderizadas, por (texto, tamanho, cor), com descarte LRU
+    def __init__(self, fonts: FontCache, max_entries: int = MAX_TEXT_SURFACES):
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.renders = 0
+
+    def render(
+        self,
+        text: str,
+        size: int = DEFAULT_FONT_SIZE,
+        color: tuple[int, int, int] = (255, 255, 255),
+    ) -> pygame.Surface:
+        key = (text, size, color)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = self._surfaces[key] = self.fonts.get(size).render(text, True, color)
+        self.renders += 1
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+fonts = FontCache()
+texts = TextCache(fonts)
+
+
+class UIOverlay:
+    """Camada persistente com os controles da interface.
+
+    Cada widget expõe ``state()`` e ``draw(surface)``. A camada só é redesenhada
+    quando algum estado muda; nos outros frames ela entra na tela com um único blit.
+    """
+
+    def __init__(self, size: tuple[int, int], widgets: Sequence):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.widgets = list(widgets)
+        self._state = None
+        self.redraws = 0
+
+    def invalidate(self):
+        self._state = None
+
+    def state(self) -> tuple:
+        return tuple(widget.state() for widget in self.widgets)
+
+    def draw(self, screen: pygame.Surface):
+        state = self.state()
+        if state != self._state:
+            self._state = state
+            self.surface.fill((0, 0, 0, 0))
+            for widget in self.widgets:
+                widget.draw(self.surface)
+            self.redraws += 1
+        screen.blit(self.surface, (0, 0))
@@ -0,0 +1,140 @@
+from typing import Optional
+
+import numpy as np
+import pygame
+
+
+DEFAULT_LEVELS = 4
+DEFAULT_THRESHOLD = 96.0  # Canal mais forte (0-255) a partir do qual o pixel brilha
+DEFAULT_KNEE = 64.0  # Transição suave em volta do limiar
+DEFAULT_STRENGTH = 6.0  # A cadeia conserva energia; sem ganho o brilho de partículas pequenas some
+
+# Filtro gaussiano separável de 5 taps (binomial) e filtro "tenda" de 3 taps para a ampliação,
+# da borda do kernel até o centro
+GAUSSIAN_TAPS = (1 / 16, 4 / 16, 6 / 16)
+TENT_TAPS = (1 / 4, 2 / 4)
+
+# Máscara para operar nos quatro bytes de um pixel empacotado (uint32) de uma vez
+LOW_BITS = np.uint32(0x7F7F7F7F)
+
+
+def _filter_axis(planes: np.ndarray, axis: int, taps: tuple[float, ...]) -> np.ndarray:
+    # Convolução simétrica ao longo de `axis`; fora da imagem conta como preto,
+    # o que só escurece a borda do brilho
+    out = planes * np.float32(taps[-1])
+    length = planes.shape[axis]
+    for distance, weight in zip(range(len(taps) - 1, 0, -1), taps):
+        if distance >= length:
+            continue
+        head = [slice(None)] * planes.ndim
+        tail = [slice(None)] * planes.ndim
+        head[axis], tail[axis] = slice(distance, None), slice(None, -distance)
+        scaled = planes * np.float32(weight)
+        out[tuple(head)] += scaled[tuple(tail)]
+        out[tuple(tail)] += scaled[tuple(head)]
+    return out
+
+
+def blur(planes: np.ndarray) -> np.ndarray:
+    # Gaussiano separável sobre planos (canal, x, y)
+    return _filter_axis(_filter_axis(planes, 1, GAUSSIAN_TAPS), 2, GAUSSIAN_TAPS)
+
+
+def downsample(planes: np.ndarray) -> np.ndarray:
+    # Média de blocos 2x2 (as dimensões já são pares)
+    return (planes[:, 0::2, 0::2] + planes[:, 1::2, 0::2] + planes[:, 0::2, 1::2] + planes[:, 1::2, 1::2]) * np.float32(0.25)
+
+
+def upsample(planes: np.ndarray) -> np.ndarray:
+    # Dobra a resolução e suaviza os blocos com o filtro tenda (equivale a uma interpolação bilinear)
+    doubled = np.repeat(np.repeat(planes, 2, axis=1), 2, axis=2)
+    return _filter_axis(_filter_axis(doubled, 1, TENT_TAPS), 2, TENT_TAPS)
+
+
+def packed_average(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Média byte a byte de pixels empacotados (arredonda para baixo)
+    return ((a >> 1) & LOW_BITS) + ((b >> 1) & LOW_BITS)
+
+
+class BloomPass:
+    """Bloom em espaço de tela, aplicado sobre o frame já desenhado.
+
+    Extrai em meia resolução os pixels acima do limiar, monta uma cadeia de buffers
+    a partir de um quarto da resolução (média 2x2 + blur gaussiano separável em cada
+    nível), soma a cadeia de volta do menor para o maior e compõe o resultado sobre a
+    tela com blend aditivo. O processamento é em NumPy sobre ``pygame.surfarray``:
+    o custo depende da resolução, não do número de partículas.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        levels: int = DEFAULT_LEVELS,
+        threshold: float = DEFAULT_THRESHOLD,
+        knee: float = DEFAULT_KNEE,
+        strength: float = DEFAULT_STRENGTH,
+    ):
+        self.size = size
+        self.levels = levels
+        self.threshold = threshold
+        self.knee = knee
+        self.strength = strength
+        # Área processada: múltipla de 2**(levels + 1) para que todos os níveis tenham dimensões pares
+        block = 2 ** (levels + 1)
+        self.width = size[0] - size[0] % block
+        self.height = size[1] - size[1] % block
+        self._glow: Optional[pygame.Surface] = None
+        self._scaled: Optional[pygame.Surface] = None
+
+    def extract(self, pixels: np.ndarray, shifts: tuple[int, ...]) -> np.ndarray:
+        # Meia resolução direto nos pixels empacotados, depois um plano float32 por canal
+        width, height = self.width, self.height
+        half = packed_average(
+            packed_average(pixels[0:width:2, 0:height:2], pixels[1:width:2, 0:height:2]),
+            packed_average(pixels[0:width:2, 1:height:2], pixels[1:width:2, 1:height:2]),
+        )
+        planes = np.empty((3, width // 2, height // 2), dtype=np.float32)
+        for channel, shift in enumerate(shifts[:3]):
+            planes[channel] = (half >> np.uint32(shift)) & np.uint32(0xFF)
+
+        # Mantém só o que passa do limiar, com joelho quadrático para não criar bordas duras
+        brightness = np.maximum(np.maximum(planes[0], planes[1]), planes[2])
+        excess = np.clip(brightness - (self.threshold - self.knee), 0, None)
+        soft = np.where(excess < 2 * self.knee, excess * excess / (4 * self.knee), excess - self.knee)
+        planes *= soft / np.maximum(brightness, 1.0)
+        return planes
+
+    def bloom(self, pixels: np.ndarray, shifts: tuple[int, ...]) -> np.ndarray:
+        # Cadeia de 1/4, 1/8, 1/16... da resolução; cada nível borrado separadamente.
+        # Retorna o brilho a um quarto da resolução
+        chain = [self.extract(pixels, shifts)]
+        for _ in range(self.levels):
+            chain.append(blur(downsample(chain[-1])))
+        result = chain.pop()
+        while len(chain) > 1:
+            result = chain.pop() + upsample(result)
+        return result
+
+    def apply(self, screen: pygame.Surface):
+        # Precisa de uma Surface de 32 bits para ler os pixels empacotados
+        if screen.get_size() != self.size or screen.get_bytesize() != 4 or self.strength <= 0:
+            return
+        shifts = screen.get_shifts()
+        pixels = pygame.surfarray.pixels2d(screen)
+        glow = self.bloom(pixels, shifts)
+        del pixels  # Libera o lock da Surface antes do blit
+
+        glow *= np.float32(self.strength)
+        np.minimum(glow, 255, out=glow)
+        if self._glow is None:
+            self._glow = pygame.Surface(glow.shape[1:], 0, screen)
+            self._scaled = pygame.Surface((self.width, self.height), 0, screen)
+        packed = pygame.surfarray.pixels2d(self._glow)
+        packed[...] = 0
+        for channel, shift in enumerate(self._glow.get_shifts()[:3]):
+            packed |= glow[channel].astype(np.uint32) << np.uint32(shift)
+        del packed
+
+        # Amplia com filtro bilinear e soma à tela (saturando em 255)
+        pygame.transform.smoothscale(self._glow, (self.width, self.height), self._scaled)
+        screen.blit(self._scaled, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
@@ -0,0 +1,133 @@
+import csv
+import json
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Optional
+
+import numpy as np
+import pygame
+
+from src.pygame.overlay import texts
+
+
+DEFAULT_WINDOW = 300  # frames usados nas estatísticas móveis
+PERCENTILES = (50, 90, 99)
+
+
+class FrameProfiler:
+    """Mede o tempo de cada fase do frame e conta eventos (partículas removidas, blits...).
+
+    As estatísticas usam uma janela móvel dos últimos ``window`` frames. Com
+    ``trace=True`` cada frame também é guardado para exportar em JSON ou CSV.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW, trace: bool = False):
+        self.window = window
+        self.trace = trace
+        self.frames: list[dict] = []
+        self.frame_index = 0
+        self._timings: dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window))
+        self._counters: dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window))
+        self._current_timings: dict[str, float] = defaultdict(float)
+        self._current_counters: dict[str, float] = defaultdict(float)
+        self._frame_start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current_timings[name] += time.perf_counter() - start
+
+    def count(self, name: str, value: float = 1):
+        self._current_counters[name] += value
+
+    def end_frame(self):
+        now = time.perf_counter()
+        self._current_timings["frame"] = now - self._frame_start
+        self._frame_start = now
+        for name, value in self._current_timings.items():
+            self._timings[name].append(value)
+        for name, value in self._current_counters.items():
+            self._counters[name].append(value)
+        if self.trace:
+            self.frames.append({
+                "frame": self.frame_index,
+                **{f"{name}_ms": value * 1000 for name, value in self._current_timings.items()},
+                **self._current_counters,
+            })
+        self.frame_index += 1
+        self._current_timings = defaultdict(float)
+        self._current_counters = defaultdict(float)
+
+    def phases(self) -> list[str]:
+        return list(self._timings)
+
+    def counters(self) -> list[str]:
+        return list(self._counters)
+
+    def stats(self, name: str) -> dict[str, float]:
+        # Percentis em milissegundos para fases; média por frame para contadores
+        if name in self._timings:
+            values = np.asarray(self._timings[name]) * 1000
+            summary = {f"p{p}": float(np.percentile(values, p)) for p in PERCENTILES}
+            summary["mean"] = float(values.mean())
+            return summary
+        values = np.asarray(self._counters.get(name, [0.0]))
+        return {"mean": float(values.mean()), "last": float(values[-1])}
+
+    def summary(self) -> dict:
+        return {
+            "frames": self.frame_index,
+            "phases_ms": {name: self.stats(name) for name in self.phases()},
+            "counters": {name: self.stats(name) for name in self.counters()},
+        }
+
+    def export(self, path: str):
+        # JSON com resumo e frames, ou CSV com uma linha por frame, conforme a extensão
+        if path.endswith(".csv"):
+            columns = sorted({key for frame in self.frames for key in frame}, key=lambda key: (key != "frame", key))
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+                writer.writeheader()
+                writer.writerows(self.frames)
+        else:
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(), "frames": self.frames}, f, indent=2)
+
+
+class ProfilerHUD:
+    # Painel no canto superior direito com os tempos por fase e os contadores
+    def __init__(self, position: tuple[int, int], refresh_interval: float = 0.25):
+        self.position = position
+        self.refresh_interval = refresh_interval
+        self.visible = False
+        self._lines: list[str] = []
+        self._last_refresh = 0.0
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    def lines(self, profiler: FrameProfiler) -> list[str]:
+        lines = ["fase      p50    p90    p99 (ms)"]
+        for name in profiler.phases():
+            stats = profiler.stats(name)
+            lines.append(f"{name:<8} {stats['p50']:6.2f} {stats['p90']:6.2f} {stats['p99']:6.2f}")
+        for name in profiler.counters():
+            lines.append(f"{name}: {profiler.stats(name)['mean']:.0f}/frame")
+        return lines
+
+    def draw(self, screen: pygame.Surface, profiler: FrameProfiler, now: Optional[float] = None) -> int:
+        if not self.visible:
+            return 0
+        # Atualiza o texto poucas vezes por segundo para não renderizar fontes a cada frame
+        now = time.perf_counter() if now is None else now
+        if now - self._last_refresh >= self.refresh_interval:
+            self._lines = self.lines(profiler)
+            self._last_refresh = now
+        x, y = self.position
+        for i, line in enumerate(self._lines):
+            screen.blit(texts.render(line, 20, (255, 255, 0)), (x, y + i * 18))
+        return len(self._lines)
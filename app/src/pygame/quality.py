@@ -0,0 +1,187 @@
+from collections import deque
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+
+DEFAULT_TARGET_FPS = 60.0
+DEFAULT_HEADROOM = 0.9  # Fração do frame disponível para trabalho (o resto fica para o flip/vsync)
+DEFAULT_WINDOW = 30  # Frames por avaliação
+DEFAULT_DEGRADE_RATIO = 1.0  # p90 acima de budget * ratio: desce um nível
+DEFAULT_UPGRADE_RATIO = 0.7  # p90 abaixo de budget * ratio por `recover_windows` janelas: sobe um nível
+DEFAULT_RECOVER_WINDOWS = 3
+MAX_RECOVER_WINDOWS = 32
+
+
+class QualityKnob:
+    # Um ajuste de qualidade com seus valores do melhor para o mais barato
+    def __init__(self, name: str, steps: Sequence[Any]):
+        self.name = name
+        self.steps = tuple(steps)
+        self.pinned: Optional[int] = None  # Índice fixo em `steps`; o governador não mexe
+        self.enabled = True  # Desativado: fica sempre no melhor valor
+
+    @property
+    def adjustable(self) -> bool:
+        return self.enabled and self.pinned is None and len(self.steps) > 1
+
+
+def default_knobs() -> list[QualityKnob]:
+    # Em ordem de prioridade: o primeiro é o primeiro a ser reduzido
+    return [
+        QualityKnob("bloom", (4, 3, 2, 1, 0)),  # níveis da cadeia de bloom (0 = sem bloom)
+        QualityKnob("trails", (30, 20, 12, 6, 0)),  # pontos no histórico das trilhas
+        QualityKnob("particle_cap", (1.0, 0.75, 0.5, 0.35, 0.25)),  # fração do limite de partículas
+        QualityKnob("emission_rate", (1.0, 0.75, 0.5, 0.35, 0.25)),  # fração da taxa de emissão
+    ]
+
+
+class QualityGovernor:
+    """Ajusta a qualidade para manter o tempo de frame dentro do orçamento.
+
+    Os ajustes formam uma escada: cada degrau reduz um passo de um ajuste, alternando
+    entre eles na ordem de prioridade. A cada ``window`` frames o p90 do tempo de
+    trabalho é comparado com o orçamento: acima dele desce um degrau; bem abaixo
+    (``upgrade_ratio``) por várias janelas seguidas, sobe um. Se precisar descer logo
+    depois de subir, o número de janelas exigido para subir de novo dobra, o que evita
+    oscilação. Ajustes fixados (``pin``) ou desativados ficam fora da escada.
+    """
+
+    def __init__(
+        self,
+        knobs: Optional[Sequence[QualityKnob]] = None,
+        target_fps: float = DEFAULT_TARGET_FPS,
+        headroom: float = DEFAULT_HEADROOM,
+        window: int = DEFAULT_WINDOW,
+        degrade_ratio: float = DEFAULT_DEGRADE_RATIO,
+        upgrade_ratio: float = DEFAULT_UPGRADE_RATIO,
+        recover_windows: int = DEFAULT_RECOVER_WINDOWS,
+    ):
+        self.knobs = {knob.name: knob for knob in (default_knobs() if knobs is None else knobs)}
+        self.budget = headroom / target_fps
+        self.window = window
+        self.degrade_ratio = degrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.base_recover_windows = recover_windows
+        self.recover_windows = recover_windows
+        self.enabled = True
+        self.level = 0
+        self.changes = 0
+        self._samples: deque = deque(maxlen=window)
+        self._headroom_windows = 0
+        self._just_upgraded = False
+        self._ladder = self._build_ladder()
+
+    def _build_ladder(self) -> list[str]:
+        # Degraus alternando entre os ajustes livres, na ordem de prioridade
+        remaining = {name: len(knob.steps) - 1 for name, knob in self.knobs.items() if knob.adjustable}
+        ladder = []
+        while any(remaining.values()):
+            for name in remaining:
+                if remaining[name]:
+                    ladder.append(name)
+                    remaining[name] -= 1
+        return ladder
+
+    def _rebuild(self):
+        # Mantém quantos degraus de cada ajuste ainda fazem sentido, recomeçando a medição
+        self._ladder = self._build_ladder()
+        self.level = min(self.level, len(self._ladder))
+        self._samples.clear()
+        self._headroom_windows = 0
+
+    @property
+    def max_level(self) -> int:
+        return len(self._ladder)
+
+    def step_of(self, name: str) -> int:
+        knob = self.knobs[name]
+        if knob.pinned is not None:
+            return knob.pinned
+        if not knob.enabled or not self.enabled:
+            return 0
+        return self._ladder[:self.level].count(name)
+
+    def value(self, name: str) -> Any:
+        return self.knobs[name].steps[self.step_of(name)]
+
+    def values(self) -> dict[str, Any]:
+        return {name: self.value(name) for name in self.knobs}
+
+    def pin(self, name: str, step: int):
+        # Fixa um ajuste num passo (0 = melhor qualidade)
+        knob = self.knobs[name]
+        knob.pinned = min(max(int(step), 0), len(knob.steps) - 1)
+        self._rebuild()
+
+    def unpin(self, name: str):
+        self.knobs[name].pinned = None
+        self._rebuild()
+
+    def disable(self, name: str):
+        self.knobs[name].enabled = False
+        self._rebuild()
+
+    def enable(self, name: str):
+        self.knobs[name].enabled = True
+        self._rebuild()
+
+    def reset(self):
+        self.level = 0
+        self.recover_windows = self.base_recover_windows
+        self._just_upgraded = False
+        self._samples.clear()
+        self._headroom_windows = 0
+
+    def record(self, frame_time: float) -> bool:
+        # `frame_time` é o tempo de trabalho do frame em segundos (sem a espera do clock);
+        # retorna True quando o nível mudou
+        if not self.enabled:
+            return False
+        self._samples.append(frame_time)
+        if len(self._samples) < self.window:
+            return False
+        p90 = float(np.percentile(self._samples, 90))
+        self._samples.clear()
+
+        if p90 > self.budget * self.degrade_ratio:
+            self._headroom_windows = 0
+            if self._just_upgraded:
+                # Subiu e já estourou: exige mais tempo com folga antes de tentar de novo
+                self.recover_windows = min(self.recover_windows * 2, MAX_RECOVER_WINDOWS)
+            self._just_upgraded = False
+            if self.level < self.max_level:
+                self.level += 1
+                self.changes += 1
+                return True
+            return False
+
+        self._just_upgraded = False
+        if p90 < self.budget * self.upgrade_ratio and self.level > 0:
+            self._headroom_windows += 1
+            if self._headroom_windows >= self.recover_windows:
+                self._headroom_windows = 0
+                self._just_upgraded = True
+                self.level -= 1
+                self.changes += 1
+                return True
+        else:
+            self._headroom_windows = 0
+        return False
+
+
+def parse_pins(text: str, names: Iterable[str]) -> tuple[dict[str, int], list[str]]:
+    # "bloom=0,trails=2" -> ({"bloom": 0, "trails": 2}, []); `names` são os ajustes que existem.
+    # Itens inválidos (ajuste desconhecido, passo que não é inteiro) ficam de fora e voltam como erros
+    names = list(names)
+    pins, errors = {}, []
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, separator, step = (part.strip() for part in item.partition("="))
+        if name not in names:
+            errors.append(f"ajuste desconhecido {name!r} (opções: {', '.join(names)})")
+            continue
+        try:
+            pins[name] = int(step)
+        except ValueError:
+            errors.append(f"passo inválido em {item!r}: use {name}=<número inteiro>" if separator else f"falta o passo em {item!r}")
+    return pins, errors
@@ -0,0 +1,109 @@
+import numpy as np
+import pygame
+
+
+SIZE_STEP = 0.5
+DEFAULT_EXPOSURE = 2.5
+
+
+def disc_kernel(radius: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Deslocamentos (dx, dy) e pesos de um disco com borda suavizada de ~1 pixel
+    extent = int(np.ceil(radius + 0.5))
+    dx, dy = np.meshgrid(np.arange(-extent, extent + 1), np.arange(-extent, extent + 1), indexing="ij")
+    weight = np.clip(radius + 0.5 - np.sqrt(dx * dx + dy * dy), 0.0, 1.0).astype(np.float32)
+    inside = weight > 0
+    return dx[inside].astype(np.int64), dy[inside].astype(np.int64), weight[inside]
+
+
+class SplatRenderer:
+    """Backend de renderização que acumula todas as partículas num buffer float32.
+
+    As partículas são agrupadas por tamanho quantizado; cada grupo usa um kernel de
+    disco pré-calculado, e as contribuições de cor são somadas por pixel com
+    ``np.bincount``. O buffer passa por um tone-mapping único e é somado à tela via
+    ``pygame.surfarray``. O custo depende dos pixels cobertos, não de chamadas por partícula.
+    """
+
+    def __init__(self, size: tuple[int, int], size_step: float = SIZE_STEP, exposure: float = DEFAULT_EXPOSURE):
+        self.size = size
+        self.size_step = size_step
+        self.exposure = exposure
+        self._kernels: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def kernel(self, bucket: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        kernel = self._kernels.get(bucket)
+        if kernel is None:
+            kernel = self._kernels[bucket] = disc_kernel(max(bucket * self.size_step, self.size_step))
+        return kernel
+
+    def accumulate(
+        self,
+        positions: np.ndarray,
+        sizes: np.ndarray,
+        colors: np.ndarray,
+        alphas: np.ndarray,
+    ) -> tuple[np.ndarray, tuple[int, int]]:
+        # Soma aditiva de todas as partículas. Só o retângulo coberto por elas é acumulado
+        # (com margem do maior kernel, então nenhum kernel sai dele): retorna o buffer
+        # (largura, altura, 3) float32 e sua origem, que pode estar fora da tela.
+        if len(positions) == 0:
+            return np.zeros((0, 0, 3), dtype=np.float32), (0, 0)
+
+        centers = np.rint(positions).astype(np.int32)
+        buckets = np.rint(sizes / self.size_step).astype(np.int32)
+        reach = int(np.ceil(buckets.max() * self.size_step + 0.5))
+        x0, y0 = (centers.min(axis=0) - reach).tolist()
+        x1, y1 = (centers.max(axis=0) + reach + 1).tolist()
+        region_width, region_height = x1 - x0, y1 - y0
+        pixels = region_width * region_height
+        base = (centers[:, 0] - x0) * region_height + (centers[:, 1] - y0)
+
+        intensity = colors.astype(np.float32) * (np.clip(alphas, 0, 255) / np.float32(255))[:, None]
+        order = np.argsort(buckets, kind="stable")
+        values, starts = np.unique(buckets[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+
+        indices, contributions = [], [[], [], []]
+        for bucket, start, end in zip(values.tolist(), starts.tolist(), ends.tolist()):
+            group = order[start:end]
+            dx, dy, weight = self.kernel(bucket)
+            # Índice de cada pixel do kernel de cada partícula e a cor somada nele
+            indices.append((base[group, None] + (dx * region_height + dy).astype(np.int32)).ravel())
+            for channel in range(3):
+                contributions[channel].append((intensity[group, channel, None] * weight).ravel())
+
+        flat = np.concatenate(indices)
+        accum = np.empty((pixels, 3), dtype=np.float32)
+        for channel in range(3):
+            accum[:, channel] = np.bincount(flat, np.concatenate(contributions[channel]), minlength=pixels)
+        return accum.reshape(region_width, region_height, 3), (x0, y0)
+
+    def tone_map(self, accum: np.ndarray) -> np.ndarray:
+        # Curva exponencial: uma partícula isolada fica perto da cor original e sobreposições saturam suavemente
+        return 255.0 * (1.0 - np.exp(-self.exposure * accum / 255.0))
+
+    def render(
+        self,
+        screen: pygame.Surface,
+        positions: np.ndarray,
+        sizes: np.ndarray,
+        colors: np.ndarray,
+        alphas: np.ndarray,
+    ):
+        accum, (x, y) = self.accumulate(positions, sizes, colors, alphas)
+        if accum.size == 0:
+            return
+        # Recorta a parte do buffer que cai dentro da tela
+        width, height = screen.get_size()
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + accum.shape[0], width), min(y + accum.shape[1], height)
+        if left >= right or top >= bottom:
+            return
+        mapped = self.tone_map(accum[left - x:right - x, top - y:bottom - y])
+
+        # Soma ao que já está na tela (fundo e trilhas), saturando em 255
+        pixels = pygame.surfarray.pixels3d(screen)
+        region = pixels[left:right, top:bottom]
+        np.minimum(region + mapped, 255, out=mapped)
+        region[...] = mapped
+        del pixels, region  # Libera o lock da Surface
@@ -0,0 +1,50 @@
+import numpy as np
+import pygame
+
+
+DEFAULT_FADE = 0.9  # Fração do brilho mantida a cada frame (~0.5 s de rastro a 60 FPS)
+DEFAULT_WIDTH = 2
+
+
+class PersistentTrails:
+    """Trilhas desenhadas numa Surface persistente que esmaece a cada frame.
+
+    Em vez de guardar as últimas posições de cada partícula, cada frame multiplica
+    a Surface por ``fade`` e desenha só o trecho percorrido no frame. O custo é um
+    passe de fade mais um segmento por partícula, e a memória é a de uma tela.
+    """
+
+    def __init__(self, size: tuple[int, int], fade: float = DEFAULT_FADE, width: int = DEFAULT_WIDTH):
+        self.size = size
+        self.fade = fade
+        self.width = width
+        self.surface = pygame.Surface(size)
+        # Surfaces constantes do fade: blit com blend é bem mais rápido que fill com blend
+        self._multiply = pygame.Surface(size)
+        self._subtract = pygame.Surface(size)
+        self._subtract.fill((1, 1, 1))
+
+    def clear(self):
+        self.surface.fill((0, 0, 0))
+
+    def fade_out(self):
+        # Multiplica por `fade` e tira 1 de cada canal, senão o arredondamento deixa um resíduo que nunca apaga
+        factor = int(round(255 * self.fade))
+        if self._multiply.get_at((0, 0))[0] != factor:
+            self._multiply.fill((factor, factor, factor))
+        self.surface.blit(self._multiply, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        self.surface.blit(self._subtract, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+
+    def draw(self, starts: np.ndarray, ends: np.ndarray, colors: np.ndarray):
+        # Um segmento por partícula: do ponto onde ela estava no início do frame até o atual
+        surface, width = self.surface, self.width
+        for start, end, color in zip(starts.tolist(), ends.tolist(), colors.tolist()):
+            pygame.draw.line(surface, color, start, end, width)
+
+    def update(self, positions: np.ndarray, velocities: np.ndarray, colors: np.ndarray, frame_dt: float):
+        # O início do trecho é estimado pela velocidade, sem guardar posições anteriores
+        self.fade_out()
+        self.draw(positions - velocities * np.float32(frame_dt), positions, colors)
+
+    def composite(self, screen: pygame.Surface):
+        screen.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
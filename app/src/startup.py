@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+from typing import Optional
+
+
+def process_age(pid: Optional[int] = None) -> Optional[float]:
+    # Segundos desde a criação do processo, lidos do /proc (Linux); None em outros sistemas
+    try:
+        with open(f"/proc/{pid or os.getpid()}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"), 0.0)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def launcher_pid() -> Optional[int]:
+    # No executável --onefile do PyInstaller o bootloader (processo pai) extrai o pacote
+    # antes de iniciar o Python; a inicialização conta a partir dele
+    bundle = getattr(sys, "_MEIPASS", None)
+    if getattr(sys, "frozen", False) and bundle and os.path.basename(bundle).startswith("_MEI"):
+        return os.getppid()
+    return None
+
+
+class StartupTimer:
+    """Marca os eventos da inicialização (imports, janela, primeiro frame...).
+
+    Os tempos são relativos à criação do timer; ``before_python`` é quanto o
+    processo (ou o bootloader do executável) já tinha rodado nesse momento,
+    quando o sistema permite medir.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.before_python = process_age(launcher_pid())
+        self.marks: dict[str, float] = {}
+
+    def mark(self, name: str):
+        # Só a primeira ocorrência conta (ex.: primeiro frame)
+        self.marks.setdefault(name, time.perf_counter() - self.start)
+
+    def report(self) -> dict[str, float]:
+        offset = self.before_python or 0.0
+        report = {f"{name}_ms": (offset + seconds) * 1000 for name, seconds in self.marks.items()}
+        if self.before_python is not None:
+            report["before_python_ms"] = self.before_python * 1000
+        return report
+
+    def format(self) -> str:
+        return "inicialização: " + ", ".join(f"{name} {value:.0f} ms" for name, value in self.report().items())
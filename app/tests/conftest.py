@@ -0,0 +1,21 @@
+import pytest
+
+from src.particle_system.store import ParticleStore
+
+
+@pytest.fixture
+def make_store():
+    """Fábrica de stores: a partícula i nasce em (i, 0), indo para a direita, com cor cinza i (módulo 256) e vida 1 + i.
+
+    Colunas passadas por nome (``age=[...]``, ``color=(200, 100, 50)``) sobrepõem esses valores.
+    """
+
+    def make(count: int, trail_length: int = 4, **columns) -> ParticleStore:
+        store = ParticleStore(capacity=2, trail_length=trail_length)
+        for i in range(count):
+            store.append((float(i), 0.0), (1.0, 0.0), (0.0, 0.0), 0.0, 2.0, (i % 256,) * 3, lifespan=1.0 + i)
+        for name, values in columns.items():
+            getattr(store, name)[:count] = values
+        return store
+
+    return make
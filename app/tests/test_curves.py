@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src.particle_system.curves import LifetimeTables, bake_curve
+from src.particle_system.scene import LifetimeCurves
+
+
+@pytest.fixture
+def make_aged(make_store):
+    # Partículas de vida 2 s nas idades e emissores dados, todas com a mesma cor, alpha e tamanho
+    def make(ages, emitters):
+        return make_store(len(ages), age=ages, emitter=emitters, lifespan=2.0, size=4.0, alpha=255.0, color=(200, 100, 50))
+
+    return make
+
+
+def test_bake_curve_interpolates_and_clamps():
+    table = bake_curve([(0.75, 0.0), (0.25, 1.0)], 5, 1.0)
+    np.testing.assert_allclose(table[:, 0], [1.0, 1.0, 0.5, 0.0, 0.0])
+
+
+def test_bake_curve_without_points_uses_default():
+    table = bake_curve(None, 4, (255, 255, 255))
+    assert table.shape == (4, 3)
+    np.testing.assert_array_equal(table, 255)
+
+
+def test_sample_follows_age_of_each_particle(make_aged):
+    tables = LifetimeTables(resolution=5)
+    tables.update([LifetimeCurves(alpha=[(0, 1), (1, 0)], size=[(0, 2), (1, 1)])])
+    store = make_aged([0.0, 1.0, 2.0, 3.0], [0, 0, 0, 0])
+    colors, alphas, sizes = tables.sample(store)
+    # Idades normalizadas 0, 0.5, 1 e 1 (passada do fim: fica no último ponto)
+    np.testing.assert_allclose(alphas, [255.0, 127.5, 0.0, 0.0])
+    np.testing.assert_allclose(sizes, [8.0, 6.0, 4.0, 4.0])
+    np.testing.assert_array_equal(colors, store.color[:4])
+
+
+def test_color_curve_multiplies_particle_color(make_aged):
+    tables = LifetimeTables(resolution=3)
+    tables.update([LifetimeCurves(color=[(0, (255, 255, 255)), (1, (0, 255, 0))])])
+    store = make_aged([0.0, 2.0], [0, 0])
+    colors, _, _ = tables.sample(store)
+    np.testing.assert_array_equal(colors, [[200, 100, 50], [0, 100, 0]])
+
+
+def test_each_emitter_reads_its_own_table(make_aged):
+    tables = LifetimeTables(resolution=3)
+    tables.update([None, LifetimeCurves(alpha=[(0, 0.5)])])
+    store = make_aged([1.0, 1.0], [0, 1])
+    _, alphas, sizes = tables.sample(store)
+    np.testing.assert_allclose(alphas, [255.0, 127.5])
+    np.testing.assert_allclose(sizes, [4.0, 4.0])
+
+
+def test_update_only_rebakes_on_change():
+    tables = LifetimeTables()
+    curves = [LifetimeCurves(size=[(0, 1), (1, 0)])]
+    assert tables.update(curves)
+    assert not tables.update([LifetimeCurves(size=[(0, 1), (1, 0)])])
+    assert tables.update([None])
+    assert not tables.active
+
+
+def test_inactive_tables_return_columns_unchanged(make_aged):
+    tables = LifetimeTables()
+    tables.update([None])
+    store = make_aged([0.5], [0])
+    colors, alphas, sizes = tables.sample(store)
+    assert colors.base is store.color and alphas.base is store.alpha and sizes.base is store.size
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from src.particle_system.integrators import (
+    INTEGRATORS,
+    Integrator,
+    RungeKutta4,
+    SemiImplicitEuler,
+    VelocityVerlet,
+    create_integrator,
+    substep_level,
+)
+
+
+def spring(position, velocity, index=None):
+    # Oscilador harmônico com ω = 1
+    return -position
+
+
+def oscillator_error(integrator: Integrator, steps: int) -> float:
+    # Erro da posição depois de uma unidade de tempo, partindo de x = 1 em repouso
+    position = np.array([[1.0, 0.0]])
+    velocity = np.zeros((1, 2))
+    dt = 1.0 / steps
+    for _ in range(steps):
+        integrator.integrate(position, velocity, spring(position, velocity), dt, spring)
+    return abs(position[0, 0] - np.cos(1.0))
+
+
+@pytest.mark.parametrize("cls, order", [(SemiImplicitEuler, 1), (VelocityVerlet, 2), (RungeKutta4, 4)])
+def test_convergence_order(cls, order):
+    integrator = cls(max_substeps=1)
+    coarse, fine = oscillator_error(integrator, 4), oscillator_error(integrator, 8)
+    assert coarse / fine == pytest.approx(2 ** order, rel=0.25)
+
+
+@pytest.mark.parametrize("cls", [VelocityVerlet, RungeKutta4])
+def test_constant_acceleration_is_exact_for_higher_orders(cls):
+    position = np.zeros((1, 2))
+    velocity = np.array([[3.0, 0.0]])
+    gravity = np.array([[0.0, 10.0]])
+    constant = lambda p, v, index=None: gravity if index is None else gravity[index]
+    cls(max_substeps=1).integrate(position, velocity, gravity.copy(), 0.5, constant)
+    np.testing.assert_allclose(position, [[1.5, 1.25]])
+    np.testing.assert_allclose(velocity, [[3.0, 5.0]])
+
+
+def test_levels_only_for_strong_accelerations():
+    integrator = SemiImplicitEuler(max_substeps=8, tolerance=0.05)
+    dt = 0.1
+    limit = 2 * 0.05 / (dt * dt)  # 10
+    assert integrator.levels(np.array([[limit, 0.0]]), dt) is None
+    acceleration = np.array([[0.0, 0.0], [limit * 1.5, 0.0], [limit * 4, 0.0], [limit * 16, 0.0], [limit * 1e6, 0.0]])
+    levels = integrator.levels(acceleration, dt)
+    # ½|a|(dt/2^k)² <= tolerância, limitado a log2(8) = 3
+    np.testing.assert_array_equal(levels, [0, 1, 1, 2, 3])
+    expected = [substep_level(ax, ay, dt, 8, 0.05) for ax, ay in acceleration.tolist()]
+    np.testing.assert_array_equal(levels, expected)
+
+
+def test_max_substeps_rounds_down_to_power_of_two():
+    assert SemiImplicitEuler(max_substeps=6).max_substeps == 4
+    assert SemiImplicitEuler(max_substeps=1).levels(np.array([[1e9, 0.0]]), 0.1) is None
+    assert substep_level(1e9, 0.0, 0.1, max_substeps=1) == 0
+
+
+def test_integrate_substeps_only_stiff_particles():
+    integrator = SemiImplicitEuler(max_substeps=4, tolerance=0.05)
+    dt = 0.1
+    acceleration = np.array([[0.0, 1.0], [0.0, 1e4]])
+    constant = lambda p, v, index=None: acceleration if index is None else acceleration[index]
+    position = np.zeros((2, 2))
+    velocity = np.zeros((2, 2))
+    substeps = integrator.integrate(position, velocity, acceleration.copy(), dt, constant)
+    assert substeps == 1 + 4
+
+    # A partícula calma dá um passo só; a outra, 4 subpassos de dt/4
+    single = np.zeros((1, 2)), np.zeros((1, 2))
+    integrator.advance(*single, acceleration[:1], dt, 1, lambda p, v: acceleration[:1])
+    split = np.zeros((1, 2)), np.zeros((1, 2))
+    integrator.advance(*split, acceleration[1:], dt, 4, lambda p, v: acceleration[1:])
+    np.testing.assert_allclose(position, np.concatenate([single[0], split[0]]), rtol=1e-6)
+    np.testing.assert_allclose(velocity, np.concatenate([single[1], split[1]]), rtol=1e-6)
+
+
+def test_create_integrator():
+    assert set(INTEGRATORS) == {"euler", "verlet", "rk4"}
+    integrator = create_integrator("rk4", max_substeps=2)
+    assert isinstance(integrator, RungeKutta4)
+    assert integrator.max_substeps == 2
+    with pytest.raises(ValueError):
+        create_integrator("leapfrog")
+
+
+def test_integrator_is_abstract():
+    with pytest.raises(TypeError):
+        Integrator()
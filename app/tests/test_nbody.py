@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.particle_system.forces import ForceEngine
+from src.particle_system.nbody import BarnesHut, direct_accelerations
+from src.particle_system.nbody_benchmark import clustered_positions
+from src.particle_system.parallel import ShardedStepper
+from src.particle_system.store import ParticleStore
+
+
+def relative_errors(approximate: np.ndarray, exact: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(approximate - exact, axis=1) / np.linalg.norm(exact, axis=1)
+
+
+def test_barnes_hut_matches_direct_sum():
+    positions = clustered_positions(3000, seed=1)
+    errors = relative_errors(BarnesHut().accelerations(positions), direct_accelerations(positions))
+    assert np.median(errors) < 0.01
+    assert np.percentile(errors, 99) < 0.05
+
+
+def test_smaller_theta_is_more_accurate():
+    positions = clustered_positions(2000, seed=2)
+    exact = direct_accelerations(positions)
+    coarse = np.percentile(relative_errors(BarnesHut(theta=0.8).accelerations(positions), exact), 99)
+    fine = np.percentile(relative_errors(BarnesHut(theta=0.2).accelerations(positions), exact), 99)
+    assert fine < coarse / 4
+
+
+def test_masses_and_strength():
+    rng = np.random.default_rng(3)
+    positions = rng.uniform(0, 500, (1500, 2))
+    masses = rng.uniform(0.5, 2.0, 1500)
+    nbody = BarnesHut(strength=-20.0, softening=3.0)
+    exact = direct_accelerations(positions, masses, strength=-20.0, softening=3.0)
+    errors = relative_errors(nbody.accelerations(positions, masses), exact)
+    assert np.percentile(errors, 99) < 0.05
+
+
+def test_few_particles_are_exact():
+    positions = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 5.0]], dtype=np.float32)
+    np.testing.assert_allclose(BarnesHut().accelerations(positions), direct_accelerations(positions), rtol=1e-5)
+    assert BarnesHut().accelerations(positions[:1]).shape == (1, 2)
+
+
+def test_direct_sum_pair():
+    positions = np.array([[0.0, 0.0], [3.0, 4.0]])
+    acceleration = direct_accelerations(positions, strength=2.0, softening=1.0)
+    # G m r / (r² + ε²)^1.5 na direção da outra partícula
+    expected = 2.0 * np.array([3.0, 4.0]) / 26.0 ** 1.5
+    np.testing.assert_allclose(acceleration, [expected, -expected])
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sharded_step_with_nbody_matches_store_step(workers):
+    points = np.random.default_rng(4).uniform(0, 300, (600, 2)).tolist()
+    stores = []
+    for _ in range(2):
+        store = ParticleStore(capacity=600, trail_length=2)
+        for point in points:
+            store.append(point, (0.0, 0.0), (0.0, 0.0), 0.0, 2.0, (255, 255, 255), lifespan=10.0)
+        stores.append(store)
+    forces = ForceEngine(nbody=BarnesHut())
+    stepper = ShardedStepper(workers, min_shard_size=100)
+    try:
+        for _ in range(3):
+            stores[0].step(1 / 60, forces)
+            stepper.step(stores[1], 1 / 60, forces)
+    finally:
+        stepper.close()
+    np.testing.assert_array_equal(stores[0].position[:600], stores[1].position[:600])
+    np.testing.assert_array_equal(stores[0].velocity[:600], stores[1].velocity[:600])
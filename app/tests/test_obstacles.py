@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from src.particle_system.obstacles import ObstacleField, distance_to, rasterize
+from src.particle_system.scene import CircleObstacle, MaskObstacle, PolygonObstacle
+
+
+def test_distance_to_matches_brute_force():
+    rng = np.random.default_rng(0)
+    mask = rng.random((23, 31)) < 0.05
+    rows, columns = np.nonzero(mask)
+    y, x = np.mgrid[:23, :31]
+    brute = np.sqrt(np.min((y[..., None] - rows) ** 2 + (x[..., None] - columns) ** 2, axis=2))
+    np.testing.assert_allclose(distance_to(mask), brute)
+
+
+def test_rasterize_circle_and_polygon():
+    circle = rasterize([CircleObstacle(center=(20, 20), radius=8)], (40, 40), cell=1.0)
+    assert circle[20, 20] and not circle[20, 29] and not circle[0, 0]
+    assert circle.sum() == pytest.approx(np.pi * 64, rel=0.05)
+    square = rasterize([PolygonObstacle(points=[(10, 10), (30, 10), (30, 20), (10, 20)])], (40, 40), cell=1.0)
+    assert square.sum() == 200
+    assert square[15, 20] and not square[25, 20]
+
+
+def test_sdf_approximates_circle_distance():
+    field = ObstacleField.bake([CircleObstacle(center=(100, 100), radius=30)], (200, 200), cell=2.0)
+    angle = np.linspace(0, 2 * np.pi, 16, endpoint=False)
+    for radius in (10.0, 45.0, 70.0):
+        points = (100 + radius * np.stack([np.cos(angle), np.sin(angle)], axis=1)).astype(np.float32)
+        distance, gradient = field.sample(points)
+        # Precisão de cerca de meia célula; o gradiente aponta para fora do círculo
+        np.testing.assert_allclose(distance, radius - 30, atol=1.5)
+        outward = (points - 100) / radius
+        assert np.all(np.einsum("ij,ij->i", gradient, outward) > 0.9)
+
+
+def test_bake_without_obstacles():
+    assert ObstacleField.bake([], (100, 100)) is None
+
+
+def test_resolve_pushes_out_and_bounces():
+    solid = np.zeros((50, 50), dtype=bool)
+    solid[25:] = True  # Chão a partir de y = 50 (células de 2 px)
+    field = ObstacleField(solid, cell=2.0, restitution=0.5, friction=0.1)
+    positions = np.array([[40.0, 49.0], [40.0, 20.0], [-10.0, 60.0]], dtype=np.float32)
+    velocities = np.array([[10.0, 20.0], [0.0, 20.0], [0.0, 20.0]], dtype=np.float32)
+    sizes = np.array([3.0, 3.0, 3.0], dtype=np.float32)
+    assert field.resolve(positions, velocities, sizes) == 1
+    # A primeira sai até encostar pela borda (raio 3 acima do chão) e rebate
+    np.testing.assert_allclose(positions[0], [40.0, 47.0], atol=1e-4)
+    np.testing.assert_allclose(velocities[0], [9.0, -10.0], atol=1e-4)
+    # Longe do chão ou fora da grade: nada muda
+    np.testing.assert_array_equal(positions[1:], [[40.0, 20.0], [-10.0, 60.0]])
+    np.testing.assert_array_equal(velocities[1:], [[0.0, 20.0], [0.0, 20.0]])
+
+
+def test_resolve_leaves_separating_velocity():
+    solid = np.zeros((20, 20), dtype=bool)
+    solid[10:] = True
+    field = ObstacleField(solid, cell=1.0)
+    positions = np.array([[10.0, 9.5]], dtype=np.float32)
+    velocities = np.array([[0.0, -5.0]], dtype=np.float32)
+    assert field.resolve(positions, velocities, np.array([1.0], dtype=np.float32)) == 1
+    np.testing.assert_allclose(positions[0], [10.0, 9.0], atol=1e-4)
+    np.testing.assert_array_equal(velocities[0], [0.0, -5.0])
+
+
+def test_mask_obstacle(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    pixels = np.zeros((10, 20), dtype=np.uint8)
+    pixels[:, 10:] = 255
+    Image.fromarray(pixels).save(tmp_path / "mask.png")
+    obstacle = MaskObstacle(path="mask.png", position=(0, 0), size=(40, 20))
+    solid = rasterize([obstacle], (40, 20), cell=1.0, base_dir=str(tmp_path))
+    assert not solid[:, :20].any() and solid[:, 20:].all()
+    inverted = rasterize([obstacle.model_copy(update={"invert": True})], (40, 20), cell=1.0, base_dir=str(tmp_path))
+    np.testing.assert_array_equal(inverted, ~solid)
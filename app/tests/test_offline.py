@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("PIL.Image")
+
+from src.pygame.offline import FRAME_COLUMNS, SIMULATION_SIZE, rasterize
+
+
+def frame(points) -> dict[str, np.ndarray]:
+    # Partículas brancas e opacas de tamanho 20 nas posições dadas
+    count = len(points)
+    arrays = {name: np.zeros((count, *shape), dtype=dtype) for name, (shape, dtype) in FRAME_COLUMNS.items()}
+    arrays["position"][:] = points
+    arrays["size"][:] = 20.0
+    arrays["alpha"][:] = 255.0
+    arrays["color"][:] = 255
+    return arrays
+
+
+@pytest.mark.parametrize("size", [(640, 360), (360, 360), (640, 640)])
+def test_rasterize_letterboxes_simulation_area(size):
+    width, height = size
+    settings = {"size": size, "supersample": 1, "particle_scale": 1.0, "bloom": False, "bloom_radius": 6.0}
+    center = (SIMULATION_SIZE[0] / 2, SIMULATION_SIZE[1] / 2)
+    image = np.asarray(rasterize(frame([center, (0.0, 0.0)]), 2, settings))
+    assert image[height // 2, width // 2].all()
+    # O canto da simulação cai no canto da área útil, com a mesma escala nos dois eixos
+    scale = min(width / SIMULATION_SIZE[0], height / SIMULATION_SIZE[1])
+    left, top = (width - SIMULATION_SIZE[0] * scale) / 2, (height - SIMULATION_SIZE[1] * scale) / 2
+    assert image[int(top) + 2, int(left) + 2].all()
+    ys, xs = np.nonzero(image[..., 0] > 0)
+    center_spot = (abs(xs - width // 2) < 30) & (abs(ys - height // 2) < 30)
+    # Partícula redonda: a mesma largura e altura
+    assert np.ptp(xs[center_spot]) == np.ptp(ys[center_spot])
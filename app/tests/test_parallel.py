@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from src.particle_system.forces import Attractor, ForceEngine
+from src.particle_system.parallel import ShardedStepper
+
+
+def test_shards_are_contiguous_and_respect_minimum_size():
+    stepper = ShardedStepper(4, min_shard_size=100)
+    try:
+        assert stepper.shards(250) == [slice(0, 125), slice(125, 250)]
+        assert stepper.shards(50) == [slice(0, 50)]
+        assert len(stepper.shards(10_000)) == 4
+    finally:
+        stepper.close()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sharded_step_matches_store_step(make_store, workers):
+    rng = np.random.default_rng(0)
+    columns = {
+        "position": rng.uniform(0, 300, (900, 2)),
+        "velocity": rng.normal(0, 50, (900, 2)),
+        "acceleration": (0.0, 98.1),
+        "lifespan": rng.uniform(0.05, 1.0, 900),
+    }
+    expected, actual = make_store(900, **columns), make_store(900, **columns)
+    forces = ForceEngine(drag=0.5)
+    attractors = [Attractor(position=(150.0, 150.0), strength=800.0, falloff=1.0)]
+    stepper = ShardedStepper(workers, min_shard_size=100)
+    try:
+        for _ in range(20):
+            removed = expected.step(1 / 60, forces, attractors, center=(150.0, 150.0), radius=200.0)
+            assert stepper.step(actual, 1 / 60, forces, attractors, center=(150.0, 150.0), radius=200.0) == removed
+    finally:
+        stepper.close()
+    assert 0 < len(actual) < 900
+    n = len(expected)
+    for name in ("position", "velocity", "age", "trail"):
+        np.testing.assert_array_equal(getattr(actual, name)[:n], getattr(expected, name)[:n])
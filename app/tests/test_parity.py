@@ -0,0 +1,30 @@
+import pytest
+
+from src.particle_system.backends import SimulationBackend, VectorizedBackend, create_backend
+from src.particle_system.parity import run_parity
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("integrator", ["euler", "verlet", "rk4"])
+def test_vectorized_matches_reference(workers, integrator):
+    report = run_parity("vectorized", seed=workers, steps=90, integrator=integrator, workers=workers)
+    assert report["ok"], report["failure"]
+    assert report["max_particles"] > 0
+
+
+def test_sharded_backend_really_splits_the_parity_scene():
+    backend = create_backend("vectorized", workers=4, min_shard_size=64)
+    try:
+        assert isinstance(backend, VectorizedBackend)
+        assert len(backend.stepper.shards(500)) == 4
+    finally:
+        backend.close()
+
+
+def test_create_backend():
+    assert create_backend("vectorized").stepper is None
+    assert create_backend("reference").name == "reference"
+    with pytest.raises(ValueError):
+        create_backend("gpu")
+    with pytest.raises(TypeError):
+        SimulationBackend()
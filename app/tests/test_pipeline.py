@@ -0,0 +1,53 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.particle_system.pipeline import PipelinedSimulation
+from src.particle_system.schemas import ParticleSystem
+
+
+def moving_columns(count: int) -> dict:
+    rng = np.random.default_rng(0)
+    return {"velocity": rng.normal(0, 50, (count, 2)), "lifespan": rng.uniform(0.05, 0.5, count)}
+
+
+def test_pipelined_steps_match_sequential(make_store):
+    columns = moving_columns(200)
+    sequential = make_store(200, **columns)
+    pipeline = PipelinedSimulation(ParticleSystem(store=make_store(200, **columns)))
+    try:
+        for _ in range(12):
+            pipeline.barrier()
+            pipeline.submit(lambda system: system.store.step(1 / 30))
+            sequential.step(1 / 30)
+        pipeline.barrier()
+    finally:
+        pipeline.close()
+    front = pipeline.front.store
+    assert 0 < len(front) == len(sequential) < 200
+    # As trilhas só existem no buffer da frente, e saem iguais às do passo sequencial
+    assert pipeline.back.store.trail_length == 0
+    assert front.trail_size[:len(front)].max() == front.trail_length
+    n = len(front)
+    for name in ("position", "velocity", "age", "trail", "trail_size"):
+        np.testing.assert_array_equal(getattr(front, name)[:n], getattr(sequential, name)[:n])
+
+
+def test_front_only_changes_at_barrier(make_store):
+    pipeline = PipelinedSimulation(ParticleSystem(store=make_store(10)))
+    before = pipeline.front.store.position[:10].copy()
+    release = threading.Event()
+    try:
+        pipeline.submit(lambda system: release.wait() and system.store.step(0.5))
+        assert pipeline.busy
+        with pytest.raises(RuntimeError):
+            pipeline.submit(lambda system: None)
+        np.testing.assert_array_equal(pipeline.front.store.position[:10], before)
+        release.set()
+        # Vidas de 1 s em diante: ninguém expira em meio segundo
+        assert pipeline.barrier() == 0
+    finally:
+        release.set()
+        pipeline.close()
+    np.testing.assert_allclose(pipeline.front.store.position[:10, 0], before[:, 0] + 0.5)
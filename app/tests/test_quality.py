@@ -0,0 +1,102 @@
+from src.pygame.quality import MAX_RECOVER_WINDOWS, QualityGovernor, QualityKnob, parse_pins
+
+
+SLOW = 1.0  # Segundos por frame: sempre acima do orçamento
+FAST = 0.0
+
+
+def make_governor(**options) -> QualityGovernor:
+    knobs = [QualityKnob("bloom", (4, 2, 0)), QualityKnob("trails", (30, 10))]
+    return QualityGovernor(knobs, window=4, recover_windows=2, **options)
+
+
+def feed(governor: QualityGovernor, frame_time: float, windows: int = 1) -> int:
+    # Quantas mudanças de nível aconteceram em `windows` janelas
+    return sum(governor.record(frame_time) for _ in range(governor.window * windows))
+
+
+def test_ladder_alternates_knobs_by_priority():
+    governor = make_governor()
+    assert governor.max_level == 3
+    assert feed(governor, SLOW) == 1
+    assert governor.values() == {"bloom": 2, "trails": 30}
+    feed(governor, SLOW)
+    assert governor.values() == {"bloom": 2, "trails": 10}
+    feed(governor, SLOW)
+    assert governor.values() == {"bloom": 0, "trails": 10}
+    # Já no fundo da escada: não há o que reduzir
+    assert feed(governor, SLOW) == 0
+    assert governor.level == 3
+
+
+def test_only_evaluates_full_windows():
+    governor = make_governor()
+    for _ in range(governor.window - 1):
+        assert not governor.record(SLOW)
+    assert governor.record(SLOW)
+
+
+def test_recovers_after_enough_headroom():
+    governor = make_governor()
+    feed(governor, SLOW, 2)
+    assert feed(governor, FAST) == 0
+    assert feed(governor, FAST) == 1
+    assert governor.level == 1
+
+
+def test_middle_band_does_not_recover():
+    governor = make_governor()
+    feed(governor, SLOW)
+    # Entre upgrade_ratio e o orçamento: nem desce nem sobe
+    assert feed(governor, governor.budget * 0.85, 10) == 0
+    assert governor.level == 1
+
+
+def test_overshoot_after_upgrade_doubles_recovery():
+    governor = make_governor()
+    feed(governor, SLOW, 2)
+    feed(governor, FAST, 2)
+    assert governor.level == 1
+    feed(governor, SLOW)
+    assert governor.recover_windows == 4
+    assert feed(governor, FAST, 3) == 0
+    assert feed(governor, FAST) == 1
+    for _ in range(10):
+        feed(governor, FAST, governor.recover_windows)
+        feed(governor, SLOW)
+    assert governor.recover_windows == MAX_RECOVER_WINDOWS
+
+
+def test_pinned_knob_leaves_the_ladder():
+    governor = make_governor()
+    governor.pin("bloom", 1)
+    assert governor.max_level == 1
+    feed(governor, SLOW, 3)
+    assert governor.values() == {"bloom": 2, "trails": 10}
+    governor.pin("trails", 99)
+    assert governor.value("trails") == 10
+    governor.unpin("bloom")
+    assert governor.max_level == 2
+
+
+def test_disabled_governor_keeps_best_quality():
+    governor = make_governor()
+    governor.enabled = False
+    assert feed(governor, SLOW, 3) == 0
+    assert governor.values() == {"bloom": 4, "trails": 30}
+
+
+def test_disabled_knob_stays_at_best():
+    governor = make_governor()
+    governor.disable("trails")
+    feed(governor, SLOW, 3)
+    assert governor.values() == {"bloom": 0, "trails": 30}
+
+
+def test_parse_pins():
+    names = ("bloom", "trails")
+    assert parse_pins("bloom=0, trails=2", names) == ({"bloom": 0, "trails": 2}, [])
+    assert parse_pins("", names) == ({}, [])
+    pins, errors = parse_pins("bloom=x,fog=1,trails", names)
+    assert pins == {}
+    assert len(errors) == 3
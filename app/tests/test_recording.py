@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from src.particle_system.forces import Attractor
+from src.particle_system.recording import FRAME_ARRAYS, Recorder, Replay
+
+
+@pytest.fixture
+def make_random(make_store):
+    # Store com valores sorteados em todas as colunas gravadas
+    def make(count: int, seed: int):
+        rng = np.random.default_rng(seed)
+        return make_store(
+            count,
+            position=rng.uniform(0, 800, (count, 2)),
+            size=rng.uniform(1, 4, count),
+            alpha=rng.uniform(0, 255, count),
+            color=rng.integers(0, 256, (count, 3)),
+            age=rng.uniform(0, 2, count),
+            lifespan=rng.uniform(2, 4, count),
+            emitter=rng.integers(0, 3, count),
+        )
+
+    return make
+
+
+def record(path, stores, chunk_frames: int = 2) -> None:
+    recorder = Recorder(str(path), chunk_frames=chunk_frames)
+    for index, store in enumerate(stores):
+        assert recorder.record(store, {"frame": index, "magnet": index % 2 == 0}, index / 60)
+    recorder.close()
+    assert recorder.frames == len(stores)
+
+
+def test_round_trip(tmp_path, make_random):
+    stores = [make_random(count, seed) for seed, count in enumerate((5, 0, 17, 1, 9))]
+    path = tmp_path / "cena.psrec"
+    record(path, stores)
+    replay = Replay(str(path))
+    assert len(replay) == len(stores)
+    for index, store in enumerate(stores):
+        frame = replay.frame(index)
+        assert len(frame) == store.count
+        assert frame.time == pytest.approx(index / 60)
+        assert frame.controls == {"frame": index, "magnet": index % 2 == 0}
+        for name, _, _ in FRAME_ARRAYS:
+            array = getattr(frame, name)
+            assert array.flags.aligned
+            np.testing.assert_array_equal(array, getattr(store, name)[:store.count])
+    replay.close()
+
+
+def test_load_into_restores_store(tmp_path, make_random):
+    source = make_random(12, 7)
+    path = tmp_path / "cena.psrec"
+    record(path, [source])
+    replay = Replay(str(path))
+    target = make_random(30, 8)
+    replay.frame(0).load_into(target)
+    assert len(target) == 12
+    for name in ("position", "previous_position", "size", "alpha", "color", "age", "lifespan", "emitter"):
+        expected = source.position if name == "previous_position" else getattr(source, name)
+        np.testing.assert_array_equal(getattr(target, name)[:12], expected[:12])
+    replay.close()
+
+
+def test_recorded_positions_override(tmp_path, make_random):
+    store = make_random(4, 1)
+    interpolated = store.position[:4] + 0.5
+    path = tmp_path / "cena.psrec"
+    recorder = Recorder(str(path))
+    recorder.record(store, {}, 0.0, positions=interpolated)
+    recorder.close()
+    replay = Replay(str(path))
+    np.testing.assert_array_equal(replay.frame(0).position, interpolated)
+    replay.close()
+
+
+def test_truncated_chunk_is_ignored(tmp_path, make_random):
+    stores = [make_random(10, seed) for seed in range(4)]
+    path = tmp_path / "cena.psrec"
+    record(path, stores, chunk_frames=2)
+    data = path.read_bytes()
+    path.write_bytes(data[:-10])
+    replay = Replay(str(path))
+    assert len(replay) == 2
+    replay.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "outro.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        Replay(str(path))
+
+
+def test_close_reraises_writer_error(tmp_path, make_random):
+    recorder = Recorder(str(tmp_path / "cena.psrec"))
+    recorder.record(make_random(3, 0), {"bad": object()}, 0.0)  # Controles que não viram JSON
+    with pytest.raises(TypeError):
+        recorder.close()
+
+
+def test_attractor_controls_are_strict_json(tmp_path, make_random):
+    path = tmp_path / "cena.psrec"
+    recorder = Recorder(str(path))
+    recorder.record(make_random(2, 0), {"attractors": [Attractor(position=(1.0, 2.0)).model_dump()]}, 0.0)
+    recorder.close()
+    assert b"Infinity" not in path.read_bytes()
+    replay = Replay(str(path))
+    assert replay.frame(0).controls["attractors"][0]["radius"] is None
+    replay.close()
@@ -0,0 +1,77 @@
+import numpy as np
+
+from src.particle_system.spatial import SpatialHashGrid, resolve_collisions
+
+
+def brute_pairs(positions: np.ndarray, distance: float) -> set[tuple[int, int]]:
+    offset = positions[:, None] - positions[None, :]
+    close = np.einsum("ijk,ijk->ij", offset, offset) <= distance * distance
+    return {(i, j) for i, j in zip(*np.nonzero(np.triu(close, 1)))}
+
+
+def test_candidate_pairs_cover_every_close_pair_once():
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-50, 50, (300, 2)).astype(np.float32)
+    grid = SpatialHashGrid(cell_size=5.0).build(positions)
+    i, j = grid.candidate_pairs()
+    pairs = [tuple(sorted(pair)) for pair in zip(i.tolist(), j.tolist())]
+    assert len(pairs) == len(set(pairs))
+    assert brute_pairs(positions, 5.0) <= set(pairs)
+
+
+def test_query_matches_brute_force():
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(0, 100, (500, 2)).astype(np.float32)
+    grid = SpatialHashGrid(cell_size=8.0).build(positions)
+    found = grid.query((40.0, 60.0), 12.0)
+    offset = positions - np.array([40.0, 60.0], dtype=np.float32)
+    expected = np.flatnonzero(np.einsum("ij,ij->i", offset, offset) <= 144.0)
+    np.testing.assert_array_equal(np.sort(found), expected)
+
+
+def test_empty_grid():
+    grid = SpatialHashGrid(cell_size=1.0).build(np.empty((0, 2), dtype=np.float32))
+    assert len(grid.candidate_pairs()[0]) == 0
+    assert len(grid.query((0.0, 0.0), 5.0)) == 0
+
+
+def test_resolve_separates_and_bounces_head_on_pair():
+    positions = np.array([[0.0, 0.0], [3.0, 0.0]])
+    velocities = np.array([[1.0, 0.0], [-1.0, 0.0]])
+    radii = np.array([2.0, 2.0])
+    assert resolve_collisions(positions, velocities, radii, restitution=1.0) == 1
+    # Cada uma anda metade da sobreposição (1) e as velocidades se trocam
+    np.testing.assert_allclose(positions, [[-0.5, 0.0], [3.5, 0.0]])
+    np.testing.assert_allclose(velocities, [[-1.0, 0.0], [1.0, 0.0]])
+
+
+def test_resolve_keeps_momentum():
+    rng = np.random.default_rng(2)
+    positions = rng.uniform(0, 20, (200, 2))
+    velocities = rng.normal(0, 5, (200, 2))
+    radii = np.full(200, 1.0)
+    momentum = velocities.sum(axis=0)
+    assert resolve_collisions(positions, velocities, radii, restitution=0.5) > 0
+    np.testing.assert_allclose(velocities.sum(axis=0), momentum, atol=1e-9)
+
+
+def test_resolve_does_not_kick_separating_pair():
+    positions = np.array([[0.0, 0.0], [1.0, 0.0]])
+    velocities = np.array([[-1.0, 0.0], [1.0, 0.0]])
+    resolve_collisions(positions, velocities, np.array([1.0, 1.0]))
+    np.testing.assert_allclose(velocities, [[-1.0, 0.0], [1.0, 0.0]])
+    assert positions[1, 0] - positions[0, 0] == 2.0
+
+
+def test_resolve_splits_coincident_particles():
+    positions = np.zeros((2, 2))
+    velocities = np.zeros((2, 2))
+    resolve_collisions(positions, velocities, np.array([1.0, 1.0]))
+    np.testing.assert_allclose(positions, [[-1.0, 0.0], [1.0, 0.0]])
+
+
+def test_no_overlap_no_collisions():
+    positions = np.array([[0.0, 0.0], [10.0, 0.0]])
+    velocities = np.array([[1.0, 0.0], [-1.0, 0.0]])
+    assert resolve_collisions(positions, velocities, np.array([1.0, 1.0])) == 0
+    np.testing.assert_allclose(positions, [[0.0, 0.0], [10.0, 0.0]])
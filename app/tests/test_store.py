@@ -0,0 +1,130 @@
+import numpy as np
+
+from src.particle_system.store import ParticleStore
+
+
+def test_append_grows_capacity_and_keeps_rows(make_store):
+    store = make_store(5)
+    assert store.capacity == 8
+    assert len(store) == 5
+    np.testing.assert_array_equal(store.position[:5, 0], np.arange(5))
+
+
+def test_expire_ages_and_marks_expired(make_store):
+    store = make_store(3)
+    keep = store.expire(1.5)
+    np.testing.assert_allclose(store.age[:3], 1.5)
+    # Tempos de vida 1, 2 e 3: só a primeira passou do fim
+    np.testing.assert_array_equal(keep, [False, True, True])
+
+
+def test_expire_culls_outside_radius(make_store):
+    store = make_store(3)
+    np.testing.assert_array_equal(store.expire(0.0, (0.0, 0.0), 1.5), [True, True, False])
+
+
+def test_expire_culls_by_radius_of_each_emitter(make_store):
+    store = make_store(4, emitter=[0, 0, 1, 1])
+    center = np.array([[0.0, 0.0], [3.0, 0.0]])
+    radius = np.array([0.5, 0.5])
+    keep = store.expire(0.0, center, radius)
+    np.testing.assert_array_equal(keep, [True, False, False, True])
+
+
+def test_expire_only_touches_rows(make_store):
+    store = make_store(4)
+    store.expire(0.25, rows=slice(1, 3))
+    np.testing.assert_allclose(store.age[:4], [0.0, 0.25, 0.25, 0.0])
+
+
+def test_compact_keeps_order_of_survivors(make_store):
+    store = make_store(5)
+    removed = store.compact(np.array([True, False, True, False, True]))
+    assert removed == 2
+    assert len(store) == 3
+    np.testing.assert_array_equal(store.position[:3, 0], [0, 2, 4])
+    np.testing.assert_array_equal(store.color[:3, 0], [0, 2, 4])
+    np.testing.assert_allclose(store.lifespan[:3], [1, 3, 5])
+
+
+def test_compact_without_removals_is_noop(make_store):
+    store = make_store(3)
+    assert store.compact(np.ones(3, dtype=bool)) == 0
+    assert len(store) == 3
+
+
+def test_step_removes_expired_and_integrates_survivors(make_store):
+    store = make_store(3)
+    removed = store.step(1.5)
+    assert removed == 1
+    np.testing.assert_allclose(store.age[:2], 1.5)
+    np.testing.assert_allclose(store.position[:2, 0], [1 + 1.5, 2 + 1.5])
+
+
+def test_step_culls_outside_radius(make_store):
+    store = make_store(4)
+    assert store.step(0.0, center=(0.0, 0.0), radius=2.0) == 1
+    np.testing.assert_array_equal(store.color[:3, 0], [0, 1, 2])
+
+
+def test_trail_ring_wraps_in_chronological_order(make_store):
+    store = make_store(1, trail_length=3)
+    for x in range(5):
+        store.position[0] = (float(x), 0.0)
+        store.append_trail()
+    # Só as 3 últimas posições ficam, da mais antiga para a mais nova
+    assert store.trail_points(0) == [(2.0, 0.0), (3.0, 0.0), (4.0, 0.0)]
+    assert len(store.trail_segments(0)) == 2
+    assert int(store.trail_size[0]) == 3
+
+
+def test_trail_before_filling_ring(make_store):
+    store = make_store(1, trail_length=4)
+    for x in range(2):
+        store.position[0] = (float(x), 1.0)
+        store.append_trail()
+    assert store.trail_points(0) == [(0.0, 1.0), (1.0, 1.0)]
+
+
+def test_compact_carries_trails_with_particles(make_store):
+    store = make_store(3, trail_length=2)
+    store.append_trail()
+    store.compact(np.array([False, True, True]))
+    assert store.trail_points(0) == [(1.0, 0.0)]
+    assert store.trail_points(1) == [(2.0, 0.0)]
+
+
+def test_set_trail_length_zero_disables_history(make_store):
+    store = make_store(2)
+    store.set_trail_length(0)
+    store.append_trail()
+    assert store.trail.shape == (store.capacity, 0, 2)
+    assert store.trail_points(0) == []
+
+
+def test_copy_from_matches_source(make_store):
+    source = make_store(5, trail_length=3)
+    source.append_trail()
+    target = ParticleStore(capacity=1, trail_length=7)
+    target.copy_from(source)
+    assert len(target) == 5
+    assert target.trail_length == 3
+    for name in source.columns:
+        np.testing.assert_array_equal(getattr(target, name)[:5], getattr(source, name)[:5])
+
+
+def test_sync_from_keeps_trails_of_survivors(make_store):
+    store = make_store(4, trail_length=3)
+    store.append_trail()
+    simulation = ParticleStore(capacity=1, trail_length=0)
+    simulation.copy_from(store, trails=False)
+    simulation.step(1.5)  # Expira a partícula 0 (vida 1) e move as outras
+    simulation.append((9.0, 9.0), (0.0, 0.0), (0.0, 0.0), 0.0, 2.0, (1, 2, 3))
+    store.sync_from(simulation)
+    assert len(store) == 4
+    np.testing.assert_array_equal(store.serial[:4], [1, 2, 3, 4])
+    np.testing.assert_array_equal(store.position[:4], simulation.position[:4])
+    # As sobreviventes levam a trilha e ganham a posição do início do passo; a nova começa vazia
+    assert store.trail_points(0) == [(1.0, 0.0), (1.0, 0.0)]
+    assert store.trail_points(2) == [(3.0, 0.0), (3.0, 0.0)]
+    assert store.trail_points(3) == []